@@ -0,0 +1,98 @@
+"""
+Finding k entries that sum to a target. The values are sorted once; the outer entries are picked by recursion, cut
+short by the smallest and the biggest sums still reachable, and the innermost pair is found with two pointers moving
+towards each other, so a k-sum costs O(n^(k-1)) instead of the O(n^k) of trying every combination. A single pair is
+looked up in a hash set instead, which doesn't need the values sorted at all.
+"""
+
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Iterable
+
+
+def find_k_sum(values: Iterable[int], k: int, target: int) -> tuple[int, ...] | None:
+    """
+    :param values: entries to pick from, each one can be used once
+    :param k: how many entries to pick
+    :param target: what they must sum to
+    :return: the first k entries summing to the target that were found, smallest first, or None if there are none
+    """
+    if k == 2:
+        seen = set()
+        for value in values:
+            if target - value in seen:
+                return min(value, target - value), max(value, target - value)
+            seen.add(value)
+        return None
+
+    solutions = _solve(sorted(values), k, target, first_only=True)
+    return solutions[0] if solutions else None
+
+
+def all_k_sums(values: Iterable[int], k: int, target: int) -> list[tuple[int, ...]]:
+    """
+    Every distinct combination of k entries summing to the target, see `find_k_sum`. A value appears in a
+    combination as many times as it's among the entries at most.
+    """
+    return _solve(sorted(values), k, target, first_only=False)
+
+
+def _solve(values: list[int], k: int, target: int, first_only: bool) -> list[tuple[int, ...]]:
+    if k < 1 or k > len(values):
+        return []
+    if k == 1:
+        index = bisect_left(values, target)
+        return [(target,)] if index < len(values) and values[index] == target else []
+
+    # prefix[i] is the sum of the i smallest values, for the bounds of the sums still reachable
+    prefix = [0, *accumulate(values)]
+    solutions: list[tuple[int, ...]] = []
+    _pick(values, prefix, k, target, 0, [], solutions, first_only)
+    return solutions
+
+
+def _pick(
+    values: list[int],
+    prefix: list[int],
+    k: int,
+    target: int,
+    start: int,
+    picked: list[int],
+    solutions: list[tuple[int, ...]],
+    first_only: bool,
+) -> bool:
+    """Adds the solutions picking k more values from `values[start:]` to the `picked` ones; True to stop looking."""
+    n = len(values)
+    if k == 2:
+        low, high = start, n - 1
+        while low < high:
+            total = values[low] + values[high]
+            if total < target:
+                low += 1
+            elif total > target:
+                high -= 1
+            else:
+                solutions.append((*picked, values[low], values[high]))
+                if first_only:
+                    return True
+                # the same pair of values found again would be the same solution
+                low += 1
+                while low < high and values[low] == values[low - 1]:
+                    low += 1
+                high -= 1
+        return False
+
+    for i in range(start, n - k + 1):
+        if i > start and values[i] == values[i - 1]:
+            continue
+        # the smallest sum that includes values[i] is already too big, and it only grows from here
+        if prefix[i + k] - prefix[i] > target:
+            break
+        # even with the biggest values left the sum falls short
+        if values[i] + prefix[n] - prefix[n - k + 1] < target:
+            continue
+        picked.append(values[i])
+        if _pick(values, prefix, k - 1, target - values[i], i + 1, picked, solutions, first_only):
+            return True
+        picked.pop()
+    return False
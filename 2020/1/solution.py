@@ -1,4 +1,14 @@
-from itertools import combinations
+from k_sum import find_k_sum
+
+TARGET = 2020
+
+
+def in_report_order(values: list[int], entries: tuple[int, ...] | None) -> tuple[int, ...] | None:
+    """The entries in the order they are listed in the expense report."""
+    if entries is None:
+        return None
+    position = {value: i for i, value in reversed(list(enumerate(values)))}
+    return tuple(sorted(entries, key=position.__getitem__))
 
 
 def part_one(values: list[int]) -> tuple[int, int]:
@@ -23,12 +33,7 @@ def part_one(values: list[int]) -> tuple[int, int]:
     Of course, your expense report is much larger. Find the two entries that sum to 2020; what do you get if you
     multiply them together?
     """
-    value_set = set(sorted(values))
-
-    for value in value_set:
-        rest = 2020 - value
-        if rest in value_set:
-            return value, rest
+    return in_report_order(values, find_k_sum(values, 2, TARGET))
 
 
 def part_two(values: list[int]) -> tuple[int, int, int]:
@@ -42,14 +47,16 @@ def part_two(values: list[int]) -> tuple[int, int, int]:
 
     In your expense report, what is the product of the three entries that sum to 2020?
     """
-    for _v1, _v2, _v3 in combinations(values, 3):
-        if _v1 + _v2 + _v3 == 2020:
-            return _v1, _v2, _v3
+    return in_report_order(values, find_k_sum(values, 3, TARGET))
+
+
+def load_input(filename: str, test: bool = False) -> list[int]:
+    with open(filename) as f:
+        return [int(x.strip()) for x in f.readlines()]
 
 
 if __name__ == "__main__":
-    with open("./input.txt") as f:
-        values_list = [int(x.strip()) for x in f.readlines()]
+    values_list = load_input("./input.txt")
 
     v1, v2 = part_one(values_list)
     print(f"PART ONE: {v1} * {v2} = {v1 * v2}")
@@ -1,35 +1,79 @@
+import os
 import re
-from typing import Callable, Collection
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.day import stream_chunks  # noqa: E402
+
+# the validation is a single pass over the lines, so they are streamed from the file, a chunk of lines at a time
+load_input = stream_chunks
+
+# the lines may be surrounded by whitespace, a line ending of "\r\n" included
+POLICY = re.compile(r"^[ \t]*(\d+)-(\d+) ([a-z]): ([a-z]+)[ \t\r]*$", re.MULTILINE)
+# a line that isn't blank, each of them has to be a policy
+LINE = re.compile(r"^[ \t\r]*\S", re.MULTILINE)
+
+Criterion = Callable[[str, str, str, str], bool]
 
-def validate(strings: Collection[str], criterion: Callable[[str], bool]) -> int:
-    """
-    Given the criterion, returns the number of valid strings in the given collection.
 
-    :param strings: any iterable collection of strings
-    :param criterion: a callable taking a string and returning the boolean value
-    :return: a number of valid string
+def count_valid(chunk: str, criterion: Criterion) -> int:
     """
-    return len([x for x in strings if criterion(x)])
+    The number of lines of the chunk whose password meets the criterion, parsed with a single regex pass. Raises
+    a ValueError if any of the lines isn't a policy with a password, rather than leaving it out of the count.
+    """
+    valid = matched = 0
+    for match in POLICY.finditer(chunk):
+        matched += 1
+        valid += criterion(*match.groups())
+    if matched != (lines := len(LINE.findall(chunk))):
+        raise ValueError(f"{lines - matched} of the {lines} lines aren't a policy followed by a password")
+    return valid
 
 
-def meets_criteria_one(pass_string: str) -> bool:
-    low, high, ch, password = re.match(
-        r"^(\d+)-(\d+) ([a-z]): ([a-z]+)$", pass_string
-    ).groups()
+def validate(chunks: Iterable[str], criterion: Criterion, workers: int | None = None) -> int:
+    """
+    Given the criterion, returns the number of valid passwords in the given chunks of lines, consuming them once.
+    A database of more than one chunk is counted in a pool of worker processes, with only a few chunks in flight at
+    a time, so the memory stays bounded however big it is.
+
+    :param chunks: any iterable of strings of whole lines, e.g. a stream of the input's chunks
+    :param criterion: a callable taking a policy's two numbers, its letter and the password and returning whether
+        the password is valid; it's pickled to the workers, so it has to be a module-level function
+    :param workers: size of the process pool, defaults to the number of CPUs
+    :return: a number of valid passwords
+    """
+    chunks = iter(chunks)
+    first, second = next(chunks, ""), next(chunks, None)
+    if second is None:
+        # not worth starting the pool for
+        return count_valid(first, criterion)
+
+    workers = workers or os.cpu_count()
+    valid = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque(executor.submit(count_valid, chunk, criterion) for chunk in (first, second))
+        for chunk in chunks:
+            if len(in_flight) >= 2 * workers:
+                valid += in_flight.popleft().result()
+            in_flight.append(executor.submit(count_valid, chunk, criterion))
+        valid += sum(future.result() for future in in_flight)
+    return valid
+
+
+def meets_criteria_one(low: str, high: str, ch: str, password: str) -> bool:
     return int(low) <= password.count(ch) <= int(high)
 
 
-def meets_criteria_two(pass_string: str) -> bool:
-    index1, index2, ch, password = re.match(
-        r"^(\d+)-(\d+) ([a-z]): ([a-z]+)$", pass_string
-    ).groups()
-    ch1, ch2 = password[int(index1) - 1], password[int(index2) - 1]
-    ch_set = set(ch1 + ch2)
-    return ch in ch_set and len(ch_set) > 1
+def meets_criteria_two(index1: str, index2: str, ch: str, password: str) -> bool:
+    # exactly one of the positions holds the letter
+    return (password[int(index1) - 1] == ch) != (password[int(index2) - 1] == ch)
 
 
-def part_one(input_list: list[str]) -> int:
+def part_one(input_list: Iterable[str]) -> int:
     """
     Your flight departs in a few days from the coastal airport; the easiest way down to the coast from here is via
     toboggan.
@@ -62,7 +106,7 @@ def part_one(input_list: list[str]) -> int:
     return validate(input_list, meets_criteria_one)
 
 
-def part_two(input_values: list[str]) -> int:
+def part_two(input_values: Iterable[str]) -> int:
     """
     While it appears you validated the passwords correctly, they don't seem to be what the Official Toboggan Corporate
     Authentication System is expecting.
@@ -87,11 +131,8 @@ def part_two(input_values: list[str]) -> int:
 
 
 if __name__ == "__main__":
-    with open("./input.txt") as f:
-        values = [x.strip() for x in f.readlines()]
-
-    valid = part_one(values)
+    valid = part_one(load_input("./input.txt"))
     print(f"PART ONE: There are {valid} valid passwords in the database.")
 
-    valid = part_two(values)
+    valid = part_two(load_input("./input.txt"))
     print(f"PART TWO: There are {valid} valid passwords in the database.")
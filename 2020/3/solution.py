@@ -1,25 +1,43 @@
-from functools import reduce
+from dataclasses import dataclass
+from itertools import cycle
+from math import gcd, prod
+from typing import Sequence
 
 TREE = "#"
+TO_BITS = bytes.maketrans(TREE.encode() + b".", b"\x01\x00")
 
 
-def count_trees(area_map: list[str], slope: tuple[int, int]) -> int:
-    x, y = 0, 0
-    x_inc, y_inc = slope
-    count = 0
-    max_width = len(area_map[0])
-    max_height = len(area_map)
-    while y < max_height:
-        spot = area_map[y][x]
-        if spot == TREE:
-            count += 1
-        y += y_inc
-        x = (x + x_inc) % max_width
+@dataclass
+class Forest:
+    width: int
+    # each row with a 1 for every tree and a 0 for every open square
+    rows: list[bytes]
 
-    return count
 
+def prepare(area_map: list[str]) -> Forest:
+    """Each row is converted once, so that counting the trees sums up bytes instead of comparing characters."""
+    return Forest(len(area_map[0]), [row.encode().translate(TO_BITS) for row in area_map])
 
-def part_one(trees: list[str]) -> int:
+
+def count_trees(forest: Forest, slopes: Sequence[tuple[int, int]]) -> list[int]:
+    """
+    Counts the trees on each of the slopes. The columns a slope passes through repeat after `width / gcd(width,
+    right)` rows, so the whole walk down a slope is a single `sum(map(...))` over its rows and the cycled columns,
+    with no Python code run per row.
+
+    :param forest: the map, converted by `prepare`
+    :param slopes: (right, down) steps of the slopes
+    :return: the number of trees encountered on each of the slopes, in their order
+    """
+    width = forest.width
+    counts = []
+    for right, down in slopes:
+        columns = [step * right % width for step in range(width // gcd(width, right))]
+        counts.append(sum(map(bytes.__getitem__, forest.rows[::down], cycle(columns))))
+    return counts
+
+
+def part_one(trees: Forest) -> int:
     """
     With the toboggan login problems resolved, you set off toward the airport. While travel by toboggan might be easy,
     it's certainly not safe: there's very minimal steering and the area is covered in trees. You'll need to see which
@@ -85,10 +103,10 @@ def part_one(trees: list[str]) -> int:
     encounter?
     """
     slope = (3, 1)
-    return count_trees(trees, slope)
+    return count_trees(trees, [slope])[0]
 
 
-def part_two(trees: list[str]) -> int:
+def part_two(trees: Forest) -> int:
     """
     Time to check the rest of the slopes - you need to minimize the probability of a sudden arboreal stop, after all.
 
@@ -108,17 +126,17 @@ def part_two(trees: list[str]) -> int:
     """
     slopes = ((1, 1), (3, 1), (5, 1), (7, 1), (1, 2))
 
-    return reduce(
-        lambda x, y: x * y, (count_trees(trees, slope) for slope in slopes), 1
-    )
+    return prod(count_trees(trees, slopes))
 
 
 if __name__ == "__main__":
     with open("input.txt") as f:
         tree_map = [x.strip() for x in f.readlines()]
 
-    tree_count = part_one(tree_map)
+    forest = prepare(tree_map)
+
+    tree_count = part_one(forest)
     print(f"PART ONE: You encountered {tree_count} trees.")
 
-    product = part_two(tree_map)
+    product = part_two(forest)
     print(f"PART TWO: Product for specified slopes is equal to {product}.")
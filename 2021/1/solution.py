@@ -93,9 +93,13 @@ def part_two(depths: list[int]) -> int:
     )
 
 
+def load_input(filename: str, test: bool = False) -> list[int]:
+    with open(filename) as f:
+        return [int(x.strip()) for x in f.readlines()]
+
+
 if __name__ == "__main__":
-    with open("./input.txt") as f:
-        parsed_depths = [int(x.strip()) for x in f.readlines()]
+    parsed_depths = load_input("./input.txt")
 
     increases = part_one(parsed_depths)
     print(f"PART ONE: The ocean floor increased {increases} number of times.")
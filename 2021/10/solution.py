@@ -1,3 +1,7 @@
+import sys
+from pathlib import Path
+from typing import Iterable
+
 from utils import (
     ERROR_SCORES,
     validate_braces,
@@ -6,8 +10,14 @@ from utils import (
     complete_braces,
 )
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.day import stream_lines  # noqa: E402
+
+# every line is checked on its own, so they are streamed from the file
+load_input = stream_lines
 
-def part_one(braces: list[str]) -> int:
+
+def part_one(braces: Iterable[str]) -> int:
     """You ask the submarine to determine the best route out of the deep-sea cave, but it only replies:
 
     Syntax error in navigation subsystem online: all of them
@@ -79,7 +89,7 @@ def part_one(braces: list[str]) -> int:
     return sum(ERROR_SCORES[x] for x in map(validate_braces, braces))
 
 
-def part_two(braces: list[str]) -> int:
+def part_two(braces: Iterable[str]) -> int:
     """Now, discard the corrupted lines. The remaining lines are incomplete.
 
     Incomplete lines don't have any incorrect characters - instead, they're missing some closing characters at the end
@@ -130,7 +140,8 @@ def part_two(braces: list[str]) -> int:
     Find the completion string for each incomplete line, score the completion strings, and sort the scores. What is the
     middle score?
     """
-    incomplete_braces = [b for b in braces if validate_braces(b) == 0]
+    # only the scores are kept, not the lines
+    incomplete_braces = (b for b in braces if validate_braces(b) == 0)
     return get_middle_element(
         [
             get_completion_score(braces)
@@ -140,14 +151,11 @@ def part_two(braces: list[str]) -> int:
 
 
 if __name__ == "__main__":
-    with open("./input.txt") as f:
-        braces_data = [x.strip() for x in f.readlines()]
-
-    error_score = part_one(braces_data)
+    error_score = part_one(load_input("./input.txt"))
     print(
         f"PART ONE: The sum of the syntax error scores for corrupted lines is equal to: {error_score}"
     )
-    middle_score = part_two(braces_data)
+    middle_score = part_two(load_input("./input.txt"))
     print(
         f"PART ONE: The winner of incomplete lines' contest has a score equal to: {middle_score}"
     )
@@ -1,95 +1,42 @@
-from dataclasses import dataclass
-from typing import Iterator
+from aoc.grid import FROM_DIGITS, TO_DIGITS, Grid
 
-
-@dataclass
-class Point:
-    x: int
-    y: int
-    energy: int
-    flashed: bool = False
-
-    @property
-    def coor(self) -> tuple[int, int]:
-        return self.x, self.y
-
-    def reset(self):
-        self.flashed = False
-        self.energy = 0
-
-    def increment(self):
-        self.energy += 1
-
-    def __hash__(self):
-        return hash(self.coor)
+FLASH = 10
+# the border is above any energy level, so it never gets charged by its flashing neighbours
+BORDER = 0xFF
+# every octopus gains a unit of energy at the start of a step...
+CHARGE = bytes.maketrans(bytes(range(FLASH)), bytes(range(1, FLASH + 1)))
+# ...and the ones that flashed during it end up with none
+DRAIN = bytes.maketrans(bytes([FLASH]), bytes([0]))
 
 
 class OctopiSimulator:
     def __init__(self, light_data: list[str]):
-        self.light_map = self.create_light_map(light_data)
-        self.width = len(self.light_map)
-        self.height = len(self.light_map[0])
-
-    @staticmethod
-    def create_light_map(light_data: list[str]) -> tuple[tuple[Point, ...], ...]:
-        return tuple(
-            tuple(map(lambda v: Point(x, v[0], int(v[1])), enumerate(col)))
-            for x, col in enumerate(zip(*light_data))
-        )
+        self.light_map = Grid.from_lines(light_data, border=BORDER, table=FROM_DIGITS)
+        self.width = self.light_map.width
+        self.height = self.light_map.height
 
-    @property
-    def iter_area(self) -> Iterator[Point]:
-        return iter(point for row in self.light_map for point in row)
+    def __len__(self) -> int:
+        return len(self.light_map)
 
-    def get(self, x: int, y: int) -> Point | None:
-        if not self.valid_coordinates(x, y):
-            return
-        return self.light_map[x][y]
-
-    def get_neighbours(self, x: int, y: int) -> tuple[Point, ...]:
-        return tuple(
-            filter(
-                lambda p: p and not p.flashed,
-                (
-                    self.get(x - 1, y - 1),
-                    self.get(x, y - 1),
-                    self.get(x + 1, y - 1),
-                    self.get(x - 1, y),
-                    self.get(x + 1, y),
-                    self.get(x - 1, y + 1),
-                    self.get(x, y + 1),
-                    self.get(x + 1, y + 1),
-                ),
-            )
-        )
-
-    def valid_coordinates(self, x: int, y: int) -> bool:
-        return 0 <= x < self.width and 0 <= y < self.height
+    def __str__(self):
+        return self.light_map.render(TO_DIGITS)
 
     def process_step(self) -> int:
-        flash_reset_buffer = set()
-        flashes = set()
-        for point in self.iter_area:
-            point.increment()
-            if point.energy > 9:
-                point.flashed = True
-                flashes.add(point)
-
-        total_flashes = 0
-        while len(flashes):
-            flash_reset_buffer |= flashes
-            total_flashes += len(flashes)
-            additional_flashes = set()
-            for point in flashes:
-                neighbours = self.get_neighbours(*point.coor)
-                for neighbour in neighbours:
-                    neighbour.increment()
-                    if neighbour.energy > 9:
-                        neighbour.flashed = True
-                        additional_flashes.add(neighbour)
-            flashes = additional_flashes
-
-        for point in flash_reset_buffer:
-            point.reset()
-
+        self.light_map.translate(CHARGE)
+        cells, offsets = self.light_map.cells, self.light_map.adjacent
+
+        # An octopus stops gaining energy once it reaches the flash level, so it's pushed onto the stack exactly once.
+        flashes = self.light_map.find_all(FLASH)
+        total_flashes = len(flashes)
+        while flashes:
+            position = flashes.pop()
+            for neighbour in (position + offset for offset in offsets):
+                energy = cells[neighbour]
+                if energy < FLASH:
+                    cells[neighbour] = energy = energy + 1
+                    if energy == FLASH:
+                        flashes.append(neighbour)
+                        total_flashes += 1
+
+        self.light_map.translate(DRAIN)
         return total_flashes
@@ -1,6 +1,9 @@
+import sys
 from itertools import count
+from pathlib import Path
 
-from simulator import OctopiSimulator
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from simulator import OctopiSimulator  # noqa: E402
 
 
 def part_one(light_data: list[str]) -> int:
@@ -364,7 +367,7 @@ def part_two(light_data: list[str]) -> int:
     navigate through the cavern. What is the first step during which all octopuses flash?
     """
     simulator = OctopiSimulator(light_data)
-    total_octopi = len(list(simulator.iter_area))
+    total_octopi = len(simulator)
     for i in count(start=1):
         if simulator.process_step() == total_octopi:
             return i
@@ -1,5 +1,7 @@
 from dataclasses import dataclass, field
 
+from aoc.counters import counters
+
 
 @dataclass
 class Cave:
@@ -42,6 +44,7 @@ class Route:
         return self.length > 0 and self.caves[-1].is_end
 
     def copy(self):
+        counters.count("route.copy")
         return Route(caves=self.caves.copy())
 
     def add_cave(self, cave: Cave):
@@ -1,4 +1,8 @@
-from cave_system import CaveSystem
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from cave_system import CaveSystem  # noqa: E402
 
 
 def part_one(cave_passages: list[str]) -> int:
@@ -1,5 +1,11 @@
+import sys
+from pathlib import Path
+
 from paper import Paper
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments  # noqa: E402
+
 
 def part_one(dot_data: list[str], fold_instruction: str) -> int:
     """You reach another volcanically active part of the cave. It would be nice if you could do some kind of thermal
@@ -141,12 +147,19 @@ def part_two(dot_data: list[str], fold_instructions: list[str]) -> str:
     return str(paper)
 
 
-if __name__ == "__main__":
-    with open("./input.txt") as f:
+def load_input(filename: str, test: bool = False) -> Arguments:
+    with open(filename) as f:
         raw_data = [x.strip() for x in f.readlines()]
         separator_index = raw_data.index("")
         dots, folds = raw_data[:separator_index], raw_data[separator_index + 1 :]
 
+    return Arguments(part_one=(dots, folds[0]), part_two=(dots, folds))
+
+
+if __name__ == "__main__":
+    arguments = load_input("./input.txt")
+    dots, folds = arguments.part_two
+
     remaining_dots = part_one(dots, folds[0])
     print(
         f"PART ONE: The number of dots remaining after folding once is equal to {remaining_dots}."
@@ -1,4 +1,9 @@
+import sys
 from collections import Counter, defaultdict
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments  # noqa: E402
 
 
 def apply_insertions(polymer: str, rules: dict[str, str]):
@@ -129,10 +134,16 @@ def part_two(initial_state: str, rules: list[str]) -> int:
     return counts[-1] - counts[0]
 
 
-if __name__ == "__main__":
-    with open("./input.txt") as f:
+def load_input(filename: str, test: bool = False) -> Arguments:
+    with open(filename) as f:
         initial_polymer, _, *pair_insertions = [x.strip() for x in f.readlines()]
 
+    return Arguments.shared(initial_polymer, pair_insertions)
+
+
+if __name__ == "__main__":
+    initial_polymer, pair_insertions = load_input("./input.txt").part_one
+
     difference = part_one(initial_polymer, pair_insertions)
     print(
         f"PART ONE: The difference between the most and least common "
@@ -1,4 +1,8 @@
-from labirynth import Labirynth, Cell, expand_grid
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from labirynth import Labirynth, expand_grid  # noqa: E402
 
 
 def part_one(data: list[str]):
@@ -43,14 +47,10 @@ def part_one(data: list[str]):
     The total risk of this path is 40 (the starting position is never entered, so its risk is not counted).
 
     What is the lowest total risk of any path from the top left to the bottom right?"""
-    cells = [
-        [Cell(x, y, int(risk)) for x, risk in enumerate(row)]
-        for y, row in enumerate(data)
-    ]
-    labirynth = Labirynth(cells)
+    labirynth = Labirynth.from_lines(data)
 
     route = labirynth.find_best_path()
-    return sum(c.risk for c in route) - 1
+    return labirynth.path_risk(route) - 1
 
 
 def part_two(data: list[str]):
@@ -187,7 +187,7 @@ def part_two(data: list[str]):
     labirynth = Labirynth(cells)
 
     route = labirynth.find_best_path()
-    return sum(c.risk for c in route) - 1
+    return labirynth.path_risk(route) - 1
 
 
 if __name__ == "__main__":
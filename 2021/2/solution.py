@@ -121,13 +121,16 @@ def part_two(course: Course) -> int:
     return position.horizontal * position.depth
 
 
-if __name__ == "__main__":
-
+def load_input(filename: str, test: bool = False) -> list[Movement]:
     def create_movement(direction: str, value: str) -> Movement:
         return Movement(direction, int(value))
 
-    with open("./input.txt") as f:
-        submarine_course = [create_movement(*x.split()) for x in f.readlines()]
+    with open(filename) as f:
+        return [create_movement(*x.split()) for x in f.readlines()]
+
+
+if __name__ == "__main__":
+    submarine_course = load_input("./input.txt")
 
     position_prod = part_one(submarine_course)
     print(f"PART ONE: The position product is {position_prod}.")
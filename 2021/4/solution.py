@@ -1,5 +1,11 @@
+import sys
+from pathlib import Path
+
 from board import BingoBoard
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments  # noqa: E402
+
 
 def part_one(numbers: list[int], board_list: list[BingoBoard]) -> int:
     """You're already almost 1.5km (almost a mile) below the surface of the ocean, already so deep that you can't see
@@ -119,8 +125,8 @@ def part_two(numbers: list[int], board_list: list[BingoBoard]) -> int:
     return losing_board.get_score() * last_drawn_number
 
 
-if __name__ == "__main__":
-    with open("./input.txt") as f:
+def load_input(filename: str, test: bool = False) -> Arguments:
+    with open(filename) as f:
         draw_numbers, _, *board_data = [x.strip() for x in f.readlines()]
         draw_numbers = list(map(int, draw_numbers.split(",")))
 
@@ -133,6 +139,12 @@ if __name__ == "__main__":
         else:
             board_buffer.append([int(x) for x in line.split()])
 
+    return Arguments.shared(draw_numbers, boards)
+
+
+if __name__ == "__main__":
+    draw_numbers, boards = load_input("./input.txt").part_one
+
     winning_score = part_one(draw_numbers, boards)
     print(f"PART ONE: The winning board's score is {winning_score}.")
     for b in boards:
@@ -92,11 +92,15 @@ def part_two(vents: list[Vent]) -> int:
     return sum(v > 1 for v in c.values())
 
 
-if __name__ == "__main__":
-    with open("./input.txt") as f:
+def load_input(filename: str, test: bool = False) -> list[Vent]:
+    with open(filename) as f:
         vent_data = [x.strip() for x in f.readlines()]
 
-    vent_list = list(map(Vent, vent_data))
+    return list(map(Vent, vent_data))
+
+
+if __name__ == "__main__":
+    vent_list = load_input("./input.txt")
 
     intersections = part_one(vent_list)
     print(
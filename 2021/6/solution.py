@@ -83,15 +83,27 @@ def get_those_fucking_fishes(fishes: list[int], after: int) -> int:
     return sum(counts)
 
 
+def part_one(fishes: list[int]) -> int:
+    return get_those_fucking_fishes(fishes, 80)
+
+
+def part_two(fishes: list[int]) -> int:
+    return get_those_fucking_fishes(fishes, 256)
+
+
+def load_input(filename: str, test: bool = False) -> list[int]:
+    with open(filename) as f:
+        return list(map(int, f.readline().split(",")))
+
+
 if __name__ == "__main__":
-    with open("./input.txt") as f:
-        fish_data = list(map(int, f.readline().split(",")))
+    fish_data = load_input("./input.txt")
 
-    total_fish = get_those_fucking_fishes(fish_data, 80)
+    total_fish = part_one(fish_data)
     print(
         f"PART ONE: The total number of fish after 80 days will be equal to {total_fish}."
     )
-    total_fish = get_those_fucking_fishes(fish_data, 256)
+    total_fish = part_two(fish_data)
     print(
         f"PART TWO: The total number of fish after 256 days will be equal to {total_fish}."
     )
@@ -88,9 +88,13 @@ def part_two(crabs: list[int]) -> int:
     return min([floored_score, ceiled_score])
 
 
+def load_input(filename: str, test: bool = False) -> list[int]:
+    with open(filename) as f:
+        return list(map(int, f.readline().split(",")))
+
+
 if __name__ == "__main__":
-    with open("./input.txt") as f:
-        crab_data = list(map(int, f.readline().split(",")))
+    crab_data = load_input("./input.txt")
 
     total_movement = part_one(crab_data)
     print(
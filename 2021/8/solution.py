@@ -172,10 +172,14 @@ def part_two(displays: list[Display]) -> int:
     return total
 
 
-if __name__ == "__main__":
-    with open("./input.txt") as f:
+def load_input(filename: str, test: bool = False) -> list[Display]:
+    with open(filename) as f:
         raw_data = [x.strip() for x in f.readlines()]
-        display_data = list(map(Display.from_raw_input, raw_data))
+        return list(map(Display.from_raw_input, raw_data))
+
+
+if __name__ == "__main__":
+    display_data = load_input("./input.txt")
 
     simple_digits_total = part_one(display_data)
     print(
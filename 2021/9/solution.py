@@ -1,6 +1,9 @@
+import sys
 from functools import reduce
+from pathlib import Path
 
-from height_map import HeightMap
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from height_map import HeightMap  # noqa: E402
 
 
 def part_one(height_map: HeightMap) -> int:
@@ -36,7 +39,7 @@ def part_one(height_map: HeightMap) -> int:
     heightmap?
     """
     low_points = height_map.get_low_points()
-    low_point_heights = [p.height for p in low_points]
+    low_point_heights = [height_map.get_cell_height(p) for p in low_points]
     return sum(low_point_heights) + len(low_point_heights)
 
 
@@ -86,23 +89,25 @@ def part_two(height_map: HeightMap) -> int:
 
     What do you get if you multiply together the sizes of the three largest basins?
     """
-    mapped_points = {}
+    mapped_points = height_map.area.layer()
     basin_sizes = []
     low_points = height_map.get_low_points()
     for point in low_points:
-        if point.coor in mapped_points:
+        if mapped_points[point]:
             continue
-        basin = height_map.get_basin(point.x, point.y)
-        mapped_points |= basin
-        basin_sizes.append(len(basin))
+        basin_sizes.append(height_map.get_basin(point, mapped_points))
 
     return reduce(lambda a, b: a * b, sorted(basin_sizes)[-3:], 1)
 
 
-if __name__ == "__main__":
-    with open("./input.txt") as f:
+def load_input(filename: str, test: bool = False) -> HeightMap:
+    with open(filename) as f:
         map_data = [x.strip() for x in f.readlines()]
-        hmap = HeightMap(map_data)
+        return HeightMap(map_data)
+
+
+if __name__ == "__main__":
+    hmap = load_input("./input.txt")
 
     risk_level = part_one(hmap)
     print(f"PART ONE: The risk level of the area is equal to {risk_level}.")
@@ -1,29 +1,33 @@
 """https://adventofcode.com/2022/day/12"""
 
-from grid import Grid
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from grid import Grid  # noqa: E402
 
 
 def part_one(grid: Grid) -> int:
-    return len(grid.find_best_path(from_=grid.start_area)) - 1
+    return len(grid.find_best_path(grid.start)) - 1
 
 
 def part_two(grid: Grid) -> int:
-    return min(
-        len(route) - 1
-        for candidate in filter(lambda a: a.height == 0, grid.height_map.values())
-        if (route := grid.find_best_path(from_=candidate))
-    )
+    return len(grid.find_best_path(*grid.height_map.find_all(0))) - 1
 
 
 def part_two_alternative(grid: Grid) -> int:
     return len(grid.find_first_a()) - 1
 
 
-if __name__ == "__main__":
-    with open("./input.txt") as f:
+def load_input(filename: str, test: bool = False) -> Grid:
+    with open(filename) as f:
         raw_data = [x.strip() for x in f.readlines()]
 
-    input_grid = Grid(raw_data)
+    return Grid(raw_data)
+
+
+if __name__ == "__main__":
+    input_grid = load_input("./input.txt")
 
     first_answer = part_one(input_grid)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
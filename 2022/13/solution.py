@@ -56,6 +56,10 @@ def parse_data(file: str) -> list[tuple]:
         ]
 
 
+def load_input(filename: str, test: bool = False) -> list[tuple]:
+    return parse_data(filename)
+
+
 if __name__ == "__main__":
     packet_pairs = parse_data("input.txt")
 
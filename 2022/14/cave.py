@@ -1,29 +1,30 @@
-from dataclasses import dataclass
 from typing import Generator
 
-from node import Node, IntTuple
+from aoc.coords import SOUTH, SOUTH_EAST, SOUTH_WEST, manhattan, point, sign
+from aoc.counters import counters
+from node import Node
+
+# the order in which a unit of sand tries to fall
+FALLS = (SOUTH, SOUTH_WEST, SOUTH_EAST)
 
 
 class CavePath:
     def __init__(self, node_info: str):
-        self.nodes = set()
+        self.nodes: set[complex] = set()
         nodes = list(map(Node.from_string, node_info.split(" -> ")))
         for node1, node2 in zip(nodes, nodes[1:]):
             self.nodes.update(self.build_path(node1, node2))
 
     @staticmethod
-    def build_path(n1: Node, n2: Node) -> set[Node]:
-        if n1.x == n2.x:
-            y_start, y_end = sorted([n1.y, n2.y])
-            return {Node(n1.x, y) for y in range(y_start, y_end + 1)}
-        elif n1.y == n2.y:
-            x_start, x_end = sorted([n1.x, n2.x])
-            return {Node(x, n1.y) for x in range(x_start, x_end + 1)}
+    def build_path(n1: Node, n2: Node) -> set[complex]:
+        start, end = n1.point, n2.point
+        step = sign(end - start)
+        return {start + step * i for i in range(manhattan(start, end) + 1)}
 
 
 class Cave:
     def __init__(self, path_info: list[str]):
-        self.blocked_nodes = set()
+        self.blocked_nodes: set[complex] = set()
         self.x_span = [500, 500]
         self.y_depth = 0
         for path in map(CavePath, path_info):
@@ -31,39 +32,37 @@ class Cave:
             self.widen(path)
 
     def widen(self, path: CavePath):
-        path_x_span = [n.x for n in path.nodes]
+        path_x_span = [int(n.real) for n in path.nodes]
         if (new_min_x := min(path_x_span)) < self.x_span[0]:
             self.x_span[0] = new_min_x
         if (new_max_x := max(path_x_span)) > self.x_span[1]:
             self.x_span[1] = new_max_x
-        if (new_max_y := max(n.y for n in path.nodes)) > self.y_depth:
+        if (new_max_y := max(int(n.imag) for n in path.nodes)) > self.y_depth:
             self.y_depth = new_max_y
 
     def simulate_sand_dropping(self) -> Generator["Sand", None, None]:
         more_sand_to_go = True
         while more_sand_to_go:
-            sand = Sand(500, 1)
+            sand = Sand(point(500, 1))
             sand.simulate_dropping(self)
             if sand.is_resting:
-                self.blocked_nodes.add(sand.to_node())
+                self.blocked_nodes.add(sand.position)
                 yield sand
             else:
                 more_sand_to_go = False
 
-    def node_is_unblocked(self, node: Node | tuple[int, int]) -> bool:
-        if not isinstance(node, Node):
-            node = Node(*node)
+    def node_is_unblocked(self, node: complex) -> bool:
         return node not in self.blocked_nodes
 
-    def node_is_bound_for_endless_void(self, p: Node) -> bool:
-        return p.x < self.x_span[0] or p.x > self.x_span[1] or p.y > self.y_depth
+    def node_is_bound_for_endless_void(self, p: complex) -> bool:
+        return p.real < self.x_span[0] or p.real > self.x_span[1] or p.imag > self.y_depth
 
     def __str__(self) -> str:
         builder = []
         for y in range(self.y_depth + 1):
             row = ""
             for x in range(self.x_span[0], self.x_span[1] + 1):
-                row += "#" if Node(x, y) in self.blocked_nodes else "."
+                row += "#" if point(x, y) in self.blocked_nodes else "."
             builder.append(row)
         return "\n".join(builder)
 
@@ -75,29 +74,28 @@ class CaveWithBottom(Cave):
 
     def simulate_sand_dropping(self) -> Generator["Sand", None, None]:
         more_sand_to_go = True
-        start_pos = IntTuple((500, 0))
+        start_pos = point(500, 0)
         while more_sand_to_go:
-            if Node(*start_pos) in self.blocked_nodes:
+            if start_pos in self.blocked_nodes:
                 more_sand_to_go = False
             else:
-                sand = Sand(*start_pos)
+                sand = Sand(start_pos)
                 sand.simulate_dropping(self)
                 self.add_sand(sand)
                 yield sand
 
     def add_sand(self, sand: "Sand"):
-        if sand.x < self.x_span[0]:
-            self.x_span[0] = sand.x
-        elif sand.x > self.x_span[1]:
-            self.x_span[1] = sand.x
-        self.blocked_nodes.add(sand.to_node())
-
-    def node_is_unblocked(self, node: Node | tuple[int, int]) -> bool:
-        if not isinstance(node, Node):
-            node = Node(*node)
-        return node not in self.blocked_nodes and node.y != self.y_depth
-
-    def node_is_bound_for_endless_void(self, p: Node) -> bool:
+        x = int(sand.position.real)
+        if x < self.x_span[0]:
+            self.x_span[0] = x
+        elif x > self.x_span[1]:
+            self.x_span[1] = x
+        self.blocked_nodes.add(sand.position)
+
+    def node_is_unblocked(self, node: complex) -> bool:
+        return node not in self.blocked_nodes and node.imag != self.y_depth
+
+    def node_is_bound_for_endless_void(self, p: complex) -> bool:
         return False
 
     def __str__(self) -> str:
@@ -108,32 +106,26 @@ class CaveWithBottom(Cave):
                 continue
             row = ""
             for x in range(self.x_span[0], self.x_span[1] + 1):
-                row += "#" if Node(x, y) in self.blocked_nodes else "."
+                row += "#" if point(x, y) in self.blocked_nodes else "."
             builder.append(row)
         return "\n".join(builder)
 
 
-@dataclass
-class Sand(Node):
-    is_resting: bool = False
+class Sand:
+    def __init__(self, position: complex, is_resting: bool = False):
+        self.position = position
+        self.is_resting = is_resting
 
     def simulate_dropping(self, cave: Cave):
+        steps = 0
         while not self.is_resting:
-            next_possible_positions = filter(
-                cave.node_is_unblocked,
-                [
-                    self.position + (0, 1),
-                    self.position + (-1, 1),
-                    self.position + (1, 1),
-                ],
-            )
-            try:
-                next_position = next(next_possible_positions)
-                if cave.node_is_bound_for_endless_void(Node(*next_position)):
-                    break
-                self.position = next_position
-            except StopIteration:
+            steps += 1
+            next_possible_positions = filter(cave.node_is_unblocked, [self.position + fall for fall in FALLS])
+            next_position = next(next_possible_positions, None)
+            if next_position is None:
                 self.is_resting = True
-
-    def to_node(self) -> Node:
-        return Node(self.x, self.y)
+            elif cave.node_is_bound_for_endless_void(next_position):
+                break
+            else:
+                self.position = next_position
+        counters.observe("sand.fall", steps)
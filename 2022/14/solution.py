@@ -1,6 +1,10 @@
 """https://adventofcode.com/2022/day/14"""
 
-from cave import Cave, CaveWithBottom
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from cave import Cave, CaveWithBottom  # noqa: E402
 
 
 def part_one(data: list[str]):
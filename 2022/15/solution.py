@@ -1,7 +1,12 @@
 """https://adventofcode.com/2022/day/15"""
 
 import re
+import sys
 from itertools import permutations
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments  # noqa: E402
 
 
 def manhattan(x1, y1, x2, y2) -> int:
@@ -38,18 +43,24 @@ def part_two(data: list[str], space: int):
                 print(x, y)
 
 
-if __name__ == "__main__":
-    file = "./input_test.txt"
-    with open(file) as f:
+def load_input(filename: str, test: bool = False) -> Arguments:
+    with open(filename) as f:
         raw_data = [x.strip() for x in f.readlines()]
 
-    if file == "./input.txt":
+    if not test:
         depth = 2_000_000
         limit = 4_000_000
     else:
         depth = 10
         limit = 20
-    first_answer = part_one(raw_data, depth)
+    return Arguments(part_one=(raw_data, depth), part_two=(raw_data, limit))
+
+
+if __name__ == "__main__":
+    file = "./input_test.txt"
+    arguments = load_input(file, test=file != "./input.txt")
+
+    first_answer = part_one(*arguments.part_one)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
-    second_answer = part_two(raw_data, limit)
+    second_answer = part_two(*arguments.part_two)
     print(f"PART ONE: The answer to part two is equal to {second_answer}.")
@@ -79,20 +79,19 @@ def monkey_expression(
     )
 
 
-def part_one(data: list[str]):
-    monkey_dict = dict()
-    for monkey_id, value in map(lambda m: m.split(": "), data):
-        monkey_dict[monkey_id] = FlatValueMonkey(value)
+def prepare(data: list[str]) -> dict[str, str]:
+    """Monkey id -> what it yells, split once for both parts."""
+    return dict(map(lambda m: m.split(": "), data))
 
-    return get_monkey_value(monkey_dict, "root")
 
+def part_one(monkeys: dict[str, str]):
+    monkey_dict = {monkey_id: FlatValueMonkey(value) for monkey_id, value in monkeys.items()}
+
+    return get_monkey_value(monkey_dict, "root")
 
-def part_two(data: list[str]):
-    monkey_dict = dict()
-    for monkey_id, value in map(lambda m: m.split(": "), data):
-        monkey_dict[monkey_id] = value
 
-    expression = monkey_expression(monkey_dict, "root")
+def part_two(monkeys: dict[str, str]):
+    expression = monkey_expression(monkeys, "root")
 
     while not isinstance(expression.left_hand, str):
         left_hand = expression.left_hand
@@ -125,7 +124,9 @@ if __name__ == "__main__":
     with open("./input.txt") as f:
         raw_data = [x.strip() for x in f.readlines()]
 
-    first_answer = part_one(raw_data)
+    monkeys = prepare(raw_data)
+
+    first_answer = part_one(monkeys)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
-    second_answer = part_two(raw_data)
+    second_answer = part_two(monkeys)
     print(f"PART ONE: The answer to part two is equal to {second_answer}.")
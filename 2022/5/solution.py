@@ -1,7 +1,11 @@
 import re
+import sys
 from copy import deepcopy
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments  # noqa: E402
+
 Stack = list[str]
 InstructionList = list[str]
 
@@ -192,6 +196,10 @@ def parse_input(file_path: Path | str) -> tuple[dict[int, Stack], InstructionLis
     return stacks, instruction_data
 
 
+def load_input(filename: str, test: bool = False) -> Arguments:
+    return Arguments.shared(*parse_input(filename))
+
+
 if __name__ == "__main__":
     stack_list, instruction_list = parse_input("input.txt")
 
@@ -59,9 +59,13 @@ def part_two(signal: str) -> int:
     return look_for_first_n_distinct_characters(signal, 14)
 
 
+def load_input(filename: str, test: bool = False) -> str:
+    with open(filename) as f:
+        return f.read().strip()
+
+
 if __name__ == "__main__":
-    with open("./input.txt") as f:
-        raw_data = f.read().strip()
+    raw_data = load_input("./input.txt")
 
     first_answer = part_one(raw_data)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
@@ -196,12 +196,16 @@ def part_two(top_dir: Directory):
     return find_the_smallest_suitable_dir(space_required, top_dir, top_dir.size)
 
 
-if __name__ == "__main__":
-    with open("./input.txt") as f:
+def load_input(filename: str, test: bool = False) -> Directory:
+    with open(filename) as f:
         raw_data = [x.strip() for x in f.readlines()]
 
     commands = parse_commands(raw_data)
-    root_dir = build_tree(commands)
+    return build_tree(commands)
+
+
+if __name__ == "__main__":
+    root_dir = load_input("./input.txt")
 
     first_answer = part_one(root_dir)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
@@ -4,16 +4,13 @@ from itertools import chain
 from operator import mul
 from typing import Sequence
 
-
-class IntTuple(tuple):
-    def __add__(self, other: "IntTuple") -> "IntTuple":
-        return IntTuple(s + o for s, o in zip(self, other))
+from aoc.coords import Packing
 
 
 @dataclass
 class Tree:
     height: int
-    position: IntTuple[int, int]
+    position: int
 
     def __hash__(self):
         return hash(self.position)
@@ -23,26 +20,24 @@ Trees = Sequence[Sequence[Tree]]
 
 
 class Forest:
-    def __init__(self, trees: Trees):
+    def __init__(self, trees: Trees, packing: Packing):
         self.trees = trees
         self.tree_dict = {t.position: t for t in chain(*trees)}
+        self.offsets = {"n": packing.north, "e": packing.east, "w": packing.west, "s": packing.south}
 
     @classmethod
     def from_strings(cls, tree_lines: list[str]) -> "Forest":
+        packing = Packing(len(tree_lines[0]))
         return cls(
             [
-                [Tree(int(h), IntTuple((x, y))) for x, h in enumerate(line)]
+                [Tree(int(h), packing.pack(x, y)) for x, h in enumerate(line)]
                 for y, line in enumerate(tree_lines)
-            ]
+            ],
+            packing,
         )
 
     def get_next_tree(self, tree: Tree, direction: str) -> Tree | None:
-        return {
-            "n": self.tree_dict.get(tree.position + IntTuple((0, -1))),
-            "e": self.tree_dict.get(tree.position + IntTuple((1, 0))),
-            "w": self.tree_dict.get(tree.position + IntTuple((-1, 0))),
-            "s": self.tree_dict.get(tree.position + IntTuple((0, 1))),
-        }[direction]
+        return self.tree_dict.get(tree.position + self.offsets[direction])
 
     def get_score_in_direction(self, tree: Tree, direction: str) -> int:
         sub_score = 0
@@ -1,4 +1,8 @@
-from forest import Tree, Forest
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from forest import Tree, Forest  # noqa: E402
 
 
 def get_visible_trees(trees) -> set[Tree]:
@@ -104,11 +108,15 @@ def part_two(forest: Forest) -> int:
     return max(forest.get_scenic_score(tree) for tree in forest.tree_dict.values())
 
 
-if __name__ == "__main__":
-    with open("./input.txt") as f:
+def load_input(filename: str, test: bool = False) -> Forest:
+    with open(filename) as f:
         raw_data = [x.strip() for x in f.readlines()]
 
-    input_forest = Forest.from_strings(raw_data)
+    return Forest.from_strings(raw_data)
+
+
+if __name__ == "__main__":
+    input_forest = load_input("./input.txt")
 
     first_answer = part_one(input_forest)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
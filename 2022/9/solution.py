@@ -1,4 +1,8 @@
-from rope import Knot
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from rope import Knot  # noqa: E402
 
 
 def part_one(moves: list[tuple[str, int]]) -> int:
@@ -262,8 +266,8 @@ def part_one(moves: list[tuple[str, int]]) -> int:
 
     Simulate your complete hypothetical series of motions. How many positions does the tail of the rope visit at least
     once?"""
-    head = Knot((0, 0))
-    tail = Knot((0, 0))
+    head = Knot()
+    tail = Knot()
     for direction, repeat in moves:
         for _ in range(repeat):
             head.move(direction)
@@ -713,7 +717,7 @@ def part_two(moves: list[tuple[str, int]]) -> int:
 
     Simulate your complete series of motions on a larger rope with ten knots. How many positions does the tail of the
     rope visit at least once?"""
-    rope = [Knot((0, 0)) for _ in range(10)]
+    rope = [Knot() for _ in range(10)]
     head, *tail = rope
     for direction, repeat in moves:
         for _ in range(repeat):
@@ -724,13 +728,17 @@ def part_two(moves: list[tuple[str, int]]) -> int:
     return len(tail[-1].move_history)
 
 
-if __name__ == "__main__":
-    with open("./input.txt") as f:
-        input_moves = [
+def load_input(filename: str, test: bool = False) -> list[tuple[str, int]]:
+    with open(filename) as f:
+        return [
             (d, int(n))
             for d, n in map(lambda line: line.strip().split(), f.readlines())
         ]
 
+
+if __name__ == "__main__":
+    input_moves = load_input("./input.txt")
+
     first_answer = part_one(input_moves)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
     second_answer = part_two(input_moves)
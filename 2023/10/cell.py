@@ -2,12 +2,12 @@ from abc import abstractmethod, ABC
 from dataclasses import dataclass
 from typing import Type
 
-from position import Position
+from aoc.coords import EAST, NORTH, SOUTH, WEST, point
 
 
 @dataclass
 class Cell(ABC):
-    position: Position
+    position: complex
 
     @classmethod
     def from_symbol(cls, symbol: str, x: int, y: int) -> Type["Cell"]:
@@ -20,70 +20,70 @@ class Cell(ABC):
             "J": PipeNW,
             "7": PipeSW,
             "F": PipeSE,
-        }[symbol](Position((x, y)))
+        }[symbol](point(x, y))
 
     @abstractmethod
-    def get_positions_of_connected_cells(self) -> tuple[Position, ...]: ...
+    def get_positions_of_connected_cells(self) -> tuple[complex, ...]: ...
 
 
 class Start(Cell):
-    def get_positions_of_connected_cells(self) -> tuple[Position, ...]:
+    def get_positions_of_connected_cells(self) -> tuple[complex, ...]:
         return (
-            self.position + Position((-1, 0)),  # WEST
-            self.position + Position((1, 0)),  # EAST
-            self.position + Position((0, -1)),  # NORTH
-            self.position + Position((0, 1)),  # SOUTH
+            self.position + WEST,
+            self.position + EAST,
+            self.position + NORTH,
+            self.position + SOUTH,
         )
 
 
 class Ground(Cell):
-    def get_positions_of_connected_cells(self) -> tuple[Position, ...]:
+    def get_positions_of_connected_cells(self) -> tuple[complex, ...]:
         return tuple()
 
 
 class PipeNS(Cell):
-    def get_positions_of_connected_cells(self) -> tuple[Position, ...]:
+    def get_positions_of_connected_cells(self) -> tuple[complex, ...]:
         return (
-            self.position + Position((0, -1)),  # NORTH
-            self.position + Position((0, 1)),  # SOUTH
+            self.position + NORTH,
+            self.position + SOUTH,
         )
 
 
 class PipeWE(Cell):
-    def get_positions_of_connected_cells(self) -> tuple[Position, ...]:
+    def get_positions_of_connected_cells(self) -> tuple[complex, ...]:
         return (
-            self.position + Position((-1, 0)),  # WEST
-            self.position + Position((1, 0)),  # EAST
+            self.position + WEST,
+            self.position + EAST,
         )
 
 
 class PipeNE(Cell):
-    def get_positions_of_connected_cells(self) -> tuple[Position, ...]:
+    def get_positions_of_connected_cells(self) -> tuple[complex, ...]:
         return (
-            self.position + Position((1, 0)),  # EAST
-            self.position + Position((0, -1)),  # NORTH
+            self.position + EAST,
+            self.position + NORTH,
         )
 
 
 class PipeNW(Cell):
-    def get_positions_of_connected_cells(self) -> tuple[Position, ...]:
+    def get_positions_of_connected_cells(self) -> tuple[complex, ...]:
         return (
-            self.position + Position((-1, 0)),  # WEST
-            self.position + Position((0, -1)),  # NORTH
+            self.position + WEST,
+            self.position + NORTH,
         )
 
 
 class PipeSW(Cell):
-    def get_positions_of_connected_cells(self) -> tuple[Position, ...]:
+    def get_positions_of_connected_cells(self) -> tuple[complex, ...]:
         return (
-            self.position + Position((-1, 0)),  # WEST
-            self.position + Position((0, 1)),  # SOUTH
+            self.position + WEST,
+            self.position + SOUTH,
         )
 
 
 class PipeSE(Cell):
-    def get_positions_of_connected_cells(self) -> tuple[Position, ...]:
+    def get_positions_of_connected_cells(self) -> tuple[complex, ...]:
         return (
-            self.position + Position((1, 0)),  # EAST
-            self.position + Position((0, 1)),  # SOUTH
+            self.position + EAST,
+            self.position + SOUTH,
         )
@@ -1,3 +0,0 @@
-class Position(tuple):
-    def __add__(self, other: "Position") -> "Position":
-        return Position(s + o for s, o in zip(self, other))
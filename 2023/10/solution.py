@@ -1,25 +1,28 @@
 """https://adventofcode.com/2023/day/10"""
 
 import argparse
+import sys
+from pathlib import Path
 from typing import Type
 
-from position import Position
-from cell import Cell, Start, Ground
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.coords import point  # noqa: E402
+from cell import Cell, Start, Ground  # noqa: E402
 
 
 class Maze:
     def __init__(self, row_data: list[str]):
-        self.grid: dict[Position, Type[Cell]] = dict()
-        self.starting_pos = Position((0, 0))
+        self.grid: dict[complex, Type[Cell]] = dict()
+        self.starting_pos = point(0, 0)
         for x, y, ch in (
             (x, y, ch) for y, row in enumerate(row_data) for x, ch in enumerate(row)
         ):
             cell = Cell.from_symbol(ch, x, y)
-            self.grid[Position((x, y))] = cell
+            self.grid[cell.position] = cell
             if isinstance(cell, Start):
                 self.starting_pos = cell.position
 
-    def get_cell(self, position: Position) -> Type[Cell]:
+    def get_cell(self, position: complex) -> Type[Cell]:
         return self.grid.get(position, Ground(position))
 
     def get_loop_from_start(self) -> list[Type[Cell]]:
@@ -47,6 +47,11 @@ def part_two(grids: list[list[str]]) -> int:
     return sum(find_proper_reflection(grid, 1) for grid in grids)
 
 
+def load_input(filename: str, test: bool = False) -> list[list[str]]:
+    with open(filename) as f:
+        return [x.split("\n") for x in f.read().split("\n\n")]
+
+
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 13/2023.")
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
@@ -54,8 +59,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
     filename = "./input_test.txt" if args.test else "./input.txt"
 
-    with open(filename) as f:
-        raw_data = [x.split("\n") for x in f.read().split("\n\n")]
+    raw_data = load_input(filename, args.test)
 
     first_answer = part_one(raw_data)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
@@ -62,6 +62,11 @@ def part_two(data: str):
     return sum(starmap(sum_fpowers, boxes.items()))
 
 
+def load_input(filename: str, test: bool = False) -> str:
+    with open(filename) as f:
+        return f.read().strip()
+
+
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 15/2023.")
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
@@ -69,8 +74,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
     filename = "./input_test.txt" if args.test else "./input.txt"
 
-    with open(filename) as f:
-        raw_data = f.read().strip()
+    raw_data = load_input(filename, args.test)
 
     first_answer = part_one(raw_data)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
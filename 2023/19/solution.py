@@ -1,11 +1,16 @@
 """https://adventofcode.com/2023/day/19"""
 
 import argparse
+import sys
 from collections import defaultdict
+from pathlib import Path
 
 from part import Part, PartRange
 from workflow import Workflow
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments  # noqa: E402
+
 
 def parse_parts(part_strings: list[str]) -> list[Part]:
     return [Part.from_str(p) for p in part_strings]
@@ -45,16 +50,18 @@ def join_states(
     )
 
 
-def part_one(workflow_data: list[str], part_data: list[str]) -> int:
-    parts = parse_parts(part_data)
+def prepare(workflow_data: list[str], part_data: list[str]) -> Arguments:
+    """Both parts need the workflows, only the first one the parts, neither of them modifies what it's given."""
     workflows = parse_workflows(workflow_data)
+    return Arguments(part_one=(workflows, parse_parts(part_data)), part_two=(workflows,))
+
 
+def part_one(workflows: dict[str, Workflow], parts: list[Part]) -> int:
     accepted, rejected = process_parts(parts, workflows)
     return sum(map(Part.sum_up, accepted))
 
 
-def part_two(workflow_data: list[str]) -> int:
-    workflows = parse_workflows(workflow_data)
+def part_two(workflows: dict[str, Workflow]) -> int:
     state = {"in": [PartRange((1, 4001), (1, 4001), (1, 4001), (1, 4001))]}
     accepted, rejected = [], []
     while state:
@@ -74,6 +81,14 @@ def part_two(workflow_data: list[str]) -> int:
     return sum(pr.get_possible_parts() for pr in accepted)
 
 
+def load_input(filename: str, test: bool = False) -> Arguments:
+    with open(filename) as f:
+        raw_data = f.read().split("\n\n")
+        raw_workflows, raw_parts = map(lambda x: x.strip().split("\n"), raw_data)
+
+    return Arguments.shared(raw_workflows, raw_parts)
+
+
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 19/2023.")
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
@@ -81,11 +96,9 @@ if __name__ == "__main__":
     args = parser.parse_args()
     filename = "./input_test.txt" if args.test else "./input.txt"
 
-    with open(filename) as f:
-        raw_data = f.read().split("\n\n")
-        raw_workflows, raw_parts = map(lambda x: x.strip().split("\n"), raw_data)
+    context = prepare(*load_input(filename, args.test).part_one)
 
-    first_answer = part_one(raw_workflows, raw_parts)
+    first_answer = part_one(*context.part_one)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
-    second_answer = part_two(raw_workflows)
+    second_answer = part_two(*context.part_two)
     print(f"PART TWO: The answer to part two is equal to {second_answer}.")
@@ -1,70 +1,49 @@
 """https://adventofcode.com/2023/day/21"""
 
 import argparse
-from functools import reduce
+import sys
+from pathlib import Path
 
-type Position = tuple[int, int]
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc.grid import Grid  # noqa: E402
+
+ROCK = ord("#")
 
 
 class Garden:
     def __init__(self, rows: list[str]):
-        self.symbols = "".join(rows)
-        self.width = len(rows)
-        self.height = len(rows[0])
-        self._start_index = self.symbols.index("S")
-
-    @property
-    def start_pos(self) -> Position:
-        return self._to_position(self._start_index)
-
-    def _to_symbol_index(self, x: int, y: int) -> int:
-        return y * self.height + x
-
-    def _to_position(self, i: int) -> Position:
-        y, x = divmod(i, self.height)
-        return x, y
-
-    def get_plot_symbol(self, x: int, y: int) -> str | None:
-        if self.position_is_valid(x, y):
-            return self.symbols[self._to_symbol_index(x, y)]
-
-    def position_is_valid(self, x: int, y: int) -> bool:
-        return 0 <= x < self.width and 0 <= y < self.height
-
-    def _filter_criterion(self, pos: Position, visited_plots: set[Position]) -> bool:
-        return pos not in visited_plots and self.get_plot_symbol(*pos) not in {
-            None,
-            "#",
-        }
-
-    def get_neighbours(
-        self, position: Position, visited_plots: set[Position]
-    ) -> set[Position]:
-        x, y = position
-        return set(
-            filter(
-                lambda pos: self._filter_criterion(pos, visited_plots),
-                ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)),
-            )
-        )
+        # the garden is walled in with rocks, so the elf never steps off it
+        self.plots = Grid.from_lines(rows, border=ROCK)
+        self.width = self.plots.width
+        self.height = self.plots.height
+        self.start_pos = self.plots.find(ord("S"))
+
+    def get_neighbours(self, position: int, visited_plots) -> list[int]:
+        plots = self.plots.cells
+        return [
+            neighbour
+            for neighbour in (position + offset for offset in self.plots.orthogonal)
+            if plots[neighbour] != ROCK and not visited_plots[neighbour]
+        ]
 
     def reachable_plots(self, steps: int) -> int:
         step_oddness = self.oddness(steps)
-        visited_plots = {self.start_pos}
+        visited_plots = self.plots.layer()
+        visited_plots[self.start_pos] = 1
         plot_steps = [(self.start_pos, 0)]
 
-        last_visited = {self.start_pos}
+        last_visited = [self.start_pos]
         for step in range(1, steps + 1):
             if not last_visited:
                 break
-            last_visited = reduce(
-                set.union,
-                map(lambda x: self.get_neighbours(x, visited_plots), last_visited),
-                set(),
-            )
+            next_visited = []
+            for position in last_visited:
+                for neighbour in self.get_neighbours(position, visited_plots):
+                    visited_plots[neighbour] = 1
+                    next_visited.append(neighbour)
+            last_visited = next_visited
 
             plot_steps.extend((pos, step) for pos in last_visited)
-            visited_plots |= last_visited
 
         print(f"Took {step} iteration.")
 
@@ -75,17 +54,11 @@ class Garden:
 
         return len(reachable_plots)
 
-    def debug_visited(self, plots: set[Position]):
-        builder = []
-        row = []
-        for i, symbol in enumerate(self.symbols):
-            if i > 0 and i % self.height == 0:
-                builder.append("".join(row))
-                row = []
-
-            row.append("O" if self._to_position(i) in plots else symbol)
-
-        return "\n".join([*builder, "".join(row)])
+    def debug_visited(self, plots: list[int]) -> str:
+        garden = self.plots.copy()
+        for position in plots:
+            garden[position] = ord("O")
+        return str(garden)
 
     @staticmethod
     def oddness(x: int) -> bool:
@@ -110,6 +110,13 @@ def part_two(schematic: Schematic):
     return sum(symbol.ratio for symbol in schematic.get_gears())
 
 
+def load_input(filename: str, test: bool = False) -> Schematic:
+    with open(filename) as f:
+        raw_data = [x.strip() for x in f.readlines()]
+
+    return Schematic(raw_data)
+
+
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 3/2023.")
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
@@ -117,10 +124,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
     filename = "./input_test.txt" if args.test else "./input.txt"
 
-    with open(filename) as f:
-        raw_data = [x.strip() for x in f.readlines()]
-
-    schema = Schematic(raw_data)
+    schema = load_input(filename, args.test)
     first_answer = part_one(schema)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
     second_answer = part_two(schema)
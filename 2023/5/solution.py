@@ -1,11 +1,16 @@
 """https://adventofcode.com/2023/day/5"""
 
 import argparse
+import sys
 from functools import reduce
 from itertools import batched
+from pathlib import Path
 from timeit import default_timer
 from typing import Iterable, Callable
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments  # noqa: E402
+
 NumMapper = Callable[[int], int]
 Range = tuple[int, int]
 RangeMapper = Callable[[list[Range]], list[Range]]
@@ -114,6 +119,13 @@ def part_two(seed_data: str, *map_data: str):
     ).pop(0)
 
 
+def load_input(filename: str, test: bool = False) -> Arguments:
+    with open(filename) as f:
+        raw_seeds, *raw_maps = f.read().split("\n\n")
+
+    return Arguments.shared(raw_seeds, *raw_maps)
+
+
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 5/2023.")
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
@@ -121,8 +133,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
     filename = "./input_test.txt" if args.test else "./input.txt"
 
-    with open(filename) as f:
-        raw_seeds, *raw_maps = f.read().split("\n\n")
+    raw_seeds, *raw_maps = load_input(filename, args.test).part_one
 
     _start = default_timer()
     first_answer = part_one(raw_seeds, *raw_maps)
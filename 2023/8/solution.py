@@ -2,11 +2,16 @@
 
 import argparse
 import re
+import sys
 import timeit
 from itertools import cycle
 from math import lcm
+from pathlib import Path
 from typing import Iterator
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments  # noqa: E402
+
 LOCATION_REGEX = re.compile(r"(\w{3}) = \((\w{3}), (\w{3})\)")
 START_LOC = "AAA"
 DESTINATION = "ZZZ"
@@ -59,6 +64,14 @@ def part_two(pattern: str, location_data: list[str]) -> int:
     return lcm(*steps)
 
 
+def load_input(filename: str, test: bool = False) -> Arguments:
+    with open(filename) as f:
+        move_pattern, rest = f.read().split("\n\n")
+        locations = [x.strip() for x in rest.split("\n")]
+
+    return Arguments.shared(move_pattern, locations)
+
+
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 8/2023.")
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
@@ -66,9 +79,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
     filename = "./input_test.txt" if args.test else "./input.txt"
 
-    with open(filename) as f:
-        move_pattern, rest = f.read().split("\n\n")
-        locations = [x.strip() for x in rest.split("\n")]
+    move_pattern, locations = load_input(filename, args.test).part_one
 
     start = timeit.default_timer()
     first_answer = part_one(move_pattern, locations)
@@ -1,22 +1,12 @@
 """https://adventofcode.com/2024/day/1"""
 
 import argparse
-import timeit
+import sys
 from collections import Counter
-from typing import Callable
+from pathlib import Path
 
-
-def timed(f: Callable) -> Callable:
-    """Decorator to time the execution of a function."""
-
-    def wrapper(*args, **kwargs):
-        start_time = timeit.default_timer()
-        result = f(*args, **kwargs)
-        end_time = timeit.default_timer()
-        print(f"Function {f.__name__} took {end_time - start_time:.6f} seconds")
-        return result
-
-    return wrapper
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments, timed  # noqa: E402
 
 
 @timed
@@ -31,6 +21,13 @@ def part_two(left_list: list[int], right_list: list[int]) -> int:
     return sum(x * c[x] for x in left_list)
 
 
+def load_input(filename: str, test: bool = False) -> Arguments:
+    with open(filename) as f:
+        raw_data = [x.strip() for x in f.readlines()]
+
+    return Arguments.shared(*parse_lists(raw_data))
+
+
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 1/2024.")
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
@@ -45,10 +42,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
     filename = "./input_test.txt" if args.test else "./input.txt"
 
-    with open(filename) as f:
-        raw_data = [x.strip() for x in f.readlines()]
-
-    left, right = parse_lists(raw_data)
+    left, right = load_input(filename, args.test).part_one
 
     first_answer = part_one(left, right)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
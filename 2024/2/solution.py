@@ -33,6 +33,11 @@ def part_two(data: list[list[int]]) -> int:
     )
 
 
+def load_input(filename: str, test: bool = False) -> list[list[int]]:
+    with open(filename) as f:
+        return [list(map(int, x.strip().split())) for x in f.readlines()]
+
+
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 2/2024.")
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
@@ -40,8 +45,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
     filename = "./input_test.txt" if args.test else "./input.txt"
 
-    with open(filename) as f:
-        raw_data = [list(map(int, x.strip().split())) for x in f.readlines()]
+    raw_data = load_input(filename, args.test)
 
     first_answer = part_one(raw_data)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
@@ -2,48 +2,46 @@
 
 import argparse
 import re
-from typing import Callable
-import timeit
+import sys
+from pathlib import Path
+from typing import Iterable
 
-
-def timed(f: Callable) -> Callable:
-    """Decorator to time the execution of a function."""
-
-    def wrapper(*args, **kwargs):
-        start_time = timeit.default_timer()
-        result = f(*args, **kwargs)
-        end_time = timeit.default_timer()
-        print(f"Function {f.__name__} took {end_time - start_time:.6f} seconds")
-        return result
-
-    return wrapper
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import timed  # noqa: E402
+from aoc.day import stream_lines  # noqa: E402
 
 
 @timed
-def part_one(data: str) -> int:
+def part_one(data: Iterable[str]) -> int:
     r = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)")
 
-    return sum(int(m.group(1)) * int(m.group(2)) for m in r.finditer(data))
+    return sum(int(m.group(1)) * int(m.group(2)) for line in data for m in r.finditer(line))
 
 
 @timed
-def part_two(data: list[str]):
+def part_two(data: Iterable[str]):
     r = re.compile(r"mul\((\d{1,3}),(\d{1,3})\)|do\(\)|don't\(\)")
     res = 0
+    # the instructions never span lines, but do() and don't() carry over to the next ones
     enabled = True
 
-    for m in r.finditer(data):
-        match m.group(0):
-            case "do()":
-                enabled = True
-            case "don't()":
-                enabled = False
-            case _ if enabled:
-                res += int(m.group(1)) * int(m.group(2))
+    for line in data:
+        for m in r.finditer(line):
+            match m.group(0):
+                case "do()":
+                    enabled = True
+                case "don't()":
+                    enabled = False
+                case _ if enabled:
+                    res += int(m.group(1)) * int(m.group(2))
 
     return res
 
 
+# the memory is scanned line by line, so it's streamed from the file
+load_input = stream_lines
+
+
 parser = argparse.ArgumentParser(description="Solution for Advent of Code 3/2024.")
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
@@ -57,10 +55,7 @@ if __name__ == "__main__":
         filename = "./input.txt"
         print("Running 2024/3 solution on full input.")
 
-    with open(filename) as f:
-        raw_data = f.read()
-
-    first_answer = part_one(raw_data)
+    first_answer = part_one(load_input(filename, args.test))
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
-    second_answer = part_two(raw_data)
+    second_answer = part_two(load_input(filename, args.test))
     print(f"PART TWO: The answer to part two is equal to {second_answer}.")
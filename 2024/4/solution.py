@@ -1,21 +1,11 @@
 """https://adventofcode.com/2024/day/4"""
 
 import argparse
-from typing import Callable
-import timeit
+import sys
+from pathlib import Path
 
-
-def timed(f: Callable) -> Callable:
-    """Decorator to time the execution of a function."""
-
-    def wrapper(*args, **kwargs):
-        start_time = timeit.default_timer()
-        result = f(*args, **kwargs)
-        end_time = timeit.default_timer()
-        print(f"Function {f.__name__} took {end_time - start_time:.6f} seconds")
-        return result
-
-    return wrapper
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import timed  # noqa: E402
 
 
 @timed
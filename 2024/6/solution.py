@@ -1,8 +1,11 @@
 """https://adventofcode.com/2024/day/6"""
 
 import argparse
-from typing import Callable
-import timeit
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import timed  # noqa: E402
 
 #####################  <UTILS> #####################
 
@@ -10,19 +13,6 @@ parser = argparse.ArgumentParser(description="Solution for Advent of Code 6/2024
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
 
-def timed(f: Callable) -> Callable:
-    """Decorator to time the execution of a function."""
-
-    def wrapper(*args, **kwargs):
-        start_time = timeit.default_timer()
-        result = f(*args, **kwargs)
-        end_time = timeit.default_timer()
-        print(f"Function {f.__name__} took {end_time - start_time:.6f} seconds")
-        return result
-
-    return wrapper
-
-
 ##################### </UTILS> #####################
 
 
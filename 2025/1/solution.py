@@ -2,9 +2,14 @@
 
 import argparse
 import logging
+import sys
 from dataclasses import dataclass
-from typing import Callable, Generator
-import timeit
+from pathlib import Path
+from typing import Generator, Iterable
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import timed  # noqa: E402
+from aoc.day import stream_lines  # noqa: E402
 
 #####################  <UTILS> #####################
 
@@ -12,19 +17,6 @@ parser = argparse.ArgumentParser(description="Solution for Advent of Code 1/2025
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
 
-def timed(func: Callable) -> Callable:
-    """Decorator to time the execution of a function."""
-
-    def wrapper(*args, **kwargs):
-        start_time = timeit.default_timer()
-        result = func(*args, **kwargs)
-        end_time = timeit.default_timer()
-        print(f"Function {func.__name__} took {end_time - start_time:.6f} seconds")
-        return result
-
-    return wrapper
-
-
 ##################### </UTILS> #####################
 
 
@@ -82,7 +74,7 @@ class Rotation:
         )
 
 
-def rotation_generator(data: list[str]) -> Generator[Rotation, None, None]:
+def rotation_generator(data: Iterable[str]) -> Generator[Rotation, None, None]:
     current_position = DIAL_START_VALUE
     for rotation_str in data:
         new_rotation = Rotation.from_string(rotation_str, current_position)
@@ -90,13 +82,17 @@ def rotation_generator(data: list[str]) -> Generator[Rotation, None, None]:
         current_position = new_rotation.resulting_position
 
 
+# the rotations are followed one after another, so they are streamed from the file
+load_input = stream_lines
+
+
 @timed
-def part_one(data: list[str]) -> int:
+def part_one(data: Iterable[str]) -> int:
     return sum(rot.ends_on_zero() for rot in rotation_generator(data))
 
 
 @timed
-def part_two(data: list[str]):
+def part_two(data: Iterable[str]):
     return sum(rot.count_zero_ticks() for rot in rotation_generator(data))
 
 
@@ -111,10 +107,7 @@ if __name__ == "__main__":
         filename = "./input.txt"
         print("Running 2025/1 solution on full input.")
 
-    with open(filename) as f:
-        raw_data = [x.strip() for x in f.readlines()]
-
-    first_answer = part_one(raw_data)
+    first_answer = part_one(load_input(filename, args.test))
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
-    second_answer = part_two(raw_data)
+    second_answer = part_two(load_input(filename, args.test))
     print(f"PART TWO: The answer to part two is equal to {second_answer}.")
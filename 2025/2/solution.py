@@ -2,8 +2,12 @@
 
 import argparse
 import logging
-from typing import Callable, Generator
-import timeit
+import sys
+from pathlib import Path
+from typing import Generator
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import timed  # noqa: E402
 
 #####################  <UTILS> #####################
 
@@ -11,19 +15,6 @@ parser = argparse.ArgumentParser(description="Solution for Advent of Code 2/2025
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
 
-def timed(f: Callable) -> Callable:
-    """Decorator to time the execution of a function."""
-
-    def wrapper(*args, **kwargs):
-        start_time = timeit.default_timer()
-        result = f(*args, **kwargs)
-        end_time = timeit.default_timer()
-        print(f"Function {f.__name__} took {end_time - start_time:.6f} seconds")
-        return result
-
-    return wrapper
-
-
 ##################### </UTILS> #####################
 
 
@@ -80,6 +71,11 @@ def part_one(data: list[str]):
 def part_two(data: list[str]): ...
 
 
+def load_input(filename: str, test: bool = False) -> list[str]:
+    with open(filename) as f:
+        return f.read().strip().split(",")
+
+
 if __name__ == "__main__":
     args = parser.parse_args()
     filename: str
@@ -91,8 +87,7 @@ if __name__ == "__main__":
         filename = "./input.txt"
         print("Running 2025/2 solution on full input.")
 
-    with open(filename) as f:
-        raw_data = f.read().strip().split(",")
+    raw_data = load_input(filename, args.test)
 
     first_answer = part_one(raw_data)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
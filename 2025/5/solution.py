@@ -2,8 +2,11 @@
 
 import argparse
 import logging
-from typing import Callable
-import timeit
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments, timed  # noqa: E402
 
 #####################  <UTILS> #####################
 
@@ -11,19 +14,6 @@ parser = argparse.ArgumentParser(description="Solution for Advent of Code 5/2025
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
 
-def timed(f: Callable) -> Callable:
-    """Decorator to time the execution of a function."""
-
-    def wrapper(*args, **kwargs):
-        start_time = timeit.default_timer()
-        result = f(*args, **kwargs)
-        end_time = timeit.default_timer()
-        print(f"Function {f.__name__} took {end_time - start_time:.6f} seconds")
-        return result
-
-    return wrapper
-
-
 ##################### </UTILS> #####################
 
 
@@ -54,6 +44,17 @@ def part_one(ranges: list[str], id_list: list[str]) -> int:
 def part_two(ranges: list[str]) -> int: ...
 
 
+def load_input(filename: str, test: bool = False) -> Arguments:
+    with open(filename) as file:
+        contents = file.read()
+        ranges_str, id_str = contents.split("\n\n")
+
+        ranges_data = ranges_str.split("\n")
+        id_data = id_str.split("\n")
+
+    return Arguments(part_one=(ranges_data, id_data), part_two=(ranges_data,))
+
+
 if __name__ == "__main__":
     cli_args = parser.parse_args()
     filename: str
@@ -65,14 +66,9 @@ if __name__ == "__main__":
         filename = "./input.txt"
         print("Running 2025/5 solution on full input.")
 
-    with open(filename) as file:
-        contents = file.read()
-        ranges_str, id_str = contents.split("\n\n")
-
-        ranges_data = ranges_str.split("\n")
-        id_data = id_str.split("\n")
+    ranges_data, id_data = load_input(filename, cli_args.test).part_one
 
     first_answer = part_one(ranges_data, id_data)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
-    second_answer = part_two(ranges_data, id_data)
+    second_answer = part_two(ranges_data)
     print(f"PART TWO: The answer to part two is equal to {second_answer}.")
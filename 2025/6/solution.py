@@ -3,10 +3,14 @@
 import argparse
 import logging
 import re
+import sys
 from functools import reduce
 from operator import add, mul
+from pathlib import Path
 from typing import Callable
-import timeit
+
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import timed  # noqa: E402
 
 #####################  <UTILS> #####################
 
@@ -14,19 +18,6 @@ parser = argparse.ArgumentParser(description="Solution for Advent of Code 6/2025
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
 
-def timed(f: Callable) -> Callable:
-    """Decorator to time the execution of a function."""
-
-    def wrapper(*args, **kwargs):
-        start_time = timeit.default_timer()
-        result = f(*args, **kwargs)
-        end_time = timeit.default_timer()
-        print(f"Function {f.__name__} took {end_time - start_time:.6f} seconds")
-        return result
-
-    return wrapper
-
-
 ##################### </UTILS> #####################
 
 
@@ -96,6 +87,11 @@ def part_two(data: list[str]) -> int:
     )
 
 
+def load_input(filename: str, test: bool = False) -> list[str]:
+    with open(filename) as file:
+        return [x.rstrip("\n") for x in file.readlines()]
+
+
 if __name__ == "__main__":
     cli_args = parser.parse_args()
     filename: str
@@ -107,8 +103,7 @@ if __name__ == "__main__":
         filename = "./input.txt"
         print("Running 2025/6 solution on full input.")
 
-    with open(filename) as file:
-        raw_data = [x.rstrip("\n") for x in file.readlines()]
+    raw_data = load_input(filename, cli_args.test)
 
     first_answer = part_one(raw_data)
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
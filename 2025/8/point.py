@@ -9,13 +9,13 @@ class Point:
     y: int
     z: int
     circuit_id: int | None = None
-    _distance_cache: dict[Point, float] = field(default_factory=dict, repr=False)
+    _distance_cache: dict["Point", float] = field(default_factory=dict, repr=False)
 
     @property
     def xyz(self) -> tuple[float, float, float]:
         return self.x, self.y, self.z
 
-    def distance_to(self, other: Point) -> float:
+    def distance_to(self, other: "Point") -> float:
         if other in self._distance_cache:
             return self._distance_cache[other]
 
@@ -29,11 +29,11 @@ class Point:
     def __hash__(self):
         return hash(self.xyz)
 
-    def __ge__(self, other: Point) -> bool:
+    def __ge__(self, other: "Point") -> bool:
         return self.xyz >= other.xyz
 
-    def __gt__(self, other: Point) -> bool:
+    def __gt__(self, other: "Point") -> bool:
         return self.xyz > other.xyz
 
-    def __lt__(self, other: Point) -> bool:
+    def __lt__(self, other: "Point") -> bool:
         return self.xyz < other.xyz
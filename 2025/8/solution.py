@@ -2,15 +2,18 @@
 
 import argparse
 import logging
-from functools import cache, reduce
+import sys
+from dataclasses import dataclass
+from functools import reduce
 from operator import mul
-
-from typing import Callable
-import timeit
+from pathlib import Path
 
 from point import Point
 from circuit_tracker import CircuitTracker
 
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from aoc import Arguments, timed  # noqa: E402
+
 
 #####################  <UTILS> #####################
 
@@ -18,79 +21,60 @@ parser = argparse.ArgumentParser(description="Solution for Advent of Code 8/2025
 parser.add_argument("-t", "--test", action="store_true", help="use test input")
 
 
-def timed(f: Callable) -> Callable:
-    """Decorator to time the execution of a function."""
-
-    def wrapper(*args, **kwargs):
-        start_time = timeit.default_timer()
-        result = f(*args, **kwargs)
-        end_time = timeit.default_timer()
-        print(f"Function {f.__name__} took {end_time - start_time:.6f} seconds")
-        return result
-
-    return wrapper
-
-
 ##################### </UTILS> #####################
 
 
-@cache
-def parse_boxes(data: tuple[str]) -> list[Point]:
-    return [Point(*map(int, row.split(","))) for row in data]
+@dataclass
+class Playground:
+    boxes: list[Point]
+    # pairs of indices of the boxes, the closest pair first
+    pairs: list[tuple[int, int]]
+    connection_limit: int
 
 
-def sorted_pair[Comparable](
-    a: Comparable, b: Comparable
-) -> tuple[Comparable, Comparable]:
-    return (a, b) if a >= b else (b, a)
+def prepare(data: tuple[str], connection_limit: int) -> Playground:
+    """Sorting all the O(n^2) pairs of boxes by their distance is shared by both parts, so it's only done once."""
+    boxes = [Point(*map(int, row.split(","))) for row in data]
+    distances = sorted(
+        (box.distance_to(another_box), i, j)
+        for i, box in enumerate(boxes)
+        for j, another_box in enumerate(boxes[i + 1 :], i + 1)
+    )
+    return Playground(boxes, [(i, j) for _, i, j in distances], connection_limit)
 
 
-type DistanceDict = dict[tuple[Point, Point], float]
+def copy_context(playground: Playground) -> Playground:
+    # the parts put the boxes into circuits, the pairs are only read
+    boxes = [Point(box.x, box.y, box.z) for box in playground.boxes]
+    return Playground(boxes, playground.pairs, playground.connection_limit)
 
 
-def initialize_circuits_and_calculate_distances(
-    boxes: list[Point],
-) -> tuple[CircuitTracker, DistanceDict]:
+def initialize_circuits(boxes: list[Point]) -> CircuitTracker:
     circuits = CircuitTracker()
-    distances: DistanceDict = dict()
-
-    for i, box in enumerate(boxes, 1):
+    for box in boxes:
         circuits.add_circuit(box)
-        for another_box in boxes[i:]:
-            dict_key = sorted_pair(another_box, box)
-            if dict_key not in distances:
-                dist = box.distance_to(another_box)
-                distances[dict_key] = dist
-
-    return circuits, distances
+    return circuits
 
 
 @timed
-def part_one(data: tuple[str], connection_limit: int) -> int:
-    boxes = parse_boxes(data)
-
-    circuits, distances = initialize_circuits_and_calculate_distances(boxes)
+def part_one(playground: Playground) -> int:
+    boxes = playground.boxes
+    circuits = initialize_circuits(boxes)
 
-    sorted_pair_points = sorted(
-        ((a, b, dist) for (a, b), dist in distances.items()), key=lambda x: x[2]
-    )
-    for a, b, _ in sorted_pair_points[:connection_limit]:
-        circuits.merge_circuits(a.circuit_id, b.circuit_id)
+    for i, j in playground.pairs[: playground.connection_limit]:
+        circuits.merge_circuits(boxes[i].circuit_id, boxes[j].circuit_id)
 
     return reduce(mul, map(len, circuits.sorted()[-3:]))
 
 
 @timed
-def part_two(data: tuple[str]) -> int:
-    boxes = parse_boxes(data)
-
-    circuits, distances = initialize_circuits_and_calculate_distances(boxes)
+def part_two(playground: Playground) -> int:
+    boxes = playground.boxes
+    circuits = initialize_circuits(boxes)
 
-    sorted_pair_points = sorted(
-        ((a, b, dist) for (a, b), dist in distances.items()), key=lambda x: x[2]
-    )
     last_connected_pair: tuple[Point, Point] | None = None
-    for a, b, _ in sorted_pair_points:
+    for i, j in playground.pairs:
+        a, b = boxes[i], boxes[j]
         if a.circuit_id != b.circuit_id:
             circuits.merge_circuits(a.circuit_id, b.circuit_id)
             last_connected_pair = (a, b)
@@ -103,23 +87,28 @@ def part_two(data: tuple[str]) -> int:
     return a.x * b.x
 
 
+def load_input(filename: str, test: bool = False) -> Arguments:
+    with open(filename) as file:
+        raw_data = tuple(x.strip() for x in file.readlines())
+
+    limit = 10 if test else 1000
+    return Arguments.shared(raw_data, limit)
+
+
 if __name__ == "__main__":
     cli_args = parser.parse_args()
     filename: str
     if cli_args.test:
         logging.basicConfig(level=logging.DEBUG)
-        limit = 10
         filename = "./input_test.txt"
         print("Running 2025/8 solution on test input.")
     else:
-        limit = 1000
         filename = "./input.txt"
         print("Running 2025/8 solution on full input.")
 
-    with open(filename) as file:
-        raw_data = tuple(x.strip() for x in file.readlines())
+    playground = prepare(*load_input(filename, cli_args.test).part_one)
 
-    first_answer = part_one(raw_data, limit)
+    first_answer = part_one(copy_context(playground))
     print(f"PART ONE: The answer to part one is equal to {first_answer}.")
-    second_answer = part_two(raw_data)
+    second_answer = part_two(copy_context(playground))
     print(f"PART TWO: The answer to part two is equal to {second_answer}.")
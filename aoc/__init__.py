@@ -0,0 +1,35 @@
+"""Shared tooling for running, timing and inspecting the Advent of Code solutions in this repository."""
+
+from aoc.day import (
+    Arguments,
+    Day,
+    discover_days,
+    load_arguments,
+    read_lines,
+    solution_module,
+    stream_chunks,
+    stream_lines,
+    stream_records,
+    streaming,
+)
+from aoc.runner import DayResult, PartResult, run_day, run_days
+from aoc.timing import Statistics, timed
+
+__all__ = [
+    "Arguments",
+    "Day",
+    "DayResult",
+    "PartResult",
+    "Statistics",
+    "discover_days",
+    "load_arguments",
+    "read_lines",
+    "run_day",
+    "run_days",
+    "solution_module",
+    "stream_chunks",
+    "stream_lines",
+    "stream_records",
+    "streaming",
+    "timed",
+]
@@ -0,0 +1,121 @@
+"""
+Solving a day for many inputs in one go, e.g. everyone's inputs or a pile of generated ones: the solution is imported
+once per process instead of once per input, and the results stream out as JSON lines, followed by the throughput.
+
+    {"input": "inputs/alice.txt", "seconds": 0.012, "part_one": {"answer": "42", "seconds": 0.004}, ...}
+    {"summary": {"inputs": 120, "failed": 0, "seconds": 1.9, "inputs_per_second": 63.2}}
+"""
+
+import contextlib
+import io
+import json
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+from aoc.day import PARTS, PREPARE, Day, solution_module
+from aoc.runner import PartResult, run_part, run_prepare
+
+# the solution each pool worker imported, kept imported for the rest of the worker's life
+_worker_imports = contextlib.ExitStack()
+_worker_module = None
+
+
+def input_files(paths: Iterable[str | Path]) -> list[Path]:
+    """The given files, with the directories replaced by the files in them (sorted), all as absolute paths."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(child.resolve() for child in path.iterdir() if child.is_file()))
+        else:
+            files.append(path.resolve())
+    return files
+
+
+def _stage_to_dict(stage: PartResult) -> dict[str, Any]:
+    if stage.error:
+        return {"error": stage.error}
+    if stage.answer is None:
+        # the prepare stage has no answer
+        return {"seconds": stage.seconds}
+    return {"answer": stage.answer, "seconds": stage.seconds}
+
+
+def solve_input(module, input_file: Path, test: bool = False) -> dict[str, Any]:
+    """Solves both parts of an imported solution for the input, each on its own freshly loaded copy of it."""
+    start_time = timeit.default_timer()
+    entry: dict[str, Any] = {"input": str(input_file)}
+    with contextlib.redirect_stdout(io.StringIO()):
+        prepared = None
+        if hasattr(module, PREPARE):
+            prepare, prepared = run_prepare(module, input_file, test, 0, 1, None)
+            entry[PREPARE] = _stage_to_dict(prepare)
+        for part in PARTS:
+            result = run_part(module, part, input_file, test, 0, 1, False, None, prepared=prepared)
+            entry[part] = _stage_to_dict(result)
+    entry["seconds"] = timeit.default_timer() - start_time
+    return entry
+
+
+def _init_worker(day: Day):
+    global _worker_module
+    _worker_module = _worker_imports.enter_context(solution_module(day))
+
+
+def _solve_in_worker(input_file: Path, test: bool) -> dict[str, Any]:
+    return solve_input(_worker_module, input_file, test)
+
+
+def solve_batch(day: Day, inputs: list[Path], test: bool = False, workers: int = 1) -> Iterator[dict[str, Any]]:
+    """
+    Solves the day for each of the inputs, in this process or spread over a pool of worker processes.
+
+    :param day: day to solve
+    :param inputs: input files, absolute (the solution runs from its own directory)
+    :param test: passed to the day's `load_input`, for the days whose parameters differ for the test inputs
+    :param workers: size of the process pool, 1 solves them all in this process
+    :return: an entry per input, in the order of the inputs
+    """
+    if workers == 1:
+        with solution_module(day) as module:
+            for input_file in inputs:
+                yield solve_input(module, input_file, test)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(day,)) as executor:
+        # bigger chunks pay less for shipping the work to the workers, small ones keep them evenly busy
+        chunksize = max(1, len(inputs) // (workers * 4))
+        yield from executor.map(_solve_in_worker, inputs, [test] * len(inputs), chunksize=chunksize)
+
+
+def failed(entry: dict[str, Any]) -> bool:
+    return any("error" in entry[stage] for stage in (PREPARE, *PARTS) if stage in entry)
+
+
+def write_batch(
+    day: Day, paths: Iterable[str | Path], output: TextIO, test: bool = False, workers: int = 1
+) -> dict[str, Any]:
+    """
+    Solves the day for the inputs (files or directories of them), writing a JSON line per input as soon as it's
+    solved and a last one with the throughput.
+
+    :return: the summary
+    """
+    inputs = input_files(paths)
+    start_time = timeit.default_timer()
+    failures = 0
+    for entry in solve_batch(day, inputs, test, workers):
+        failures += failed(entry)
+        output.write(json.dumps(entry) + "\n")
+        output.flush()
+
+    seconds = timeit.default_timer() - start_time
+    summary = {
+        "inputs": len(inputs),
+        "failed": failures,
+        "seconds": seconds,
+        "inputs_per_second": len(inputs) / seconds if seconds else 0.0,
+    }
+    output.write(json.dumps({"summary": summary}) + "\n")
+    return summary
@@ -0,0 +1,148 @@
+"""Storing benchmark results as JSON and comparing them against a baseline."""
+
+import json
+import platform
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+from aoc.day import ROOT
+from aoc.runner import DayResult
+
+BENCHMARK_DIR = ROOT / "benchmarks"
+METRICS = ("median", "peak_memory")
+# the counters of the parts benchmarked with --stats are compared too, as "counter:<name>" metrics
+COUNTER_PREFIX = "counter:"
+
+
+@dataclass
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    def __str__(self):
+        return (
+            f"{self.key} ({self.metric}): {_format_metric(self.metric, self.baseline)} -> "
+            f"{_format_metric(self.metric, self.current)} ({self.ratio - 1:+.1%})"
+        )
+
+
+def _format_metric(metric: str, value: float) -> str:
+    if metric == "peak_memory":
+        return f"{value / 1024:.1f} KiB"
+    if metric.startswith(COUNTER_PREFIX):
+        return str(value)
+    return f"{value:.6f}s"
+
+
+def current_commit() -> str | None:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return output.stdout.strip()
+
+
+def results_to_json(results: list[DayResult], test: bool, warmup: int, repeat: int) -> dict:
+    """
+    Converts benchmarked days into a JSON-serializable dict, with the parts keyed as "year/day/part" (and the prepare
+    stages of the days that have one as "year/day/prepare").
+    """
+    parts = {}
+    for day_result in results:
+        for part in day_result.stages:
+            if part.error or part.statistics is None:
+                continue
+            parts[f"{day_result.day.name}/{part.part}"] = {
+                "answer": part.answer,
+                **part.statistics.to_dict(),
+                **(part.memory.to_dict() if part.memory else {}),
+                **({"counts": part.counts.to_dict()} if part.counts else {}),
+            }
+
+    return {
+        "commit": current_commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "test": test,
+        "warmup": warmup,
+        "repeat": repeat,
+        "parts": parts,
+    }
+
+
+def default_output_path(benchmark: dict) -> Path:
+    name = benchmark["commit"] or benchmark["created"].replace(":", "-")
+    return BENCHMARK_DIR / f"{name}{'-test' if benchmark['test'] else ''}.json"
+
+
+def save(benchmark: dict, path: str | Path) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(benchmark, file, indent=2)
+
+    return path
+
+
+def load(path: str | Path) -> dict:
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare(current: dict, baseline: dict, threshold: float, metrics: tuple[str, ...] = METRICS) -> list[Regression]:
+    """
+    Finds the parts that got slower (or hungrier, or did more work) than the baseline by more than the threshold.
+    Metrics missing from either of the benchmarks, e.g. the peak memory of a run without `--memory`, are skipped.
+
+    :param current: benchmark to check
+    :param baseline: benchmark to compare against
+    :param threshold: allowed relative growth, e.g. 0.1 for 10%
+    :param metrics: which values of the parts to compare
+    :return: regressions, the worst first
+    """
+    regressions = []
+    for key, part in current["parts"].items():
+        baseline_part = baseline["parts"].get(key, {})
+        values = [(metric, baseline_part.get(metric), part.get(metric)) for metric in metrics]
+        baseline_counters = baseline_part.get("counts", {}).get("counters", {})
+        for name, after in part.get("counts", {}).get("counters", {}).items():
+            values.append((COUNTER_PREFIX + name, baseline_counters.get(name), after))
+
+        for metric, before, after in values:
+            if before is None or after is None:
+                continue
+            if before > 0 and after > before * (1 + threshold):
+                regressions.append(Regression(key, metric, before, after))
+
+    return sorted(regressions, key=lambda r: r.ratio, reverse=True)
+
+
+def format_table(results: list[DayResult]) -> str:
+    rows = [("PART", "MIN [s]", "MEDIAN [s]", "P95 [s]", "STDDEV [s]", "PEAK [KiB]")]
+    for day_result in results:
+        if day_result.error:
+            rows.append((day_result.day.name, f"ERROR: {day_result.error}", "", "", "", ""))
+            continue
+        for part in day_result.stages:
+            key = f"{day_result.day.name}/{part.part}"
+            if part.error or part.statistics is None:
+                rows.append((key, f"{part.exceeded or 'ERROR'}: {part.error}", "", "", "", ""))
+                continue
+            stats = part.statistics
+            peak = f"{part.memory.peak / 1024:.1f}" if part.memory else "-"
+            timings = (f"{value:.6f}" for value in (stats.min, stats.median, stats.p95, stats.stddev))
+            rows.append((key, *timings, peak))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows)
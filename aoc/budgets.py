@@ -0,0 +1,177 @@
+"""
+Wall-clock and memory budgets of the days and their parts, read from a manifest and enforced while they run, so a
+runaway solution is reported as TIMEOUT or OOM instead of blocking a run of the whole repository.
+
+The manifest (`budgets.json` at the repository root) gives the defaults and the overrides of single days:
+
+    {
+        "defaults": {"day": {"seconds": 300}, "part": {"seconds": 60, "memory_mb": 2048}},
+        "days": {
+            "2021/12": {"part_two": {"seconds": 10}},
+            "2022/15": {"day": {"seconds": 60}, "part": {"memory_mb": 512}}
+        }
+    }
+
+A part's budget (`"part"` for all the stages of a day, `"prepare"`, `"part_one"` or `"part_two"` for a single one)
+limits each run of it: the part is interrupted once it runs longer than `seconds`, and its allocations fail once it
+grows the process by more than `memory_mb`. A day's budget limits the process running the whole day, per run of its
+parts (a benchmark repeating them 10 times has 10 times as long); the process is killed once it's out of time, which
+also stops the solutions stuck in a long C call that the interruption can't reach.
+
+The interruption needs SIGALRM and the memory cap `/proc/self/statm` with `resource`, so on platforms lacking them
+the budgets are only enforced by killing the day's process.
+"""
+
+import json
+import os
+import signal
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, replace
+from pathlib import Path
+from typing import Any, Iterator
+
+from aoc.day import PARTS, PREPARE, ROOT, Day
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+BUDGETS_FILE = ROOT / "budgets.json"
+
+TIMEOUT = "TIMEOUT"
+OOM = "OOM"
+
+# seconds a day's process may take on top of its parts' budgets, for importing the solution and loading its input
+GRACE_SECONDS = 10.0
+STAGES = (PREPARE, *PARTS)
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Limits of a single run of a part, or of the process running a day; None is unlimited."""
+
+    seconds: float | None = None
+    memory_mb: float | None = None
+
+    def __bool__(self):
+        return self.seconds is not None or self.memory_mb is not None
+
+    def overridden(self, entry: dict[str, Any] | None) -> "Budget":
+        """The budget with the limits given in a manifest entry replacing its own."""
+        if not entry:
+            return self
+        unknown = set(entry) - {budget_field.name for budget_field in fields(self)}
+        if unknown:
+            raise ValueError(f"unknown budget limits: {', '.join(sorted(unknown))}")
+        return replace(self, **entry)
+
+    def __str__(self):
+        limits = []
+        if self.seconds is not None:
+            limits.append(f"{self.seconds:g}s")
+        if self.memory_mb is not None:
+            limits.append(f"{self.memory_mb:g} MiB")
+        return ", ".join(limits) or "unlimited"
+
+
+@dataclass
+class DayBudgets:
+    """Budgets of a day's process and of each of its stages."""
+
+    day: Budget = field(default_factory=Budget)
+    stages: dict[str, Budget] = field(default_factory=dict)
+
+    def __bool__(self):
+        return bool(self.day) or any(self.stages.values())
+
+    def for_stage(self, stage: str) -> Budget:
+        return self.stages.get(stage, Budget())
+
+    def deadline(self, runs: int) -> float | None:
+        """
+        Seconds the day's process may take, for the given number of runs of each part: its own budget, or the sum of
+        its stages' ones when it has none. None if neither of them is limited.
+        """
+        if self.day.seconds is not None:
+            return self.day.seconds * runs
+        stage_seconds = [self.for_stage(stage).seconds for stage in STAGES]
+        if any(seconds is None for seconds in stage_seconds):
+            return None
+        return sum(stage_seconds) * runs + GRACE_SECONDS
+
+
+class BudgetManifest:
+    def __init__(self, entries: dict[str, Any] | None = None):
+        self.entries = entries or {}
+        defaults = self.entries.get("defaults", {})
+        self.day = Budget().overridden(defaults.get("day"))
+        self.part = Budget().overridden(defaults.get("part"))
+        for name, entry in self.entries.get("days", {}).items():
+            unknown = set(entry) - {"day", "part", *STAGES}
+            if unknown:
+                raise ValueError(f"unknown budgets of {name}: {', '.join(sorted(unknown))}")
+
+    def __bool__(self):
+        return bool(self.entries)
+
+    @classmethod
+    def load(cls, path: str | Path = BUDGETS_FILE) -> "BudgetManifest":
+        """Reads the manifest, a missing one has no budgets at all."""
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        return cls(json.loads(path.read_text()))
+
+    def for_day(self, day: Day) -> DayBudgets:
+        entry = self.entries.get("days", {}).get(day.name, {})
+        part = self.part.overridden(entry.get("part"))
+        return DayBudgets(
+            day=self.day.overridden(entry.get("day")),
+            stages={stage: part.overridden(entry.get(stage)) for stage in STAGES},
+        )
+
+
+class OutOfTime(Exception):
+    """Raised into a part that ran longer than its budget."""
+
+
+def _interrupt(_signum, _frame):
+    raise OutOfTime()
+
+
+def _process_memory() -> int | None:
+    """Virtual memory size of this process in bytes, or None where it can't be read."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+@contextmanager
+def enforce(budget: Budget | None) -> Iterator[None]:
+    """
+    Runs the block within the budget: `OutOfTime` is raised into it once it runs out of time, and its allocations
+    raise `MemoryError` once the process grew by more than the memory budget. Only works in the main thread.
+    """
+    budget = budget or Budget()
+    timed = budget.seconds is not None and hasattr(signal, "setitimer")
+    capped = budget.memory_mb is not None and resource is not None and (size := _process_memory()) is not None
+    if capped:
+        limits = resource.getrlimit(resource.RLIMIT_AS)
+        cap = size + int(budget.memory_mb * 1024 * 1024)
+        # a budget within a budget (a part's within its day's) never loosens the outer one
+        cap = min([cap, *(limit for limit in limits if limit != resource.RLIM_INFINITY)])
+        resource.setrlimit(resource.RLIMIT_AS, (cap, limits[1]))
+    if timed:
+        handler = signal.signal(signal.SIGALRM, _interrupt)
+        signal.setitimer(signal.ITIMER_REAL, budget.seconds)
+    try:
+        yield
+    finally:
+        if timed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, handler)
+        if capped:
+            resource.setrlimit(resource.RLIMIT_AS, limits)
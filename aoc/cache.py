@@ -0,0 +1,269 @@
+"""
+On-disk caches: of the parsed inputs, so repeated runs and benchmark iterations don't parse the same input again, and
+of the answers, so re-running the repository only recomputes the days that changed.
+"""
+
+import copyreg
+import hashlib
+import inspect
+import io
+import json
+import logging
+import pickle
+import re
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.day import ROOT, STDIN, Day, is_streaming
+
+CACHE_DIR = ROOT / ".cache"
+INPUT_CACHE_DIR = CACHE_DIR / "inputs"
+ANSWER_CACHE_DIR = CACHE_DIR / "answers"
+
+_AOC_IMPORT = re.compile(r"^\s*(?:from|import) aoc\.(\w+)", re.MULTILINE)
+
+logger = logging.getLogger(__name__)
+
+
+def _module_files(name: str) -> list[Path]:
+    module = ROOT / "aoc" / name
+    if module.is_dir():
+        return sorted(module.rglob("*.py"))
+    file = module.with_suffix(".py")
+    return [file] if file.exists() else []
+
+
+def shared_sources(sources: list[Path]) -> list[Path]:
+    """
+    Files of the shared `aoc.<module>`s the sources import, directly or through one another (e.g. `aoc.search`
+    importing `aoc.counters`). The tooling re-exported by `aoc` itself, like `timed`, doesn't change answers and is
+    left out.
+    """
+    modules: dict[str, list[Path]] = {}
+    pending = list(sources)
+    while pending:
+        for name in _AOC_IMPORT.findall(pending.pop().read_text()):
+            if name not in modules:
+                modules[name] = _module_files(name)
+                pending.extend(modules[name])
+    return [file for name in sorted(modules) for file in modules[name]]
+
+
+def source_files(loader: Callable) -> list[Path]:
+    """
+    Python files a loader depends on: the one defining it and its siblings, which covers the helper functions and
+    the sibling modules with the classes it builds (e.g. `Forest.from_strings` in 2022/8's `forest.py`), and the
+    shared modules they import (e.g. the `aoc.grid.Grid` of 2021/9's `HeightMap`), whose classes end up pickled too.
+    """
+    directory = Path(inspect.getsourcefile(loader)).resolve().parent
+    siblings = sorted(directory.glob("*.py"))
+    return [*siblings, *shared_sources(siblings)]
+
+
+def input_key(loader: Callable, filename: str | Path, test: bool) -> str:
+    """Digest of the input's bytes and the loader's sources; it changes whenever either of them does."""
+    digest = hashlib.sha256()
+    digest.update(Path(filename).read_bytes())
+    for source in source_files(loader):
+        digest.update(source.name.encode())
+        digest.update(source.read_bytes())
+    digest.update(f"{loader.__module__}.{loader.__qualname__}:{test}:{sys.version_info[:2]}".encode())
+    return digest.hexdigest()
+
+
+def _set_attributes(instance: Any, state: dict[str, Any]):
+    for name, value in state.items():
+        object.__setattr__(instance, name, value)
+
+
+class _InputPickler(pickle.Pickler):
+    """
+    Plain pickling restores instances by filling their `__dict__` directly, which leaves them with materialized
+    dicts instead of the compact inline attributes a constructor would give them, and makes every attribute access
+    in the parts measurably slower. Instances of plain classes are restored with `setattr` instead.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        cls = type(obj)
+        if (
+            isinstance(obj, type)
+            or cls.__module__ == "builtins"
+            or any(base.__module__ == "builtins" and base is not object for base in cls.__mro__)
+            or not hasattr(obj, "__dict__")
+            or hasattr(cls, "__slots__")
+            or cls.__reduce_ex__ is not object.__reduce_ex__
+            or cls.__reduce__ is not object.__reduce__
+            or cls.__getstate__ is not object.__getstate__
+            or hasattr(cls, "__setstate__")
+        ):
+            return NotImplemented
+        return copyreg.__newobj__, (cls,), dict(vars(obj)), None, None, _set_attributes
+
+
+def _dumps(value: Any) -> bytes:
+    buffer = io.BytesIO()
+    _InputPickler(buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    return buffer.getvalue()
+
+
+@dataclass
+class _Entry:
+    parse_seconds: float
+    payload: bytes
+
+
+class InputCache:
+    """
+    Caches what the loaders return as pickles, both on disk and in memory. Every load unpickles a fresh copy, so the
+    parts can still mutate their input the same way they would mutate a freshly parsed one.
+
+    Unpickling isn't always cheaper than parsing (e.g. many small objects parsed from a short input), so each entry
+    remembers how long the parsing took, and inputs that unpickle slower than that are parsed instead. So are the
+    inputs that can't be pickled at all.
+    """
+
+    def __init__(self, directory: Path = INPUT_CACHE_DIR):
+        self.directory = directory
+        self._entries: dict[str, _Entry] = {}
+        self._bypassed: set[str] = set()
+        self._keys: dict[tuple, tuple[tuple, str]] = {}
+
+    def load(self, loader: Callable, filename: str | Path, test: bool = False) -> Any:
+        # streams are read lazily and only once, and stdin has nothing to digest up front
+        if is_streaming(loader) or str(filename) == STDIN:
+            return loader(filename, test)
+
+        key = self._key(loader, filename, test)
+        if key in self._bypassed:
+            return loader(filename, test)
+
+        entry = self._entries.get(key) or self._read(key)
+        if entry is None:
+            return self._parse(key, loader, filename, test)
+
+        try:
+            start_time = timeit.default_timer()
+            loaded = pickle.loads(entry.payload)
+        except Exception as e:
+            # e.g. written by a solution run as __main__, whose classes can't be found from the runner
+            logger.debug(f"Can't unpickle the cached input {key}, parsing it again: {e}")
+            return self._parse(key, loader, filename, test)
+
+        if timeit.default_timer() - start_time > entry.parse_seconds:
+            logger.debug(f"Unpickling {key} is slower than parsing it, it won't be loaded from the cache")
+            self._bypassed.add(key)
+        return loaded
+
+    def _key(self, loader: Callable, filename: str | Path, test: bool) -> str:
+        """`input_key`, only recomputed when the input or the sources change size or modification time."""
+        files = [Path(filename).resolve(), *source_files(loader)]
+        signature = tuple((file, file.stat().st_mtime_ns, file.stat().st_size) for file in files)
+        memo_key = (loader.__module__, loader.__qualname__, str(files[0]), test)
+        if memo_key not in self._keys or self._keys[memo_key][0] != signature:
+            self._keys[memo_key] = (signature, input_key(loader, filename, test))
+        return self._keys[memo_key][1]
+
+    def _read(self, key: str) -> _Entry | None:
+        path = self.directory / f"{key}.pickle"
+        if not path.exists():
+            return None
+
+        with open(path, "rb") as file:
+            self._entries[key] = _Entry(pickle.load(file), file.read())
+        return self._entries[key]
+
+    def _parse(self, key: str, loader: Callable, filename: str | Path, test: bool) -> Any:
+        start_time = timeit.default_timer()
+        parsed = loader(filename, test)
+        parse_seconds = timeit.default_timer() - start_time
+        try:
+            entry = self._entries[key] = _Entry(parse_seconds, _dumps(parsed))
+        except Exception as e:
+            logger.debug(f"Can't pickle the input parsed by {loader.__qualname__}, it won't be cached: {e}")
+            self._bypassed.add(key)
+            return parsed
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / f"{key}.pickle", "wb") as file:
+            pickle.dump(entry.parse_seconds, file)
+            file.write(entry.payload)
+        return parsed
+
+
+def cached_load(loader: Callable, filename: str | Path, test: bool = False) -> Any:
+    """Loads the input through the on-disk cache, e.g. `cached_load(load_input, filename, test)` in a solution."""
+    return InputCache().load(loader, filename, test)
+
+
+def day_key(day: Day, test: bool = False) -> str:
+    """
+    Digest of everything a day's answers depend on: its input, its Python files and the shared modules they import,
+    see `shared_sources`.
+    """
+    digest = hashlib.sha256()
+    digest.update(day.input_file(test).read_bytes())
+    sources = sorted(day.path.glob("*.py"))
+    for source in [*sources, *shared_sources(sources)]:
+        digest.update(source.relative_to(ROOT).as_posix().encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+@dataclass
+class StaleAnswers:
+    day: Day
+    test: bool
+    reason: str
+
+    def __str__(self):
+        return f"{self.day}{' (test)' if self.test else ''}: {self.reason}"
+
+
+class AnswerCache:
+    """
+    Remembers the answers and timings of the days' parts in `<year>-<day>[-test].json` files, each stored along with
+    the `day_key` it was computed for, so an entry is only used while the day and its input stay the same.
+    """
+
+    def __init__(self, directory: Path = ANSWER_CACHE_DIR):
+        self.directory = directory
+
+    def _path(self, day: Day, test: bool) -> Path:
+        return self.directory / f"{day.year}-{day.day}{'-test' if test else ''}.json"
+
+    def get(self, day: Day, test: bool = False) -> dict[str, dict] | None:
+        """
+        :return: `{part: {"answer": ..., "seconds": ...}}` if there's an up to date entry for the day, else None
+        """
+        path = self._path(day, test)
+        if not path.exists() or not day.input_file(test).exists():
+            return None
+
+        with open(path) as file:
+            entry = json.load(file)
+        return entry["parts"] if entry["key"] == day_key(day, test) else None
+
+    def store(self, day: Day, parts: dict[str, dict], test: bool = False):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self._path(day, test), "w") as file:
+            json.dump({"key": day_key(day, test), "parts": parts}, file, indent=2)
+
+    def stale(self) -> list[StaleAnswers]:
+        """Entries that won't be used anymore, because their day, its input or its sources changed."""
+        stale = []
+        for path in sorted(self.directory.glob("*.json")):
+            year, day_number, *test = path.stem.split("-")
+            day, test = Day(int(year), int(day_number)), bool(test)
+            with open(path) as file:
+                key = json.load(file)["key"]
+
+            if not day.solution.exists():
+                stale.append(StaleAnswers(day, test, "solution removed"))
+            elif not day.input_file(test).exists():
+                stale.append(StaleAnswers(day, test, f"{day.input_file(test).name} removed"))
+            elif key != day_key(day, test):
+                stale.append(StaleAnswers(day, test, "sources or input changed"))
+        return sorted(stale, key=lambda entry: (entry.day, entry.test))
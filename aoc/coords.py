@@ -0,0 +1,76 @@
+"""
+Compact two-dimensional coordinates, shared by the days that walk grids, ropes and mazes.
+
+There are two representations, both built-in numbers, so moving a point is a single arithmetic operation on
+immutable values with a cheap hash, instead of a generator building a new tuple subclass:
+
+- complex numbers `x + y*1j`, for unbounded spaces (e.g. a rope wandering off in any direction);
+- ints packed as `y * stride + x` by a `Packing`, for grids of a known width.
+
+In both, y grows downwards like the rows of an input, so NORTH is one row up.
+"""
+
+from dataclasses import dataclass, field
+
+NORTH, EAST, SOUTH, WEST = -1j, 1 + 0j, 1j, -1 + 0j
+NORTH_EAST, SOUTH_EAST, SOUTH_WEST, NORTH_WEST = NORTH + EAST, SOUTH + EAST, SOUTH + WEST, NORTH + WEST
+ORTHOGONAL = (NORTH, EAST, SOUTH, WEST)
+DIAGONAL = (NORTH_EAST, SOUTH_EAST, SOUTH_WEST, NORTH_WEST)
+ADJACENT = ORTHOGONAL + DIAGONAL
+
+
+def point(x: int, y: int) -> complex:
+    return complex(x, y)
+
+
+def xy(p: complex) -> tuple[int, int]:
+    return int(p.real), int(p.imag)
+
+
+def manhattan(a: complex, b: complex) -> int:
+    return int(abs(a.real - b.real) + abs(a.imag - b.imag))
+
+
+def sign(p: complex) -> complex:
+    """The step of at most one in each axis towards `p`, e.g. `sign(3 - 2j) == 1 - 1j`."""
+    return complex((p.real > 0) - (p.real < 0), (p.imag > 0) - (p.imag < 0))
+
+
+@dataclass(frozen=True)
+class Packing:
+    """
+    Packs the coordinates of a grid of the given width into ints. The stride is one more than the width, so stepping
+    off the east or west edge lands on a key that isn't in the grid, instead of wrapping around to the next row.
+    Stepping off the north or south edge does the same, as long as the grid is keyed by packed points only.
+    """
+
+    width: int
+    stride: int = field(init=False)
+    north: int = field(init=False)
+    east: int = field(init=False)
+    south: int = field(init=False)
+    west: int = field(init=False)
+
+    def __post_init__(self):
+        stride = self.width + 1
+        for name, value in (("stride", stride), ("north", -stride), ("east", 1), ("south", stride), ("west", -1)):
+            object.__setattr__(self, name, value)
+
+    @property
+    def orthogonal(self) -> tuple[int, int, int, int]:
+        return self.north, self.east, self.south, self.west
+
+    @property
+    def diagonal(self) -> tuple[int, int, int, int]:
+        return self.north + self.east, self.south + self.east, self.south + self.west, self.north + self.west
+
+    @property
+    def adjacent(self) -> tuple[int, ...]:
+        return self.orthogonal + self.diagonal
+
+    def pack(self, x: int, y: int) -> int:
+        return y * self.stride + x
+
+    def unpack(self, packed: int) -> tuple[int, int]:
+        y, x = divmod(packed, self.stride)
+        return x, y
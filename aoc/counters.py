@@ -0,0 +1,117 @@
+"""
+Counters and histograms of the work the solutions do in their inner loops, e.g. the nodes a search settles or the
+steps a grain of sand falls, so two versions of a part can be compared by how much they do rather than by seconds.
+
+The solutions record into the shared `counters` object:
+
+    from aoc.counters import counters
+
+    counters.count("route.copy")
+    counters.observe("sand.fall", steps)
+
+It's disabled unless the runner collects the counts (`run.py --stats`). While disabled, `count` and `observe` are a
+function that does nothing, so an instrumented loop pays one call per event; anything costly to compute only for the
+counters belongs under `if counters.enabled:`.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def _ignore(name: str, value: int = 1):
+    pass
+
+
+@dataclass
+class Histogram:
+    """Distribution of the observed values, bucketed by powers of two."""
+
+    count: int = 0
+    total: int = 0
+    min: int | None = None
+    max: int | None = None
+    # upper bound of a bucket (0, 1, 2, 4, 8, ...) -> number of values in it
+    buckets: Counter = field(default_factory=Counter)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, value: int):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.buckets[1 << (int(value) - 1).bit_length() if value > 0 else 0] += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {str(bound): self.buckets[bound] for bound in sorted(self.buckets)},
+        }
+
+    def __str__(self):
+        buckets = ", ".join(f"<={bound}: {self.buckets[bound]}" for bound in sorted(self.buckets))
+        return f"{self.count} values, mean {self.mean:.1f}, min {self.min}, max {self.max} ({buckets})"
+
+
+@dataclass
+class WorkCounts:
+    """What was recorded during a single run of a part."""
+
+    counters: dict[str, int] = field(default_factory=dict)
+    histograms: dict[str, Histogram] = field(default_factory=dict)
+
+    def __bool__(self):
+        return bool(self.counters or self.histograms)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "counters": dict(sorted(self.counters.items())),
+            "histograms": {name: self.histograms[name].to_dict() for name in sorted(self.histograms)},
+        }
+
+    def lines(self) -> list[str]:
+        return [
+            *(f"{name}: {value}" for name, value in sorted(self.counters.items())),
+            *(f"{name}: {self.histograms[name]}" for name in sorted(self.histograms)),
+        ]
+
+
+class Counters:
+    def __init__(self):
+        self.enabled = False
+        self._counts = WorkCounts()
+        # the methods are swapped rather than checking a flag, to keep the disabled calls as cheap as they get
+        self.count = self.observe = _ignore
+
+    def enable(self):
+        self.enabled = True
+        self.count, self.observe = self._count, self._observe
+
+    def disable(self):
+        self.enabled = False
+        self.count = self.observe = _ignore
+
+    def reset(self):
+        self._counts = WorkCounts()
+
+    def snapshot(self) -> WorkCounts:
+        return self._counts
+
+    def _count(self, name: str, value: int = 1):
+        counters = self._counts.counters
+        counters[name] = counters.get(name, 0) + value
+
+    def _observe(self, name: str, value: int):
+        histograms = self._counts.histograms
+        if name not in histograms:
+            histograms[name] = Histogram()
+        histograms[name].add(value)
+
+
+counters = Counters()
@@ -0,0 +1,164 @@
+"""
+A long-lived process that keeps the interpreter, the solutions and their parsed inputs warm, and runs parts on request
+over a Unix socket. Only the days whose files changed since their last run are imported again; the shared `aoc`
+modules stay as they were imported, so changes to them need a restart of the daemon.
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Iterator
+
+from aoc.cache import CACHE_DIR, InputCache
+from aoc.day import PARTS, Day, solution_module
+from aoc.runner import PartResult, run_part
+
+SOCKET_PATH = CACHE_DIR / "daemon.sock"
+
+
+@dataclass
+class _WarmDay:
+    """An imported solution along with its sibling modules and the state of the files it was imported from."""
+
+    module: ModuleType
+    modules: dict[str, ModuleType]
+    signature: tuple
+
+
+def _signature(day: Day) -> tuple:
+    return tuple((path.name, path.stat().st_mtime_ns, path.stat().st_size) for path in sorted(day.path.glob("*.py")))
+
+
+@contextlib.contextmanager
+def _inside(day: Day, warm: _WarmDay) -> Iterator[None]:
+    """Puts a warm day back where `solution_module` had it: in its directory, with its siblings importable."""
+    day_path = str(day.path)
+    previous_cwd = os.getcwd()
+    sys.path.insert(0, day_path)
+    sys.modules.update(warm.modules)
+    os.chdir(day_path)
+    try:
+        yield
+    finally:
+        os.chdir(previous_cwd)
+        sys.path.remove(day_path)
+        for name in warm.modules:
+            sys.modules.pop(name, None)
+
+
+class SolutionServer(socketserver.UnixStreamServer):
+    """
+    Serves one JSON request per connection, one at a time (the solutions run in the server's working directory).
+
+    Requests look like `{"day": "2023/19", "parts": ["part_one"], "test": false, "repeat": 1}` and are answered with
+    `{"day": ..., "reloaded": ..., "parts": [<PartResult as a dict>, ...]}` or `{"error": ...}`. `{"command": "stop"}`
+    shuts the server down.
+    """
+
+    def __init__(self, path: Path = SOCKET_PATH):
+        self.warm_days: dict[Day, _WarmDay] = {}
+        self.input_cache = InputCache()
+        self.stopping = False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.unlink(missing_ok=True)
+        super().__init__(str(path), _RequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        Path(self.server_address).unlink(missing_ok=True)
+
+    def warm(self, day: Day) -> tuple[_WarmDay, bool]:
+        """:return: the day's solution, imported again if any of its files changed, and whether it was"""
+        signature = _signature(day)
+        warm = self.warm_days.get(day)
+        if warm is not None and warm.signature == signature:
+            return warm, False
+
+        with contextlib.redirect_stdout(io.StringIO()), solution_module(day) as module:
+            modules = {
+                name: loaded
+                for name, loaded in sys.modules.items()
+                if Path(getattr(loaded, "__file__", None) or "/").parent == day.path
+            }
+        self.warm_days[day] = _WarmDay(module, modules, signature)
+        return self.warm_days[day], True
+
+    def handle_request_data(self, request: dict[str, Any]) -> dict[str, Any]:
+        day = Day.from_name(request["day"])
+        test = request.get("test", False)
+        if not day.solution.exists():
+            return {"error": f"{day} has no Python solution"}
+        if not day.input_file(test).exists():
+            return {"error": f"{day} is missing {day.input_file(test).name}"}
+
+        warm, reloaded = self.warm(day)
+        with contextlib.redirect_stdout(io.StringIO()), _inside(day, warm):
+            parts = [
+                run_part(
+                    warm.module,
+                    part,
+                    day.input_file(test),
+                    test,
+                    request.get("warmup", 0),
+                    request.get("repeat", 1),
+                    False,
+                    self.input_cache,
+                )
+                for part in request.get("parts") or PARTS
+            ]
+        return {"day": day.name, "reloaded": reloaded, "parts": [_part_to_dict(part) for part in parts]}
+
+
+def _part_to_dict(part: PartResult) -> dict[str, Any]:
+    result = asdict(part)
+    result["statistics"] = part.statistics.to_dict() if part.statistics else None
+    return result
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: SolutionServer
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            if request.get("command") == "stop":
+                response = {"stopped": True}
+                self.server.stopping = True
+            else:
+                response = self.server.handle_request_data(request)
+        except Exception as e:
+            response = {"error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+def serve(path: Path = SOCKET_PATH):
+    with SolutionServer(path) as server:
+        print(f"Serving solutions on {path}, stop with Ctrl+C or `daemon.py --stop`.")
+        try:
+            while not server.stopping:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+
+
+def send(request: dict[str, Any], path: Path = SOCKET_PATH) -> dict[str, Any]:
+    """
+    Sends a request to a running daemon.
+
+    :raises ConnectionError: if no daemon is listening on the path
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ConnectionError(f"no daemon is listening on {path}") from e
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as response:
+            return json.loads(response.readline())
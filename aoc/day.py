@@ -0,0 +1,274 @@
+"""Discovery and importing of the `<year>/<day>/solution.py` modules."""
+
+import importlib.util
+import os
+import sys
+import timeit
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterator, TextIO
+
+if TYPE_CHECKING:
+    from aoc.cache import InputCache
+
+ROOT = Path(__file__).resolve().parent.parent
+PARTS = ("part_one", "part_two")
+PREPARE = "prepare"
+STDIN = "-"
+# characters in a chunk of `stream_chunks`
+CHUNK_SIZE = 1 << 20
+
+
+@dataclass(frozen=True)
+class Arguments:
+    """Positional arguments for both parts of a day, for solutions whose parts do not take the same single input."""
+
+    part_one: tuple
+    part_two: tuple
+
+    @classmethod
+    def shared(cls, *args: Any) -> "Arguments":
+        return cls(args, args)
+
+    def for_part(self, part: str) -> tuple:
+        return getattr(self, part)
+
+
+@dataclass(frozen=True, order=True)
+class Day:
+    year: int
+    day: int
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}/{self.day}"
+
+    @property
+    def path(self) -> Path:
+        return ROOT / str(self.year) / str(self.day)
+
+    @property
+    def solution(self) -> Path:
+        return self.path / "solution.py"
+
+    def input_file(self, test: bool = False) -> Path:
+        return self.path / ("input_test.txt" if test else "input.txt")
+
+    @classmethod
+    def from_name(cls, name: str) -> "Day":
+        year, day = name.strip("/").split("/")
+        return cls(int(year), int(day))
+
+    @classmethod
+    def from_path(cls, path: str | Path) -> "Day":
+        """Creates the day from its directory or from any file inside it, e.g. a solution's `__file__`."""
+        path = Path(path).resolve()
+        if path.is_file():
+            path = path.parent
+        return cls(int(path.parent.name), int(path.name))
+
+    def __str__(self):
+        return self.name
+
+
+def discover_days(selectors: list[str] | None = None) -> list[Day]:
+    """
+    Finds every day with a Python solution, optionally narrowed down to the given selectors.
+
+    :param selectors: strings like "2022" (whole year) or "2022/9" (single day); all days are returned if empty
+    :return: the matching days, in chronological order
+    """
+    days = sorted(
+        Day(int(solution.parent.parent.name), int(solution.parent.name))
+        for solution in ROOT.glob("*/*/solution.py")
+        if solution.parent.name.isdigit() and solution.parent.parent.name.isdigit()
+    )
+    if not selectors:
+        return days
+
+    return [day for day in days if any(_matches(day, selector) for selector in selectors)]
+
+
+def _matches(day: Day, selector: str) -> bool:
+    year, _, day_number = selector.strip("/").partition("/")
+    return int(year) == day.year and (not day_number or int(day_number) == day.day)
+
+
+@contextmanager
+def solution_module(day: Day) -> Iterator[ModuleType]:
+    """
+    Imports the day's solution the same way `python solution.py` run from its directory would see it: with the day's
+    directory as the working directory and on `sys.path`, so the relative input paths and sibling imports
+    (e.g. `from rope import Knot`) keep working. Sibling modules are forgotten on exit, since many days share module
+    names like `grid` or `parser`.
+    """
+    day_path = str(day.path)
+    module_name = f"aoc_solution_{day.year}_{day.day}"
+    previous_cwd = os.getcwd()
+
+    sys.path.insert(0, day_path)
+    os.chdir(day_path)
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, day.solution)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        os.chdir(previous_cwd)
+        sys.path.remove(day_path)
+        for name, loaded in list(sys.modules.items()):
+            module_file = getattr(loaded, "__file__", None)
+            if name == module_name or (module_file and Path(module_file).parent == day.path):
+                del sys.modules[name]
+
+
+def streaming(loader: Callable) -> Callable:
+    """
+    Marks an input loader as returning a one-shot stream rather than the parsed input. Streams are never cached, and
+    every part gets a stream of its own.
+    """
+    loader.streaming = True
+    return loader
+
+
+def is_streaming(loader: Callable) -> bool:
+    return getattr(loader, "streaming", False)
+
+
+@contextmanager
+def open_input(filename: str | Path) -> Iterator[TextIO]:
+    """Opens the input file, or stdin if the filename is "-"."""
+    if str(filename) == STDIN:
+        yield sys.stdin
+        return
+
+    with open(filename) as file:
+        yield file
+
+
+def read_lines(filename: str | Path, test: bool = False) -> list[str]:
+    """The default input loader: the input file split into stripped lines."""
+    with open_input(filename) as file:
+        return [x.strip() for x in file.readlines()]
+
+
+@streaming
+def stream_lines(filename: str | Path, test: bool = False) -> Iterator[str]:
+    """
+    The streaming input loader: the stripped lines of the input file, read lazily one at a time. Single-pass days use
+    it as their `load_input` (`load_input = stream_lines`) to run in constant memory, whatever the size of the input.
+    """
+    with open_input(filename) as file:
+        for line in file:
+            yield line.strip()
+
+
+@streaming
+def stream_chunks(filename: str | Path, test: bool = False, size: int = CHUNK_SIZE) -> Iterator[str]:
+    """
+    The chunked streaming input loader: the input file in chunks of whole lines, about `size` characters each, read
+    lazily. Days that scan their input with a regex use it to run one `finditer` per chunk instead of a match per line,
+    in bounded memory, and can hand the chunks out to a process pool.
+    """
+    with open_input(filename) as file:
+        while chunk := file.read(size):
+            # the chunk is completed up to the end of the line it stopped in
+            yield chunk + file.readline()
+
+
+@streaming
+def stream_records(filename: str | Path, test: bool = False) -> Iterator[str]:
+    """
+    The streaming input loader of the inputs made of records separated by blank lines: each record as its stripped
+    lines joined by newlines, read lazily, so only one record is in memory at a time.
+    """
+    with open_input(filename) as file:
+        record = []
+        for line in file:
+            if line := line.strip():
+                record.append(line)
+            elif record:
+                yield "\n".join(record)
+                record = []
+        if record:
+            yield "\n".join(record)
+
+
+def load_arguments(
+    module: ModuleType, filename: str | Path, test: bool = False, cache: "InputCache | None" = None
+) -> Arguments:
+    """
+    Loads the day's input with its `load_input(filename, test)` hook, or as stripped lines if it doesn't define one.
+
+    :param module: an imported solution module
+    :param filename: the input file to load
+    :param test: whether the input is the test one, for days whose parameters differ between inputs
+    :param cache: parsed-input cache to load through, the input is parsed from scratch without one
+    :return: positional arguments for both parts
+    """
+    loader = getattr(module, "load_input", read_lines)
+    loaded = cache.load(loader, filename, test) if cache else loader(filename, test)
+    if isinstance(loaded, Arguments):
+        return loaded
+
+    return Arguments.shared(loaded)
+
+
+@dataclass
+class Prepared:
+    """What a day's `prepare` hook made of its input, and how long it took (in seconds)."""
+
+    context: Any
+    seconds: float
+
+    def arguments(self, module: ModuleType) -> Arguments:
+        """
+        Arguments of the parts: the context, or a copy of it made by the day's `copy_context(context)` hook for days
+        whose parts mutate it. The context may also be an `Arguments` itself, for parts taking different arguments.
+        """
+        copy_context = getattr(module, "copy_context", None)
+        context = copy_context(self.context) if copy_context else self.context
+        return context if isinstance(context, Arguments) else Arguments.shared(context)
+
+
+def prepare_input(
+    module: ModuleType, filename: str | Path, test: bool = False, cache: "InputCache | None" = None
+) -> Prepared | None:
+    """
+    Runs the day's `prepare(*input) -> context` hook, the work both parts share (e.g. parsing or sorting), so it's
+    done once per input instead of in each part. Its input is what `load_arguments` loads, it must be the same for
+    both parts.
+
+    :return: the context, or None if the day has no `prepare` hook
+    """
+    prepare = getattr(module, PREPARE, None)
+    if prepare is None:
+        return None
+
+    arguments = load_arguments(module, filename, test, cache)
+    if arguments.part_one is not arguments.part_two:
+        raise ValueError("prepare needs an input shared by both parts, load_input should return Arguments.shared(...)")
+
+    start_time = timeit.default_timer()
+    context = prepare(*arguments.part_one)
+    return Prepared(context, timeit.default_timer() - start_time)
+
+
+def part_arguments(
+    module: ModuleType,
+    part: str,
+    filename: str | Path,
+    test: bool = False,
+    cache: "InputCache | None" = None,
+    prepared: Prepared | None = None,
+) -> tuple:
+    """
+    Fresh arguments for a run of a part: the `prepared` context of a day with a `prepare` hook (see
+    `Prepared.arguments`), or the freshly loaded input otherwise.
+    """
+    if prepared is not None:
+        return prepared.arguments(module).for_part(part)
+    return load_arguments(module, filename, test, cache).for_part(part)
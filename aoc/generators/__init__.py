@@ -0,0 +1,52 @@
+"""
+Seeded generators of synthetic inputs, one per day, for measuring how the solutions scale with the size of their input.
+
+The same day, scale and seed always produce the same input, whatever the platform or `PYTHONHASHSEED`. The generated
+inputs are written to .cache/generated/, named after the digest of the generators' sources, so editing a generator
+makes fresh ones.
+"""
+
+import hashlib
+import random
+from pathlib import Path
+
+from aoc.cache import CACHE_DIR
+from aoc.day import Day
+# importing the years registers their generators
+from aoc.generators import year2020, year2021, year2022, year2023, year2024, year2025  # noqa: F401
+from aoc.generators.common import GENERATORS, Generator, generator
+
+GENERATED_DIR = CACHE_DIR / "generated"
+SCALES = (1, 10, 100, 1000)
+_SOURCES = sorted(Path(__file__).parent.glob("*.py"))
+
+__all__ = ["GENERATED_DIR", "GENERATORS", "SCALES", "Generator", "generate", "generated_input", "generator"]
+
+
+def generate(day: Day, scale: int, seed: int = 0) -> str:
+    """
+    :param day: day to generate an input for
+    :param scale: size of the input relative to the real one, e.g. 10 for ten times as many lines
+    :param seed: which of the day's inputs of that scale to generate
+    :return: text of the input, ending with a newline if the day's real input does
+    """
+    if day not in GENERATORS:
+        raise ValueError(f"There is no input generator for {day}.")
+
+    text = GENERATORS[day](random.Random(f"{day.name}/{scale}/{seed}"), scale)
+    real_input = day.input_file()
+    if real_input.exists() and real_input.read_bytes().endswith(b"\n"):
+        text += "\n"
+    return text
+
+
+def generated_input(day: Day, scale: int, seed: int = 0, directory: Path = GENERATED_DIR) -> Path:
+    """Path of the generated input file, which is only generated if it doesn't exist yet."""
+    digest = hashlib.sha256(b"".join(source.read_bytes() for source in _SOURCES)).hexdigest()[:12]
+    path = directory / f"{day.year}-{day.day}-x{scale}-s{seed}-{digest}.txt"
+    if not path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(generate(day, scale, seed))
+        temporary.replace(path)
+    return path
@@ -0,0 +1,57 @@
+"""The registry of the input generators and the helpers they share."""
+
+import math
+import random
+import string
+from typing import Callable
+
+from aoc.day import Day
+
+Generator = Callable[[random.Random, int], str]
+
+GENERATORS: dict[Day, Generator] = {}
+
+
+def generator(year: int, day: int) -> Callable[[Generator], Generator]:
+    """
+    Registers a generator of the day's inputs. It's given a seeded `random.Random` to draw everything from and the
+    scale of the input, relative to the real one (1 is roughly the size of a real input), and returns its text.
+    """
+
+    def register(func: Generator) -> Generator:
+        GENERATORS[Day(year, day)] = func
+        return func
+
+    return register
+
+
+def scaled(base: int, scale: int) -> int:
+    """Size of an input that grows linearly, e.g. its number of lines."""
+    return max(1, base * scale)
+
+
+def side(base: int, scale: int) -> int:
+    """Side of a two-dimensional input whose area grows `scale` times."""
+    return max(1, round(base * math.sqrt(scale)))
+
+
+def grid(rng: random.Random, height: int, width: int, cells: str, weights: list[float] | None = None) -> list[str]:
+    return ["".join(rng.choices(cells, weights, k=width)) for _ in range(height)]
+
+
+def digit_grid(rng: random.Random, height: int, width: int, digits: str = string.digits) -> list[str]:
+    return grid(rng, height, width, digits)
+
+
+def word(rng: random.Random, length: int, letters: str = string.ascii_lowercase) -> str:
+    return "".join(rng.choices(letters, k=length))
+
+
+def unique_words(rng: random.Random, count: int, length: int, letters: str = string.ascii_lowercase) -> list[str]:
+    """Distinct random words; the length grows when there are not enough words of the asked one."""
+    while len(letters) ** length < 2 * count:
+        length += 1
+    words: set[str] = set()
+    while len(words) < count:
+        words.add(word(rng, length, letters))
+    return rng.sample(sorted(words), count)
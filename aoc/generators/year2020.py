@@ -0,0 +1,109 @@
+"""Generators of the 2020 inputs."""
+
+import random
+import string
+
+from aoc.generators.common import generator, grid, scaled, side, word
+
+TARGET = 2020
+
+
+@generator(2020, 1)
+def expense_report(rng: random.Random, scale: int) -> str:
+    # Two small and one big entry are planted so that exactly one pair and one triple sum to 2020; the filler is
+    # big enough to never complete a sum with anything.
+    pair_small = rng.randint(100, 900)
+    triple = [rng.randint(100, 600), rng.randint(100, 600)]
+    triple.append(TARGET - sum(triple))
+    planted = [pair_small, TARGET - pair_small, *triple]
+    small = [pair_small, *triple]
+    excluded = {TARGET - a for a in small} | {TARGET - a - b for a in small for b in small}
+
+    filler_values = [value for value in range(TARGET // 2 + 1, TARGET) if value not in excluded]
+    values = planted + rng.choices(filler_values, k=scaled(200, scale) - len(planted))
+    rng.shuffle(values)
+    return "\n".join(map(str, values))
+
+
+@generator(2020, 2)
+def passwords(rng: random.Random, scale: int) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        letter = rng.choice(string.ascii_lowercase)
+        password = word(rng, rng.randint(5, 20), string.ascii_lowercase[:8] + letter * 4)
+        low = rng.randint(1, len(password) - 1)
+        high = rng.randint(low + 1, len(password))
+        lines.append(f"{low}-{high} {letter}: {password}")
+    return "\n".join(lines)
+
+
+@generator(2020, 3)
+def trees(rng: random.Random, scale: int) -> str:
+    rows = grid(rng, side(323, scale), side(31, scale), ".#", [3, 1])
+    return "\n".join("." + row[1:] if i == 0 else row for i, row in enumerate(rows))
+
+
+_EYE_COLORS = ["amb", "blu", "brn", "gry", "grn", "hzl", "oth"]
+
+
+def _passport_field(rng: random.Random, key: str, valid: bool) -> str:
+    valid_values = {
+        "byr": lambda: str(rng.randint(1920, 2002)),
+        "iyr": lambda: str(rng.randint(2010, 2020)),
+        "eyr": lambda: str(rng.randint(2020, 2030)),
+        "hgt": lambda: rng.choice([f"{rng.randint(150, 193)}cm", f"{rng.randint(59, 76)}in"]),
+        "hcl": lambda: f"#{rng.randrange(16**6):06x}",
+        "ecl": lambda: rng.choice(_EYE_COLORS),
+        "pid": lambda: f"{rng.randrange(10**9):09d}",
+        "cid": lambda: str(rng.randint(50, 350)),
+    }
+    invalid_values = {
+        "byr": lambda: str(rng.randint(2003, 2030)),
+        "iyr": lambda: str(rng.randint(1990, 2009)),
+        "eyr": lambda: str(rng.randint(2031, 2040)),
+        "hgt": lambda: rng.choice([f"{rng.randint(50, 149)}cm", f"{rng.randint(10, 58)}in", str(rng.randint(50, 200))]),
+        "hcl": lambda: rng.choice([f"{rng.randrange(16**6):06x}", f"#{rng.randrange(16**3):03x}z"]),
+        "ecl": lambda: rng.choice(["#123abc", "xry", "zzz"]),
+        "pid": lambda: str(rng.randrange(10**10)),
+        "cid": lambda: str(rng.randint(50, 350)),
+    }
+    return f"{key}:{(valid_values if valid else invalid_values)[key]()}"
+
+
+@generator(2020, 4)
+def passports(rng: random.Random, scale: int) -> str:
+    passports = []
+    for _ in range(scaled(290, scale)):
+        keys = [key for key in ("byr", "iyr", "eyr", "hgt", "hcl", "ecl", "pid", "cid") if rng.random() < 0.9]
+        fields = [_passport_field(rng, key, rng.random() < 0.9) for key in keys]
+        rng.shuffle(fields)
+        lines, line = [], []
+        for field in fields:
+            line.append(field)
+            if rng.random() < 0.3:
+                lines.append(" ".join(line))
+                line = []
+        passports.append("\n".join(lines + ([" ".join(line)] if line or not lines else [])))
+    return "\n\n".join(passports)
+
+
+@generator(2020, 5)
+def boarding_passes(rng: random.Random, scale: int) -> str:
+    # There are only 1024 seats, so the bigger inputs repeat some of the passes; one seat in the middle stays free.
+    first, last = rng.randint(10, 80), rng.randint(900, 1000)
+    missing = rng.randint(first + 1, last - 1)
+    seats = [seat for seat in range(first, last + 1) if seat != missing]
+    seats += rng.choices(seats, k=max(0, scaled(874, scale) - len(seats)))
+    rng.shuffle(seats)
+    rows, columns = str.maketrans("01", "FB"), str.maketrans("01", "LR")
+    return "\n".join(f"{seat >> 3:07b}".translate(rows) + f"{seat & 7:03b}".translate(columns) for seat in seats)
+
+
+@generator(2020, 6)
+def customs_answers(rng: random.Random, scale: int) -> str:
+    groups = []
+    for _ in range(scaled(490, scale)):
+        common = rng.sample(string.ascii_lowercase, rng.randint(0, 8))
+        people = [common + rng.sample(string.ascii_lowercase, rng.randint(0, 6)) for _ in range(rng.randint(1, 5))]
+        groups.append("\n".join("".join(rng.sample(sorted(set(person)), len(set(person)))) or "a" for person in people))
+    return "\n\n".join(groups)
@@ -0,0 +1,218 @@
+"""Generators of the 2021 inputs."""
+
+import math
+import random
+from collections import deque
+import string
+
+from aoc.generators.common import digit_grid, generator, scaled, side, unique_words
+
+
+@generator(2021, 1)
+def depths(rng: random.Random, scale: int) -> str:
+    depth, values = 150, []
+    for _ in range(scaled(2000, scale)):
+        depth = max(0, depth + rng.randint(-8, 12))
+        values.append(depth)
+    return "\n".join(map(str, values))
+
+
+@generator(2021, 2)
+def course(rng: random.Random, scale: int) -> str:
+    commands = rng.choices(["forward", "down", "up"], [2, 2, 1], k=scaled(1000, scale))
+    return "\n".join(f"{command} {rng.randint(1, 9)}" for command in commands)
+
+
+@generator(2021, 3)
+def diagnostic_report(rng: random.Random, scale: int) -> str:
+    # The ratings are found by filtering the numbers down to a single one, so they have to be unique, and the numbers
+    # left by the filters must never all agree on a bit, which is retried until it holds (like in the real inputs).
+    count = scaled(1000, scale)
+    width = 12 + math.ceil(math.log2(scale))
+    while True:
+        numbers = [f"{number:0{width}b}" for number in rng.sample(range(2**width), count)]
+        if all(_filters_split(numbers, keep_most) for keep_most in (True, False)):
+            return "\n".join(numbers)
+
+
+def _filters_split(numbers: list[str], keep_most: bool) -> bool:
+    for i in range(len(numbers[0])):
+        if len(numbers) == 1:
+            return True
+        ones = [number for number in numbers if number[i] == "1"]
+        zeros = [number for number in numbers if number[i] == "0"]
+        if not ones or not zeros:
+            return False
+        numbers = ones if (len(ones) >= len(zeros)) == keep_most else zeros
+    return len(numbers) == 1
+
+
+@generator(2021, 4)
+def bingo(rng: random.Random, scale: int) -> str:
+    draws = rng.sample(range(100), 100)
+    boards = []
+    for _ in range(scaled(100, scale)):
+        numbers = rng.sample(range(100), 25)
+        boards.append("\n".join(" ".join(f"{n:2}" for n in numbers[row * 5 : row * 5 + 5]) for row in range(5)))
+    return ",".join(map(str, draws)) + "\n\n" + "\n\n".join(boards)
+
+
+@generator(2021, 5)
+def vents(rng: random.Random, scale: int) -> str:
+    size = side(1000, scale)
+    lines = []
+    for _ in range(scaled(500, scale)):
+        x1, y1 = rng.randrange(size), rng.randrange(size)
+        direction = rng.choice(["horizontal", "vertical", "diagonal"])
+        if direction == "horizontal":
+            x2, y2 = rng.randrange(size), y1
+        elif direction == "vertical":
+            x2, y2 = x1, rng.randrange(size)
+        else:
+            dx, dy = rng.choice([-1, 1]), rng.choice([-1, 1])
+            reach = min(
+                size - 1 - x1 if dx > 0 else x1,
+                size - 1 - y1 if dy > 0 else y1,
+            )
+            length = rng.randint(0, reach)
+            x2, y2 = x1 + dx * length, y1 + dy * length
+        lines.append(f"{x1},{y1} -> {x2},{y2}")
+    return "\n".join(lines)
+
+
+@generator(2021, 6)
+def lanternfish(rng: random.Random, scale: int) -> str:
+    return ",".join(str(rng.randint(1, 5)) for _ in range(scaled(300, scale)))
+
+
+@generator(2021, 7)
+def crabs(rng: random.Random, scale: int) -> str:
+    return ",".join(str(int(rng.expovariate(1 / (500 * scale)))) for _ in range(scaled(1000, scale)))
+
+
+_DIGITS = ["abcefg", "cf", "acdeg", "acdfg", "bcdf", "abdfg", "abdefg", "acf", "abcdefg", "abcdfg"]
+
+
+@generator(2021, 8)
+def seven_segments(rng: random.Random, scale: int) -> str:
+    lines = []
+    for _ in range(scaled(200, scale)):
+        wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+        patterns = ["".join(rng.sample([wiring[segment] for segment in digit], len(digit))) for digit in _DIGITS]
+        outputs = ["".join(rng.sample(pattern, len(pattern))) for pattern in rng.choices(patterns, k=4)]
+        lines.append(f"{' '.join(rng.sample(patterns, 10))} | {' '.join(outputs)}")
+    return "\n".join(lines)
+
+
+@generator(2021, 9)
+def heightmap(rng: random.Random, scale: int) -> str:
+    # The basins grow from random low points until they meet, and the 9s are the ridges between them. Randomly placed
+    # 9s would leave a single basin spanning the whole map, instead of the small ones of the real heightmaps.
+    size = side(100, scale)
+    owner = [[-1] * size for _ in range(size)]
+    depth = [[0] * size for _ in range(size)]
+    frontier = deque()
+    for basin in range(scaled(200, scale)):
+        y, x = rng.randrange(size), rng.randrange(size)
+        if owner[y][x] == -1:
+            owner[y][x] = basin
+            frontier.append((y, x))
+    while frontier:
+        y, x = frontier.popleft()
+        for ny, nx in ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1)):
+            if 0 <= ny < size and 0 <= nx < size and owner[ny][nx] == -1:
+                owner[ny][nx], depth[ny][nx] = owner[y][x], depth[y][x] + 1
+                frontier.append((ny, nx))
+
+    rows = []
+    for y in range(size):
+        row = []
+        for x in range(size):
+            neighbours = ((y - 1, x), (y + 1, x), (y, x - 1), (y, x + 1))
+            ridge = any(0 <= ny < size and 0 <= nx < size and owner[ny][nx] != owner[y][x] for ny, nx in neighbours)
+            row.append("9" if ridge else str(min(depth[y][x], 8)))
+        rows.append("".join(row))
+    return "\n".join(rows)
+
+
+_BRACKETS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+@generator(2021, 10)
+def navigation(rng: random.Random, scale: int) -> str:
+    lines = []
+    for _ in range(scaled(100, scale)):
+        stack, line = [], []
+        corrupted = rng.random() < 0.5
+        for _ in range(rng.randint(90, 110)):
+            if stack and rng.random() < 0.45:
+                line.append(_BRACKETS[stack.pop()])
+            else:
+                stack.append(rng.choice("([{<"))
+                line.append(stack[-1])
+        if corrupted and stack:
+            wrong = [closing for closing in _BRACKETS.values() if closing != _BRACKETS[stack[-1]]]
+            line.append(rng.choice(wrong))
+        lines.append("".join(line))
+    return "\n".join(lines)
+
+
+@generator(2021, 11)
+def octopuses(rng: random.Random, scale: int) -> str:
+    size = side(10, scale)
+    return "\n".join(digit_grid(rng, size, size))
+
+
+@generator(2021, 12)
+def caves(rng: random.Random, scale: int) -> str:
+    # big caves are never connected to each other, otherwise there would be infinitely many paths
+    small = [name for name in unique_words(rng, scaled(6, scale) + 1, 2) if name != "end"][: scaled(6, scale)]
+    big = [name.upper() for name in unique_words(rng, scaled(3, scale), 2)]
+    passages = set()
+    for cave in rng.sample(small, 2):
+        passages.add(("start", cave))
+    for cave in rng.sample(small + big, 3):
+        passages.add((cave, "end"))
+    for cave in small:
+        for neighbour in rng.sample(small + big, 2):
+            if neighbour != cave:
+                passages.add((cave, neighbour))
+    return "\n".join(f"{a}-{b}" if rng.random() < 0.5 else f"{b}-{a}" for a, b in sorted(passages))
+
+
+@generator(2021, 13)
+def transparent_paper(rng: random.Random, scale: int) -> str:
+    # every fold is exactly in the middle of what's left of the paper, down to a 40x6 code
+    fold_lines = {"x": [40], "y": [6]}
+    for axis, count in (("x", 5), ("y", 7)):
+        for _ in range(count - 1 + math.ceil(math.log2(math.sqrt(scale)))):
+            fold_lines[axis].append(2 * fold_lines[axis][-1] + 1)
+    width, height = (2 * fold_lines[axis][-1] + 1 for axis in "xy")
+
+    dots = set()
+    while len(dots) < scaled(900, scale):
+        x, y = rng.randrange(width), rng.randrange(height)
+        if x not in fold_lines["x"] and y not in fold_lines["y"]:
+            dots.add((x, y))
+
+    # like in the real inputs, the axes take turns, starting with the biggest folds
+    xs, ys = fold_lines["x"][::-1], fold_lines["y"][::-1]
+    folds = []
+    for i in range(max(len(xs), len(ys))):
+        folds += [f"fold along x={xs[i]}"] if i < len(xs) else []
+        folds += [f"fold along y={ys[i]}"] if i < len(ys) else []
+    return "\n".join(f"{x},{y}" for x, y in dots) + "\n\n" + "\n".join(folds)
+
+
+@generator(2021, 14)
+def polymer(rng: random.Random, scale: int) -> str:
+    elements = rng.sample(string.ascii_uppercase, 10)
+    rules = [f"{a}{b} -> {rng.choice(elements)}" for a in elements for b in elements]
+    rng.shuffle(rules)
+    return "".join(rng.choices(elements, k=scaled(20, scale))) + "\n\n" + "\n".join(rules)
+
+
+@generator(2021, 15)
+def chitons(rng: random.Random, scale: int) -> str:
+    size = side(100, scale)
+    return "\n".join(digit_grid(rng, size, size, "123456789"))
@@ -0,0 +1,313 @@
+"""Generators of the 2022 inputs."""
+
+import json
+import random
+import string
+
+from aoc.generators.common import digit_grid, generator, scaled, side, unique_words
+
+
+@generator(2022, 1)
+def calories(rng: random.Random, scale: int) -> str:
+    elves = []
+    for _ in range(scaled(250, scale)):
+        elves.append("\n".join(str(rng.randint(1000, 9999)) for _ in range(rng.randint(1, 15))))
+    return "\n\n".join(elves)
+
+
+@generator(2022, 2)
+def strategy_guide(rng: random.Random, scale: int) -> str:
+    return "\n".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(scaled(2500, scale)))
+
+
+@generator(2022, 3)
+def rucksacks(rng: random.Random, scale: int) -> str:
+    # each elf gets its own letters, so the badge is the only item the three elves of a group have in common, and the
+    # halves of each rucksack share a single item
+    letters = string.ascii_letters
+    rucksacks = []
+    for _ in range(scaled(100, scale)):
+        badge = rng.choice(letters)
+        others = rng.sample([letter for letter in letters if letter != badge], 51)
+        for pool in (others[:17], others[17:34], others[34:]):
+            shared, *rest = rng.sample(pool, len(pool))
+            split = len(rest) // 2
+            size = rng.randint(4, 15)
+            left = [shared] + rng.choices(rest[:split], k=size - 1)
+            right = [shared] + rng.choices(rest[split:], k=size - 1)
+            (left if rng.random() < 0.5 else right)[rng.randrange(1, size)] = badge
+            rucksacks.append("".join(rng.sample(left, size) + rng.sample(right, size)))
+    return "\n".join(rucksacks)
+
+
+@generator(2022, 4)
+def section_pairs(rng: random.Random, scale: int) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        ranges = []
+        for _ in range(2):
+            start = rng.randint(1, 99)
+            ranges.append(f"{start}-{rng.randint(start, 99)}")
+        lines.append(",".join(ranges))
+    return "\n".join(lines)
+
+
+@generator(2022, 5)
+def crates(rng: random.Random, scale: int) -> str:
+    # the stacks are labelled with single digits, so bigger inputs only get taller stacks and more moves
+    stacks = [rng.choices(string.ascii_uppercase, k=rng.randint(2, scaled(8, scale) + 1)) for _ in range(9)]
+    height = max(map(len, stacks))
+    rows = []
+    for level in reversed(range(height)):
+        rows.append(" ".join(f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks))
+    rows.append(" ".join(f" {i} " for i in range(1, 10)))
+
+    moves = []
+    for _ in range(scaled(500, scale)):
+        # no stack is ever emptied, the answers are made of the crates on top of each of them
+        source = rng.choice([i for i, stack in enumerate(stacks) if len(stack) > 1])
+        target = rng.choice([i for i in range(9) if i != source])
+        count = rng.randint(1, min(len(stacks[source]) - 1, 10))
+        stacks[target] += stacks[source][-count:]
+        del stacks[source][-count:]
+        moves.append(f"move {count} from {source + 1} to {target + 1}")
+    return "\n".join(rows) + "\n\n" + "\n".join(moves)
+
+
+@generator(2022, 6)
+def datastream(rng: random.Random, scale: int) -> str:
+    # the markers only show up at the very end, after a long stretch of a few repeating letters
+    length = scaled(4096, scale)
+    return "".join(rng.choices("abc", k=length - 14)) + "".join(rng.sample(string.ascii_lowercase[3:], 14))
+
+
+@generator(2022, 7)
+def terminal_output(rng: random.Random, scale: int) -> str:
+    # the directory tree is planned first, then walked depth-first the way the real sessions do
+    children: list[list[int]] = [[]]
+    depths = [0]
+    for directory in range(1, scaled(180, scale)):
+        parent = rng.choice([d for d in rng.sample(range(directory), min(directory, 5)) if depths[d] < 12] or [0])
+        children[parent].append(directory)
+        children.append([])
+        depths.append(depths[parent] + 1)
+
+    lines = ["$ cd /"]
+
+    def walk(directory: int):
+        names = unique_words(rng, len(children[directory]) + rng.randint(1, 6), 4)
+        subdirectories = dict(zip(children[directory], names))
+        directory_names = set(subdirectories.values())
+        lines.append("$ ls")
+        for name in rng.sample(names, len(names)):
+            if name in directory_names:
+                lines.append(f"dir {name}")
+            else:
+                extension = f".{rng.choice(['txt', 'dat', 'log', 'bin'])}" if rng.random() < 0.5 else ""
+                lines.append(f"{rng.randint(1000, 300000)} {name}{extension}")
+        for child, name in subdirectories.items():
+            lines.append(f"$ cd {name}")
+            walk(child)
+            lines.append("$ cd ..")
+
+    walk(0)
+    return "\n".join(lines)
+
+
+@generator(2022, 8)
+def forest(rng: random.Random, scale: int) -> str:
+    size = side(99, scale)
+    return "\n".join(digit_grid(rng, size, size))
+
+
+@generator(2022, 9)
+def rope_moves(rng: random.Random, scale: int) -> str:
+    return "\n".join(f"{rng.choice('UDLR')} {rng.randint(1, 20)}" for _ in range(scaled(2000, scale)))
+
+
+@generator(2022, 10)
+def cpu_instructions(rng: random.Random, scale: int) -> str:
+    # the sprite stays on the 40 pixels wide screen, however many rows it draws
+    x, instructions = 1, []
+    for _ in range(scaled(140, scale)):
+        if rng.random() < 0.3:
+            instructions.append("noop")
+        else:
+            value = rng.randint(max(-x, -15), min(38 - x, 15))
+            x += value
+            instructions.append(f"addx {value}")
+    return "\n".join(instructions)
+
+
+def _primes(count: int) -> list[int]:
+    limit = 100
+    while True:
+        sieve = bytearray([1]) * limit
+        sieve[:2] = b"\x00\x00"
+        for n in range(2, int(limit**0.5) + 1):
+            if sieve[n]:
+                sieve[n * n :: n] = bytes(len(range(n * n, limit, n)))
+        primes = [n for n in range(limit) if sieve[n]]
+        if len(primes) >= count:
+            return primes[:count]
+        limit *= 2
+
+
+@generator(2022, 11)
+def monkeys(rng: random.Random, scale: int) -> str:
+    count = scaled(8, scale)
+    divisors = rng.sample(_primes(max(20, 2 * count)), count)
+    squaring = rng.randrange(count)
+    descriptions = []
+    for i, divisor in enumerate(divisors):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        if i == squaring:
+            operation = "old * old"
+        else:
+            operation = f"old {rng.choice('*++')} {rng.randint(1, 19)}"
+        targets = rng.sample([j for j in range(count) if j != i], 2)
+        descriptions.append(
+            f"Monkey {i}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = {operation}\n"
+            f"  Test: divisible by {divisor}\n"
+            f"    If true: throw to monkey {targets[0]}\n"
+            f"    If false: throw to monkey {targets[1]}"
+        )
+    return "\n\n".join(descriptions)
+
+
+@generator(2022, 12)
+def hill(rng: random.Random, scale: int) -> str:
+    # the terrain climbs steadily from the west to the east edge, with some pits to walk around
+    height, width = side(41, scale), side(61, scale)
+    rows = []
+    for y in range(height):
+        row = []
+        for x in range(width):
+            elevation = x * 26 // width
+            if rng.random() < 0.1:
+                elevation = rng.randint(0, elevation)
+            row.append(string.ascii_lowercase[elevation])
+        rows.append(row)
+    rows[height // 2][0], rows[height // 2][width - 1] = "S", "E"
+    return "\n".join("".join(row) for row in rows)
+
+
+def _packet(rng: random.Random, depth: int = 0) -> list:
+    items: list = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            items.append(_packet(rng, depth + 1))
+        else:
+            items.append(rng.randint(0, 10))
+    return items
+
+
+def _canonical(packet: int | list) -> int | tuple:
+    """Packets with the same canonical form are in the right order both ways, e.g. `[[1],2]` and `[1,[2]]`."""
+    if isinstance(packet, int):
+        return packet
+    items = tuple(_canonical(item) for item in packet)
+    return items[0] if len(items) == 1 and isinstance(items[0], int) else items
+
+
+@generator(2022, 13)
+def packets(rng: random.Random, scale: int) -> str:
+    # the comparison can't order equal packets, so every packet (and divider) is different from the others
+    seen = {_canonical([[2]]), _canonical([[6]])}
+    packets = []
+    while len(packets) < 2 * scaled(150, scale):
+        packet = _packet(rng)
+        if _canonical(packet) not in seen:
+            seen.add(_canonical(packet))
+            packets.append(json.dumps(packet, separators=(",", ":")))
+    return "\n\n".join(f"{left}\n{right}" for left, right in zip(packets[::2], packets[1::2]))
+
+
+@generator(2022, 14)
+def rock_paths(rng: random.Random, scale: int) -> str:
+    depth = side(170, scale)
+    paths = []
+    for _ in range(scaled(150, scale)):
+        x, y = 500 + rng.randint(-depth // 2, depth // 2), rng.randint(10, depth)
+        points = [(x, y)]
+        for turn in range(rng.randint(1, 5)):
+            if turn % 2 == 0:
+                x += rng.randint(-8, 8) or 1
+            else:
+                y = max(1, y + (rng.randint(-6, 6) or 1))
+            points.append((x, y))
+        paths.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return "\n".join(paths)
+
+
+@generator(2022, 15)
+def sensors(rng: random.Random, scale: int) -> str:
+    # Every sensor's range ends right next to the distress beacon, so it's the only uncovered point (in practice).
+    # The coordinates stay non-negative, since the solution only parses digits.
+    space = 4_000_000
+    hole_x, hole_y = rng.randint(space // 10, 9 * space // 10), rng.randint(space // 10, 9 * space // 10)
+    lines = []
+    while len(lines) < scaled(25, scale):
+        sx = max(0, hole_x + rng.randint(-space // 2, space // 2))
+        sy = max(0, hole_y + rng.randint(-space // 2, space // 2))
+        radius = abs(sx - hole_x) + abs(sy - hole_y) - 1
+        dx = rng.randint(-radius, radius)
+        bx, by = sx + dx, sy + rng.choice([-1, 1]) * (radius - abs(dx))
+        if radius > 0 and bx >= 0 and by >= 0:
+            lines.append(f"Sensor at x={sx}, y={sy}: closest beacon is at x={bx}, y={by}")
+    return "\n".join(lines)
+
+
+@generator(2022, 21)
+def monkey_math(rng: random.Random, scale: int) -> str:
+    # Built top-down from the values every monkey should yell, so all the divisions are exact and the values stay
+    # positive. Both sides of the root are equal and humn is somewhere on the left, as part two expects.
+    leaves = scaled(1500, scale)
+    names = iter(name for name in unique_words(rng, 2 * leaves + 2, 4) if name not in ("root", "humn"))
+    jobs: dict[str, str] = {}
+    left_leaves: list[str] = []
+
+    def build(value: int, size: int, collect: list[str] | None) -> str:
+        name = next(names)
+        if collect is not None and size == 1:
+            collect.append(name)
+        if size == 1:
+            jobs[name] = str(value)
+            return name
+
+        left_size = max(1, min(size - 1, round(size * rng.uniform(0.3, 0.7))))
+        operator = rng.choice("+-*/")
+        divisors = [d for d in range(2, 10) if value % d == 0]
+        if operator == "+" and value >= 2:
+            left_value = rng.randint(1, value - 1)
+            right_value = value - left_value
+        elif operator == "*" and divisors:
+            right_value = rng.choice(divisors)
+            left_value = value // right_value
+        elif operator == "/":
+            right_value = rng.randint(2, 5)
+            left_value = value * right_value
+        else:
+            operator = "-"
+            right_value = rng.randint(1, 100)
+            left_value = value + right_value
+        left = build(left_value, left_size, collect)
+        right = build(right_value, size - left_size, collect)
+        jobs[name] = f"{left} {operator} {right}"
+        return name
+
+    value = rng.randint(10**6, 10**8)
+    left = build(value, leaves // 2, left_leaves)
+    right = build(value, leaves - leaves // 2, None)
+    jobs["root"] = f"{left} + {right}"
+
+    humn = rng.choice(left_leaves)
+    renamed = {humn: "humn"}
+    lines = [
+        f"{renamed.get(name, name)}: {' '.join(renamed.get(token, token) for token in job.split())}"
+        for name, job in jobs.items()
+    ]
+    rng.shuffle(lines)
+    return "\n".join(lines)
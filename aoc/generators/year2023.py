@@ -0,0 +1,363 @@
+"""Generators of the 2023 inputs."""
+
+import random
+import string
+
+from aoc.generators.common import generator, grid, scaled, side, unique_words
+
+_SPELLED = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+@generator(2023, 1)
+def calibration(rng: random.Random, scale: int) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        pieces = [rng.choice(string.digits[1:])]
+        for _ in range(rng.randint(1, 6)):
+            choice = rng.random()
+            if choice < 0.3:
+                pieces.append(rng.choice(string.digits[1:]))
+            elif choice < 0.6:
+                pieces.append(rng.choice(_SPELLED))
+            else:
+                pieces.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        lines.append("".join(rng.sample(pieces, len(pieces))))
+    return "\n".join(lines)
+
+
+@generator(2023, 2)
+def cube_games(rng: random.Random, scale: int) -> str:
+    games = []
+    for game in range(1, scaled(100, scale) + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        games.append(f"Game {game}: {'; '.join(draws)}")
+    return "\n".join(games)
+
+
+@generator(2023, 3)
+def engine_schematic(rng: random.Random, scale: int) -> str:
+    size = side(140, scale)
+    rows = [["."] * size for _ in range(size)]
+    for _ in range(scaled(1200, scale)):
+        y, x = rng.randrange(size), rng.randrange(size - 3)
+        number = str(rng.randint(1, 999))
+        if all(cell == "." for cell in rows[y][max(0, x - 1) : x + len(number) + 1]):
+            rows[y][x : x + len(number)] = number
+    for _ in range(scaled(750, scale)):
+        y, x = rng.randrange(size), rng.randrange(size)
+        if rows[y][x] == ".":
+            rows[y][x] = rng.choice("*****#$%&+-/=@")
+    return "\n".join("".join(row) for row in rows)
+
+
+@generator(2023, 4)
+def scratchcards(rng: random.Random, scale: int) -> str:
+    count = scaled(214, scale)
+    cards = []
+    for card in range(1, count + 1):
+        matches = min(rng.choice([0, 0, 0, 1, 2, 3, 5, 8, 10]), count - card)
+        winning = rng.sample(range(1, 100), 10)
+        others = [n for n in range(1, 100) if n not in winning]
+        have = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(have)
+        cards.append(
+            f"Card {card:>{len(str(count))}}: {' '.join(f'{n:2}' for n in winning)} | {' '.join(f'{n:2}' for n in have)}"
+        )
+    return "\n".join(cards)
+
+
+_ALMANAC_MAPS = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+
+
+@generator(2023, 5)
+def almanac(rng: random.Random, scale: int) -> str:
+    limit = 2**32
+    seeds = []
+    for _ in range(scaled(10, scale)):
+        start = rng.randrange(limit - 10**9)
+        seeds += [start, rng.randint(10**6, 3 * 10**8)]
+    sections = [f"seeds: {' '.join(map(str, seeds))}"]
+    for source, destination in zip(_ALMANAC_MAPS, _ALMANAC_MAPS[1:]):
+        # the source ranges split the numbers into non-overlapping pieces, the destinations shuffle them around
+        cuts = sorted(rng.sample(range(1, limit), scaled(30, scale)))
+        pieces = [(start, end - start) for start, end in zip([0] + cuts, cuts + [limit])]
+        destinations = rng.sample(pieces, len(pieces))
+        offsets, position = {}, 0
+        for piece in destinations:
+            offsets[piece] = position
+            position += piece[1]
+        entries = [f"{offsets[piece]} {piece[0]} {piece[1]}" for piece in pieces if rng.random() < 0.9]
+        sections.append(f"{source}-to-{destination} map:\n" + "\n".join(rng.sample(entries, len(entries))))
+    return "\n\n".join(sections)
+
+
+@generator(2023, 6)
+def boat_races(rng: random.Random, scale: int) -> str:
+    # part two glues the numbers together and solves it with floats, so the number of races can't grow much
+    times, distances = [], []
+    for _ in range(min(scaled(4, scale), 30)):
+        time = rng.randint(30, 999)
+        hold = rng.randint(time // 4, time // 2)
+        times.append(time)
+        distances.append(hold * (time - hold))
+    width = len(str(max(distances))) + 3
+    return (
+        "Time:    " + "".join(f"{t:>{width}}" for t in times) + "\nDistance:" + "".join(f"{d:>{width}}" for d in distances)
+    )
+
+
+@generator(2023, 7)
+def camel_cards(rng: random.Random, scale: int) -> str:
+    return "\n".join(
+        f"{''.join(rng.choices('AKQJT98765432', k=5))} {rng.randint(1, 1000)}" for _ in range(scaled(1000, scale))
+    )
+
+
+@generator(2023, 8)
+def haunted_network(rng: random.Random, scale: int) -> str:
+    # Every ghost walks a loop of its own whose length is the length of the instructions times a prime, and its
+    # ..Z node closes the loop, which is what the LCM of part two relies on. The steps not taken lead to random nodes.
+    # Node names are three characters long, so the network can't grow past about twenty thousand nodes.
+    nodes = min(scaled(750, scale), 18_000)
+    ghosts = 6
+    instructions = "".join(rng.choices("LR", k=max(3, round((nodes / ghosts) ** 0.5 / 2))))
+    primes = [p for p in range(3, 1000) if all(p % d for d in range(2, int(p**0.5) + 1))]
+    candidates = [p for p in primes if p * len(instructions) <= nodes / ghosts]
+    cycle_primes = rng.sample(candidates if len(candidates) >= ghosts else primes[:ghosts], ghosts)
+
+    alphabet = string.ascii_uppercase[1:-1] + string.digits
+    inner_names = iter(unique_words(rng, sum(p * len(instructions) for p in cycle_primes), 3, alphabet))
+    starts = ["AAA"] + [name + "A" for name in unique_words(rng, ghosts - 1, 2, alphabet)]
+    ends = ["ZZZ"] + [name + "Z" for name in unique_words(rng, ghosts - 1, 2, alphabet)]
+
+    moves: dict[str, dict[str, str]] = {}
+    for start, end, prime in zip(starts, ends, cycle_primes):
+        length = prime * len(instructions)
+        loop = [start] + [next(inner_names) for _ in range(length - 1)] + [end]
+        for step, node in enumerate(loop):
+            target = loop[step + 1] if step + 1 < len(loop) else loop[1]
+            moves[node] = {instructions[step % len(instructions)]: target}
+    names = list(moves)
+    lines = []
+    for node, move in moves.items():
+        left = move.get("L", rng.choice(names))
+        right = move.get("R", rng.choice(names))
+        lines.append(f"{node} = ({left}, {right})")
+    rng.shuffle(lines)
+    return instructions + "\n\n" + "\n".join(lines)
+
+
+@generator(2023, 9)
+def oasis_report(rng: random.Random, scale: int) -> str:
+    histories = []
+    for _ in range(scaled(200, scale)):
+        # the values of a random polynomial of a low degree, built up from its constant difference
+        rows = [[rng.randint(-9, 9)] * 21]
+        for _ in range(rng.randint(1, 12)):
+            value, row = rng.randint(-20, 20), []
+            for difference in rows[-1]:
+                row.append(value)
+                value += difference
+            rows.append(row)
+        histories.append(" ".join(map(str, rows[-1])))
+    return "\n".join(histories)
+
+
+_PIPES = {
+    frozenset("NS"): "|",
+    frozenset("EW"): "-",
+    frozenset("NE"): "L",
+    frozenset("NW"): "J",
+    frozenset("SW"): "7",
+    frozenset("SE"): "F",
+}
+_DIRECTIONS = {"N": (-1, 0), "S": (1, 0), "W": (0, -1), "E": (0, 1)}
+
+
+@generator(2023, 10)
+def pipe_maze(rng: random.Random, scale: int) -> str:
+    # The loop goes around a random spanning tree of 3x3 blocks: each block is a ring of pipes around its center,
+    # and neighbouring rings of the tree are merged into one. The centers end up enclosed by the loop.
+    size = side(140, scale)
+    blocks = size // 3
+    start = (rng.randrange(blocks), rng.randrange(blocks))
+    tree, frontier = {start}, [(start, neighbour) for neighbour in _block_neighbours(start, blocks)]
+    edges = []
+    while frontier and len(tree) < 0.6 * blocks * blocks:
+        parent, block = frontier.pop(rng.randrange(len(frontier)))
+        if block in tree:
+            continue
+        tree.add(block)
+        edges.append((parent, block))
+        frontier.extend((block, neighbour) for neighbour in _block_neighbours(block, blocks))
+
+    links: dict[tuple[int, int], set[str]] = {}
+    ring = [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1), (2, 0), (1, 0)]
+    for r, c in tree:
+        for (y1, x1), (y2, x2) in zip(ring, ring[1:] + ring[:1]):
+            _link(links, (3 * r + y1, 3 * c + x1), (3 * r + y2, 3 * c + x2))
+    for (r1, c1), (r2, c2) in edges:
+        (r, c), (other_r, other_c) = sorted([(r1, c1), (r2, c2)])
+        y, x = 3 * r, 3 * c
+        if other_r == r:
+            _unlink(links, (y, x + 2), (y + 1, x + 2))
+            _unlink(links, (y, x + 3), (y + 1, x + 3))
+            _link(links, (y, x + 2), (y, x + 3))
+            _link(links, (y + 1, x + 2), (y + 1, x + 3))
+        else:
+            _unlink(links, (y + 2, x), (y + 2, x + 1))
+            _unlink(links, (y + 3, x), (y + 3, x + 1))
+            _link(links, (y + 2, x), (y + 3, x))
+            _link(links, (y + 2, x + 1), (y + 3, x + 1))
+
+    rows = grid(rng, size, size, ".|-LJ7F", [4, 1, 1, 1, 1, 1, 1])
+    rows = [list(row) for row in rows]
+    for (y, x), directions in links.items():
+        rows[y][x] = _PIPES[frozenset(directions)]
+    start_y, start_x = rng.choice(sorted(links))
+    rows[start_y][start_x] = "S"
+    for direction, (dy, dx) in _DIRECTIONS.items():
+        y, x = start_y + dy, start_x + dx
+        if (y, x) not in links and 0 <= y < size and 0 <= x < size:
+            rows[y][x] = "."
+    return "\n".join("".join(row) for row in rows)
+
+
+def _block_neighbours(block: tuple[int, int], blocks: int) -> list[tuple[int, int]]:
+    r, c = block
+    return [(r + dr, c + dc) for dr, dc in _DIRECTIONS.values() if 0 <= r + dr < blocks and 0 <= c + dc < blocks]
+
+
+def _direction(source: tuple[int, int], target: tuple[int, int]) -> str:
+    delta = (target[0] - source[0], target[1] - source[1])
+    return next(direction for direction, offset in _DIRECTIONS.items() if offset == delta)
+
+
+def _link(links: dict, a: tuple[int, int], b: tuple[int, int]):
+    links.setdefault(a, set()).add(_direction(a, b))
+    links.setdefault(b, set()).add(_direction(b, a))
+
+
+def _unlink(links: dict, a: tuple[int, int], b: tuple[int, int]):
+    links[a].discard(_direction(a, b))
+    links[b].discard(_direction(b, a))
+
+
+@generator(2023, 11)
+def galaxies(rng: random.Random, scale: int) -> str:
+    # some rows and columns are left empty, so there's something to expand
+    size = side(140, scale)
+    empty_rows = set(rng.sample(range(size), size // 15))
+    empty_columns = set(rng.sample(range(size), size // 15))
+    rows = []
+    for y in range(size):
+        row = grid(rng, 1, size, ".#", [45, 1])[0]
+        if y in empty_rows:
+            row = "." * size
+        rows.append("".join("." if x in empty_columns else cell for x, cell in enumerate(row)))
+    return "\n".join(rows)
+
+
+@generator(2023, 13)
+def mirrors(rng: random.Random, scale: int) -> str:
+    # Every pattern mirrors perfectly around one line, and a single flipped cell (the smudge) spoils the reflection
+    # around another one. The rest of the pattern is random, so other reflections are unlikely.
+    patterns = []
+    for _ in range(scaled(100, scale)):
+        height, width = rng.randint(7, 17), rng.randint(7, 17)
+        cells = [list(row) for row in grid(rng, height, width, ".#")]
+        lines = {"columns": rng.randint(1, width - 1), "rows": rng.randint(1, height - 1)}
+        for y in range(height):
+            for x in range(lines["columns"], min(width, 2 * lines["columns"])):
+                cells[y][x] = cells[y][2 * lines["columns"] - 1 - x]
+        for y in range(lines["rows"], min(height, 2 * lines["rows"])):
+            cells[y] = list(cells[2 * lines["rows"] - 1 - y])
+
+        # the smudge has to be mirrored around its line, but not around the one that stays perfect
+        kept, smudged = rng.sample(["columns", "rows"], 2)
+        candidates = [
+            (y, x)
+            for y in range(height)
+            for x in range(width)
+            if _mirrors_inside(x if kept == "columns" else y, lines[kept], width if kept == "columns" else height)
+            is False
+            and _mirrors_inside(x if smudged == "columns" else y, lines[smudged], width if smudged == "columns" else height)
+        ]
+        if candidates:
+            y, x = rng.choice(candidates)
+            cells[y][x] = "#" if cells[y][x] == "." else "."
+        patterns.append("\n".join("".join(row) for row in cells))
+    return "\n\n".join(patterns)
+
+
+def _mirrors_inside(position: int, line: int, length: int) -> bool:
+    return 0 <= 2 * line - 1 - position < length
+
+
+@generator(2023, 14)
+def rocks(rng: random.Random, scale: int) -> str:
+    size = side(100, scale)
+    return "\n".join(grid(rng, size, size, ".O#", [10, 4, 2]))
+
+
+@generator(2023, 15)
+def initialization_sequence(rng: random.Random, scale: int) -> str:
+    labels = unique_words(rng, scaled(500, scale), 2)
+    steps = []
+    for _ in range(scaled(4000, scale)):
+        label = rng.choice(labels)
+        steps.append(f"{label}={rng.randint(1, 9)}" if rng.random() < 0.6 else f"{label}-")
+    return ",".join(steps)
+
+
+@generator(2023, 16)
+def contraption(rng: random.Random, scale: int) -> str:
+    size = side(110, scale)
+    return "\n".join(grid(rng, size, size, ".\\/-|", [40, 1, 1, 1, 1]))
+
+
+@generator(2023, 19)
+def workflows(rng: random.Random, scale: int) -> str:
+    # The workflows form a tree rooted at "in", so every part ends up accepted or rejected.
+    names = iter(name for name in unique_words(rng, scaled(600, scale) + 1, 3) if name != "in")
+    pending, lines = ["in"], []
+    remaining = scaled(580, scale)
+    while pending:
+        name = pending.pop()
+        rules = []
+        for _ in range(rng.randint(1, 3)):
+            target = "A" if rng.random() < 0.5 else "R"
+            if remaining > 0 and rng.random() < 0.6:
+                target = next(names)
+                pending.append(target)
+                remaining -= 1
+            rules.append(f"{rng.choice('xmas')}{rng.choice('<>')}{rng.randint(1, 4000)}:{target}")
+        fallback = rng.choice("AR")
+        if remaining > 0 and rng.random() < 0.4:
+            fallback = next(names)
+            pending.append(fallback)
+            remaining -= 1
+        lines.append(f"{name}{{{','.join(rules + [fallback])}}}")
+    rng.shuffle(lines)
+
+    parts = [
+        "{" + ",".join(f"{category}={rng.randint(1, 4000)}" for category in "xmas") + "}"
+        for _ in range(scaled(200, scale))
+    ]
+    return "\n".join(lines) + "\n\n" + "\n".join(parts)
+
+
+@generator(2023, 21)
+def garden(rng: random.Random, scale: int) -> str:
+    # like the real input, the row and the column of the start (in the middle) are free of rocks
+    size = side(131, scale) // 2 * 2 + 1
+    rows = [list(row) for row in grid(rng, size, size, ".#", [6, 1])]
+    middle = size // 2
+    for i in range(size):
+        rows[middle][i] = rows[i][middle] = "."
+    rows[middle][middle] = "S"
+    return "\n".join("".join(row) for row in rows)
+
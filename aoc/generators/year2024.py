@@ -0,0 +1,115 @@
+"""Generators of the 2024 inputs."""
+
+import random
+import string
+
+from aoc.generators.common import generator, grid, scaled, side
+
+
+@generator(2024, 1)
+def location_lists(rng: random.Random, scale: int) -> str:
+    # the right list reuses some of the left ids, so the similarity score of part two isn't always zero
+    count = scaled(1000, scale)
+    left = [rng.randint(10000, 99999) for _ in range(count)]
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randint(10000, 99999) for _ in range(count)]
+    return "\n".join(f"{a}   {b}" for a, b in zip(left, right))
+
+
+@generator(2024, 2)
+def reports(rng: random.Random, scale: int) -> str:
+    lines = []
+    for _ in range(scaled(1000, scale)):
+        direction = rng.choice([-1, 1])
+        levels = [rng.randint(10, 90)]
+        for _ in range(rng.randint(4, 7)):
+            step = direction * rng.randint(1, 3) if rng.random() < 0.9 else rng.choice([0, 4, 5, -direction])
+            levels.append(levels[-1] + step)
+        lines.append(" ".join(map(str, levels)))
+    return "\n".join(lines)
+
+
+@generator(2024, 3)
+def corrupted_memory(rng: random.Random, scale: int) -> str:
+    junk = "!@#$%^&*()[]{}<>,;:'?+-~ "
+    lines = []
+    for _ in range(scaled(6, scale)):
+        pieces = []
+        while sum(map(len, pieces)) < 3000:
+            choice = rng.random()
+            if choice < 0.4:
+                pieces.append(f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})")
+            elif choice < 0.45:
+                pieces.append(rng.choice(["do()", "don't()"]))
+            elif choice < 0.55:
+                name = rng.choice(["mul", "what", "who", "from", "when"])
+                pieces.append(f"{name}({rng.randint(1, 9999)},{rng.randint(1, 9)}]")
+            else:
+                pieces.append("".join(rng.choices(junk, k=rng.randint(1, 6))))
+        lines.append("".join(pieces))
+    return "\n".join(lines)
+
+
+@generator(2024, 4)
+def word_search(rng: random.Random, scale: int) -> str:
+    size = side(140, scale)
+    return "\n".join(grid(rng, size, size, "XMAS"))
+
+
+@generator(2024, 5)
+def print_queue(rng: random.Random, scale: int) -> str:
+    # the rules order every pair of pages, so every update can be fixed
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f"{a}|{b}" for i, a in enumerate(pages) for b in pages[i + 1 :]]
+    rng.shuffle(rules)
+    updates = [",".join(map(str, rng.sample(pages, rng.choice(range(5, 24, 2))))) for _ in range(scaled(200, scale))]
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+@generator(2024, 6)
+def guard_lab(rng: random.Random, scale: int) -> str:
+    size = side(130, scale)
+    rows = [list(row) for row in grid(rng, size, size, ".#", [60, 1])]
+    rows[rng.randrange(size // 4, 3 * size // 4)][rng.randrange(size // 4, 3 * size // 4)] = "^"
+    return "\n".join("".join(row) for row in rows)
+
+
+@generator(2024, 7)
+def calibration_equations(rng: random.Random, scale: int) -> str:
+    # most of the test values are made with the operators of part one or part two, the rest are random
+    lines = []
+    for _ in range(scaled(850, scale)):
+        numbers = [rng.randint(1, 999) if rng.random() < 0.5 else rng.randint(1, 9) for _ in range(rng.randint(3, 12))]
+        value = numbers[0]
+        for number in numbers[1:]:
+            operator = rng.choice("+*|")
+            if operator == "+":
+                value += number
+            elif operator == "*":
+                value *= number
+            else:
+                value = int(f"{value}{number}")
+        if rng.random() < 0.3:
+            value += rng.randint(1, 100)
+        lines.append(f"{value}: {' '.join(map(str, numbers))}")
+    return "\n".join(lines)
+
+
+@generator(2024, 8)
+def antennas(rng: random.Random, scale: int) -> str:
+    size = side(50, scale)
+    rows = [["."] * size for _ in range(size)]
+    frequencies = string.ascii_letters + string.digits
+    for _ in range(scaled(150, scale)):
+        y, x = rng.randrange(size), rng.randrange(size)
+        rows[y][x] = rng.choice(frequencies)
+    return "\n".join("".join(row) for row in rows)
+
+
+@generator(2024, 9)
+def disk_map(rng: random.Random, scale: int) -> str:
+    # the files and the free spaces take turns, starting and ending with a file
+    files = scaled(10000, scale)
+    digits = []
+    for _ in range(files - 1):
+        digits += [rng.choice("123456789"), rng.choice(string.digits)]
+    return "".join(digits) + rng.choice("123456789")
@@ -0,0 +1,85 @@
+"""Generators of the 2025 inputs."""
+
+import random
+
+from aoc.generators.common import digit_grid, generator, grid, scaled, side
+
+
+@generator(2025, 1)
+def rotations(rng: random.Random, scale: int) -> str:
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(scaled(4700, scale)))
+
+
+@generator(2025, 2)
+def id_ranges(rng: random.Random, scale: int) -> str:
+    # Disjoint ranges spread evenly over the orders of magnitude; like the real ones, the ends of a range never
+    # differ by more than one digit.
+    bounds = sorted({int(10 ** rng.uniform(1, 10)) for _ in range(2 * scaled(38, scale))})
+    ranges = [
+        f"{start}-{end}" for start, end in zip(bounds[::2], bounds[1::2]) if len(str(end)) - len(str(start)) <= 1
+    ]
+    rng.shuffle(ranges)
+    return ",".join(ranges)
+
+
+@generator(2025, 3)
+def battery_banks(rng: random.Random, scale: int) -> str:
+    return "\n".join(digit_grid(rng, scaled(200, scale), 100, "123456789"))
+
+
+@generator(2025, 4)
+def paper_rolls(rng: random.Random, scale: int) -> str:
+    size = side(137, scale)
+    return "\n".join(grid(rng, size, size, "@.", [7, 3]))
+
+
+@generator(2025, 5)
+def ingredients(rng: random.Random, scale: int) -> str:
+    # part one checks the ranges recursively, so only the available ingredients grow past the recursion limit
+    limit = 10**15
+    ranges = []
+    for _ in range(min(scaled(190, scale), 500)):
+        start = rng.randrange(limit)
+        ranges.append(f"{start}-{start + rng.randint(10**11, 10**13)}")
+    ids = [str(rng.randrange(limit)) for _ in range(scaled(1000, scale))]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids)
+
+
+@generator(2025, 6)
+def worksheet(rng: random.Random, scale: int) -> str:
+    # The numbers of a problem are aligned to either side of its column, which is what the right-to-left reading of
+    # part two is about. They're ordered by length, so no digit column of a problem has a gap in it.
+    rows: list[list[str]] = [[] for _ in range(5)]
+    for _ in range(scaled(1000, scale)):
+        numbers = sorted((str(rng.randint(1, 10 ** rng.randint(1, 4) - 1)) for _ in range(4)), key=len)
+        if rng.random() < 0.5:
+            numbers.reverse()
+        width = max(map(len, numbers))
+        align = rng.choice("<>")
+        for row, number in zip(rows, numbers):
+            row.append(f"{number:{align}{width}}")
+        rows[4].append(f"{rng.choice('+*'):<{width}}")
+    return "\n".join(" ".join(row) for row in rows)
+
+
+@generator(2025, 7)
+def tachyon_manifold(rng: random.Random, scale: int) -> str:
+    # the splitters fill the triangle the beams can reach, on every other row like in the real manifold
+    size = side(141, scale) // 2 * 2 + 1
+    middle = size // 2
+    rows = ["." * middle + "S" + "." * middle]
+    for level in range((size - 1) // 2):
+        rows.append("." * size)
+        row = ["."] * size
+        for offset in range(-level, level + 1, 2):
+            if rng.random() < 0.6:
+                row[middle + offset] = "^"
+        rows.append("".join(row))
+    return "\n".join(rows)
+
+
+@generator(2025, 8)
+def junction_boxes(rng: random.Random, scale: int) -> str:
+    return "\n".join(
+        ",".join(str(rng.randrange(100000)) for _ in range(3)) for _ in range(scaled(1000, scale))
+    )
@@ -0,0 +1,154 @@
+"""
+Rectangular maps of one-byte cells, shared by the days whose input is a grid of characters or digits.
+
+The cells are stored row by row in a single bytearray, padded with a border of one cell on every side, and a cell is
+addressed by its flat index. Its neighbours are the index plus one of the precomputed offsets, and stepping off the map
+lands on the border instead of raising an IndexError or wrapping around to the next row. So the hot loops need no
+bounds checks, they only have to treat the border value as a wall. Whole rows, columns and maps are scanned and
+rewritten by the C-level methods of bytearray (`find`, `count`, `translate`, slicing with a step).
+"""
+
+from array import array
+from typing import Iterable, Iterator
+
+FROM_DIGITS = bytes.maketrans(b"0123456789", bytes(range(10)))
+TO_DIGITS = bytes.maketrans(bytes(range(10)), b"0123456789")
+
+
+class Grid:
+    """
+    A map of `width` x `height` cells of a single byte each, surrounded by `border` cells.
+
+    :param width: number of cells in a row
+    :param height: number of rows
+    :param border: value of the padding cells, it should be one the map itself never holds (or a wall)
+    :param fill: initial value of the cells
+    """
+
+    def __init__(self, width: int, height: int, border: int = 0, fill: int = 0):
+        self.width = width
+        self.height = height
+        self.border = border
+        self.stride = width + 2
+        self.cells = bytearray([border]) * (self.stride * (height + 2))
+        inner = bytes([fill]) * width
+        for y in range(height):
+            start = self.index(0, y)
+            self.cells[start : start + width] = inner
+
+        self.north, self.east, self.south, self.west = -self.stride, 1, self.stride, -1
+        self.orthogonal = (self.north, self.east, self.south, self.west)
+        self.diagonal = (
+            self.north + self.east,
+            self.south + self.east,
+            self.south + self.west,
+            self.north + self.west,
+        )
+        self.adjacent = self.orthogonal + self.diagonal
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[bytes], border: int = 0) -> "Grid":
+        rows = list(rows)
+        grid = cls(len(rows[0]), len(rows), border)
+        for y, row in enumerate(rows):
+            start = grid.index(0, y)
+            grid.cells[start : start + grid.width] = row
+        return grid
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], border: int = 0, table: bytes | None = None) -> "Grid":
+        """
+        :param lines: rows of the map, one ASCII character per cell
+        :param border: value of the padding cells
+        :param table: translation of the characters into cell values, e.g. FROM_DIGITS; by default a cell holds the
+            code of its character
+        :return: the map
+        """
+        rows = (line.encode("ascii") for line in lines)
+        if table is not None:
+            rows = (row.translate(table) for row in rows)
+        return cls.from_rows(rows, border)
+
+    def index(self, x: int, y: int) -> int:
+        return (y + 1) * self.stride + x + 1
+
+    def xy(self, index: int) -> tuple[int, int]:
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int):
+        self.cells[index] = value
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def is_inside(self, index: int) -> bool:
+        x, y = self.xy(index)
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def positions(self) -> Iterator[int]:
+        """Indices of all the cells of the map (without the border), row by row."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def row(self, y: int) -> bytearray:
+        start = self.index(0, y)
+        return self.cells[start : start + self.width]
+
+    def column(self, x: int) -> bytearray:
+        start = self.index(x, 0)
+        return self.cells[start : start + self.height * self.stride : self.stride]
+
+    def rows(self) -> Iterator[bytearray]:
+        return (self.row(y) for y in range(self.height))
+
+    def columns(self) -> Iterator[bytearray]:
+        return (self.column(x) for x in range(self.width))
+
+    def find(self, value: int) -> int:
+        """Index of the first cell holding the value, or -1 if there is none."""
+        index = self.cells.find(value, self.stride)
+        while index != -1 and not self.is_inside(index):
+            index = self.cells.find(value, index + 1)
+        return index
+
+    def find_all(self, value: int) -> list[int]:
+        """Indices of all the cells holding the value, row by row."""
+        cells, found = self.cells, []
+        for y in range(self.height):
+            start = self.index(0, y)
+            end = start + self.width
+            index = cells.find(value, start, end)
+            while index != -1:
+                found.append(index)
+                index = cells.find(value, index + 1, end)
+        return found
+
+    def count(self, value: int) -> int:
+        padding = len(self.cells) - len(self)
+        return self.cells.count(value) - (padding if value == self.border else 0)
+
+    def translate(self, table: bytes):
+        """Maps every cell through the table in place; the table should map the border value onto itself."""
+        self.cells[:] = self.cells.translate(table)
+
+    def layer(self, value: int = 0, typecode: str = "B") -> array:
+        """A separate array of per-cell values (e.g. distances or visited flags) indexed like the cells."""
+        return array(typecode, [value]) * len(self.cells)
+
+    def copy(self) -> "Grid":
+        grid = object.__new__(type(self))
+        grid.__dict__.update(self.__dict__)
+        grid.cells = bytearray(self.cells)
+        return grid
+
+    def render(self, table: bytes | None = None) -> str:
+        rows = self.rows() if table is None else (row.translate(table) for row in self.rows())
+        return "\n".join(row.decode("ascii") for row in rows)
+
+    def __str__(self):
+        return self.render()
@@ -0,0 +1,100 @@
+"""Measuring the peak memory and the biggest allocation sites of a part with tracemalloc."""
+
+import threading
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+from aoc.day import ROOT
+
+_IGNORED_FILES = (tracemalloc.__file__, threading.__file__, __file__, "<frozen importlib._bootstrap>")
+
+
+@dataclass
+class AllocationSite:
+    location: str
+    size: int
+    count: int
+
+    def __str__(self):
+        return f"{self.location}: {self.size / 1024:.1f} KiB in {self.count} blocks"
+
+
+@dataclass
+class MemoryUsage:
+    """Peak of the memory traced while a part ran (in bytes) and where most of it was allocated around that peak."""
+
+    peak: int
+    top_sites: list[AllocationSite] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"peak_memory": self.peak, "allocation_sites": [asdict(site) for site in self.top_sites]}
+
+
+class _PeakSnapshotter(threading.Thread):
+    """
+    Tracemalloc reports the exact peak, but snapshots only show what's alive when they are taken. This thread polls
+    the traced memory and re-takes the snapshot whenever it grows noticeably, so the kept one is close to the peak.
+    """
+
+    def __init__(self, interval: float, growth: float):
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.growth = growth
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.snapshot_size = 0
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            self.take_if_grown()
+
+    def take_if_grown(self):
+        current, _peak = tracemalloc.get_traced_memory()
+        if self.snapshot is None or current > self.snapshot_size * (1 + self.growth):
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+def measure_memory(
+    func: Callable, *args: Any, top: int = 5, interval: float = 0.01, growth: float = 0.1
+) -> tuple[Any, MemoryUsage]:
+    """
+    Calls the function under tracemalloc.
+
+    :param func: function to measure, e.g. a part of a day
+    :param args: its arguments (allocated before the tracing starts, so they don't count towards the peak)
+    :param top: how many allocation sites to report
+    :param interval: how often (in seconds) to check whether a snapshot closer to the peak should be taken
+    :param growth: relative growth of the traced memory that triggers a new snapshot
+    :return: the function's result and its memory usage
+    """
+    snapshotter = _PeakSnapshotter(interval, growth)
+    tracemalloc.start()
+    snapshotter.start()
+    try:
+        result = func(*args)
+        _current, peak = tracemalloc.get_traced_memory()
+        snapshotter.take_if_grown()
+    finally:
+        snapshotter.stop()
+        tracemalloc.stop()
+
+    snapshot = snapshotter.snapshot.filter_traces([tracemalloc.Filter(False, name) for name in _IGNORED_FILES])
+    sites = [
+        AllocationSite(_location(stat.traceback[0]), stat.size, stat.count)
+        for stat in snapshot.statistics("lineno")[:top]
+    ]
+    return result, MemoryUsage(peak, sites)
+
+
+def _location(frame: tracemalloc.Frame) -> str:
+    path = Path(frame.filename)
+    if path.is_relative_to(ROOT):
+        path = path.relative_to(ROOT)
+    return f"{path}:{frame.lineno}"
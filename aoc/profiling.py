@@ -0,0 +1,298 @@
+"""
+Profiling the parts of a day, with the results saved as collapsed stacks: either deterministically with cProfile
+(saved as pstats too), or by sampling their stacks on a timer signal, which barely slows down the tight loops that
+cProfile's per-call overhead distorts.
+"""
+
+import contextlib
+import cProfile
+import io
+import pstats
+import signal
+import sys
+import threading
+import time
+import timeit
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Callable, TextIO
+
+from aoc.cache import InputCache
+from aoc.day import PARTS, ROOT, Day, part_arguments, prepare_input, solution_module
+
+PROFILE_DIR = ROOT / "profiles"
+
+Function = tuple[str, int, str]
+
+
+@dataclass
+class PartProfile:
+    part: str
+    answer: str
+    pstats_file: Path
+    collapsed_file: Path
+    summary: str
+
+    def __str__(self):
+        return (
+            f"{self.part}: {self.answer}\n"
+            f"  pstats:    {self.pstats_file}\n"
+            f"  collapsed: {self.collapsed_file}\n"
+            f"{self.summary}"
+        )
+
+
+def profile_day(
+    day: Day, test: bool = False, output_dir: Path = PROFILE_DIR, top: int = 15, input_cache: bool = True
+) -> list[PartProfile]:
+    """
+    Profiles both parts of a day separately, each with its own profiler and a fresh copy of its arguments (a day with
+    a `prepare` hook is prepared once, unprofiled, and its parts are given the context). For each part,
+    `<year>-<day>-<part>.pstats` (for `python -m pstats`, snakeviz etc.) and `<year>-<day>-<part>.collapsed`
+    (for flamegraph.pl, speedscope, inferno etc.) are written to the output directory.
+
+    :param day: day to profile
+    :param test: whether to use the test input
+    :param output_dir: where to write the profiles
+    :param top: how many functions (by cumulative time) to include in the printable summary
+    :param input_cache: whether to load the parsed input from the on-disk cache
+    :return: profiles of both parts
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    input_file = day.input_file(test)
+    profiles = []
+    cache = InputCache() if input_cache else None
+
+    with solution_module(day) as module:
+        # the parts are profiled, the prepare stage they share is only run for their arguments
+        prepared = prepare_input(module, input_file, test, cache)
+        for part in PARTS:
+            arguments = part_arguments(module, part, input_file, test, cache, prepared)
+            profiler = cProfile.Profile()
+            with contextlib.redirect_stdout(io.StringIO()):
+                answer = profiler.runcall(getattr(module, part), *arguments)
+            profiler.create_stats()
+
+            prefix = output_dir / f"{day.year}-{day.day}-{part}"
+            pstats_file = prefix.with_suffix(".pstats")
+            collapsed_file = prefix.with_suffix(".collapsed")
+            profiler.dump_stats(pstats_file)
+            with open(collapsed_file, "w") as file:
+                file.writelines(f"{line}\n" for line in collapse(profiler.stats))
+
+            summary = io.StringIO()
+            pstats.Stats(profiler, stream=summary).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+            profiles.append(PartProfile(part, str(answer), pstats_file, collapsed_file, summary.getvalue()))
+
+    return profiles
+
+
+def collapse(stats: dict, min_microseconds: int = 1) -> list[str]:
+    """
+    Converts raw cProfile stats into the collapsed stack format ("root;caller;callee <microseconds>").
+
+    cProfile only records caller -> callee edges, not whole stacks, so stacks are rebuilt by walking the call graph
+    from its roots, splitting each function's time between its callers proportionally to the time spent in it
+    through each of them. Recursive calls are folded into the outermost frame.
+
+    :param stats: the `stats` attribute of a `cProfile.Profile` (after `create_stats()`) or of `pstats.Stats`
+    :param min_microseconds: stacks with less self time than this are dropped
+    :return: collapsed stack lines, sorted
+    """
+    callees: dict[Function, list[tuple[Function, float]]] = {function: [] for function in stats}
+    for function, (_cc, _nc, _tt, _ct, callers) in stats.items():
+        for caller, (_ecc, _enc, _ett, edge_ct) in callers.items():
+            callees.setdefault(caller, []).append((function, edge_ct))
+
+    stacks: dict[str, float] = {}
+    roots = [
+        function
+        for function, (*_, callers) in stats.items()
+        if not callers and function[2] != "<method 'disable' of '_lsprof.Profiler' objects>"
+    ]
+    pending = [((root,), 1.0) for root in roots]
+    while pending:
+        path, scale = pending.pop()
+        function = path[-1]
+        _cc, _nc, tt, _ct, _callers = stats[function]
+
+        key = ";".join(map(_label, path))
+        stacks[key] = stacks.get(key, 0.0) + tt * scale
+
+        for callee, edge_ct in callees.get(function, []):
+            callee_ct = stats[callee][3]
+            if callee in path or callee_ct <= 0:
+                continue
+            callee_scale = scale * edge_ct / callee_ct
+            if edge_ct * scale * 1_000_000 >= min_microseconds:
+                pending.append((path + (callee,), callee_scale))
+
+    lines = []
+    for stack, seconds in stacks.items():
+        microseconds = round(seconds * 1_000_000)
+        if microseconds >= min_microseconds:
+            lines.append(f"{stack} {microseconds}")
+
+    return sorted(lines)
+
+
+def _label(function: Function) -> str:
+    filename, lineno, name = function
+    if filename == "~":
+        return name.replace(";", ",")
+    return f"{name} ({Path(filename).name}:{lineno})"
+
+
+@dataclass
+class SampledProfile:
+    part: str
+    answer: str
+    collapsed_file: Path
+    samples: int
+    summary: str
+
+    def __str__(self):
+        return (
+            f"{self.part}: {self.answer}\n"
+            f"  collapsed: {self.collapsed_file} ({self.samples} samples)\n"
+            f"{self.summary}"
+        )
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of a call every `interval` seconds of CPU time, from a SIGPROF handler, so the profiled code
+    runs untouched between the samples. Every `report_every` seconds a thread prints the lines that were sampled the
+    most since the previous report, to watch a long run as it goes. Works in the main thread of POSIX systems only.
+    """
+
+    def __init__(self, interval: float = 0.001, report_every: float = 2.0, top: int = 5, output: TextIO = sys.stderr):
+        self.interval = interval
+        self.report_every = report_every
+        self.top = top
+        self.output = output
+        # stacks of functions, outermost first -> samples
+        self.stacks: Counter = Counter()
+        # innermost functions with the line they were at -> samples
+        self.lines: Counter = Counter()
+        self._functions: dict[CodeType, Function] = {}
+        self._root: CodeType | None = None
+        self._stop_event = threading.Event()
+        # CPU time of the profiled call, the timer signal isn't delivered as often as asked for on coarse kernel clocks
+        self.cpu_seconds = 0.0
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def runcall(self, func: Callable, *args: Any) -> Any:
+        self._root = self._call.__code__
+        previous = signal.signal(signal.SIGPROF, self._sample)
+        reporter = threading.Thread(target=self._report, daemon=True)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        reporter.start()
+        start_time = time.process_time()
+        try:
+            return self._call(func, *args)
+        finally:
+            self.cpu_seconds = time.process_time() - start_time
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, previous)
+            self._stop_event.set()
+            reporter.join()
+
+    @staticmethod
+    def _call(func: Callable, *args: Any) -> Any:
+        # the samples are cut off at this frame, so they don't include the profiler nor its callers
+        return func(*args)
+
+    def _function(self, code: CodeType) -> Function:
+        function = self._functions.get(code)
+        if function is None:
+            function = self._functions[code] = (code.co_filename, code.co_firstlineno, code.co_qualname)
+        return function
+
+    def _sample(self, _signum: int, frame: FrameType | None):
+        leaf, stack = frame, []
+        while frame is not None and frame.f_code is not self._root:
+            stack.append(self._function(frame.f_code))
+            frame = frame.f_back
+        # outside of the profiled call, e.g. right before or after it
+        if frame is None or not stack:
+            return
+        stack.reverse()
+        self.stacks[tuple(stack)] += 1
+        self.lines[(leaf.f_code.co_filename, leaf.f_lineno, leaf.f_code.co_qualname)] += 1
+
+    def _report(self):
+        start_time, previous = timeit.default_timer(), {}
+        while not self._stop_event.wait(self.report_every):
+            # a plain copy is atomic, unlike iterating the counter the signal handler keeps adding to
+            current = dict(self.lines)
+            window = Counter({line: count - previous.get(line, 0) for line, count in current.items()})
+            total, previous = sum(window.values()), current
+            if not total:
+                continue
+            elapsed = timeit.default_timer() - start_time
+            print(f"[{elapsed:.1f}s] {total} samples since the last report, the busiest lines:", file=self.output)
+            for line, count in window.most_common(self.top):
+                print(f"  {100 * count / total:5.1f}%  {_label(line)}", file=self.output)
+
+    def collapsed(self) -> list[str]:
+        """The samples as collapsed stacks, in microseconds of CPU time like the ones `collapse` makes."""
+        microseconds = 1_000_000 * (self.cpu_seconds / self.samples if self.samples else self.interval)
+        return sorted(
+            f"{';'.join(map(_label, stack))} {round(count * microseconds)}" for stack, count in self.stacks.items()
+        )
+
+    def summary(self, top: int = 15) -> str:
+        """The functions the samples were taken in the most, by their own (exclusive) samples."""
+        own = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+        if not own:
+            return "  no samples, the part finished before the first one"
+        total = sum(own.values())
+        return "\n".join(
+            f"  {100 * count / total:5.1f}%  {_label(function)}" for function, count in own.most_common(top)
+        )
+
+
+def sample_day(
+    day: Day,
+    test: bool = False,
+    output_dir: Path = PROFILE_DIR,
+    top: int = 15,
+    input_cache: bool = True,
+    interval: float = 0.001,
+    report_every: float = 2.0,
+) -> list[SampledProfile]:
+    """
+    Profiles both parts of a day like `profile_day`, but with a `SamplingProfiler`, writing
+    `<year>-<day>-<part>.sampled.collapsed` to the output directory. Long parts report their busiest lines to stderr
+    as they run.
+
+    :param interval: seconds of CPU time between the samples
+    :param report_every: seconds between the live reports
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    input_file = day.input_file(test)
+    profiles = []
+    cache = InputCache() if input_cache else None
+
+    with solution_module(day) as module:
+        prepared = prepare_input(module, input_file, test, cache)
+        for part in PARTS:
+            arguments = part_arguments(module, part, input_file, test, cache, prepared)
+            profiler = SamplingProfiler(interval, report_every)
+            with contextlib.redirect_stdout(io.StringIO()):
+                answer = profiler.runcall(getattr(module, part), *arguments)
+
+            collapsed_file = output_dir / f"{day.year}-{day.day}-{part}.sampled.collapsed"
+            with open(collapsed_file, "w") as file:
+                file.writelines(f"{line}\n" for line in profiler.collapsed())
+            profiles.append(SampledProfile(part, str(answer), collapsed_file, profiler.samples, profiler.summary(top)))
+
+    return profiles
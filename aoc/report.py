@@ -0,0 +1,197 @@
+"""
+A static HTML report of the stored benchmarks: the trend of every part's median time and peak memory over the
+commits, as inline SVG sparklines, with the slowest parts and the biggest regressions up front. It's built from the
+JSON files in benchmarks/ only and references nothing outside itself, so it can be read offline.
+"""
+
+import html
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc.benchmark import BENCHMARK_DIR, Regression, _format_metric, compare
+
+REPORT_FILE = BENCHMARK_DIR / "report.html"
+
+_STYLE = """
+body { font-family: sans-serif; margin: 2em; color: #222; }
+table { border-collapse: collapse; margin-bottom: 2em; }
+th, td { padding: 0.2em 0.8em; text-align: left; border-bottom: 1px solid #ddd; }
+td.number { text-align: right; font-family: monospace; }
+.worse { color: #b00; }
+svg polyline { fill: none; stroke: #36c; stroke-width: 1.5; }
+svg circle { fill: #36c; }
+"""
+
+
+@dataclass
+class PartHistory:
+    """Values of a part's metrics in each of the benchmarks, oldest first, None where it wasn't measured."""
+
+    key: str
+    medians: list[float | None] = field(default_factory=list)
+    peaks: list[float | None] = field(default_factory=list)
+
+    @property
+    def latest_median(self) -> float | None:
+        return self.medians[-1] if self.medians else None
+
+    @property
+    def latest_peak(self) -> float | None:
+        return self.peaks[-1] if self.peaks else None
+
+
+def load_history(directory: str | Path = BENCHMARK_DIR, test: bool = False) -> list[dict]:
+    """The benchmarks stored in the directory, of the full inputs or of the test ones, in the order they were made."""
+    benchmarks = []
+    for path in Path(directory).glob("*.json"):
+        try:
+            benchmark = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            continue
+        # the sweeps are stored alongside, they have no "test" flag
+        if isinstance(benchmark, dict) and "parts" in benchmark and benchmark.get("test") == test:
+            benchmarks.append(benchmark)
+    return sorted(benchmarks, key=lambda benchmark: benchmark["created"])
+
+
+def part_histories(benchmarks: list[dict]) -> dict[str, PartHistory]:
+    keys = sorted({key for benchmark in benchmarks for key in benchmark["parts"]})
+    histories = {key: PartHistory(key) for key in keys}
+    for benchmark in benchmarks:
+        for key, history in histories.items():
+            part = benchmark["parts"].get(key, {})
+            history.medians.append(part.get("median"))
+            history.peaks.append(part.get("peak_memory"))
+    return histories
+
+
+def sparkline(values: list[float | None], labels: list[str], width: int = 160, height: int = 28) -> str:
+    """
+    An inline SVG line of the values, scaled to fill its height; the missing values leave a gap, the latest one is
+    marked with a dot. Hovering over it lists the values with their labels.
+    """
+    measured = [value for value in values if value is not None]
+    if not measured:
+        return ""
+    low, high = min(measured), max(measured)
+    span = (high - low) or 1.0
+    step = width / max(len(values) - 1, 1)
+
+    def point(i: int, value: float) -> tuple[float, float]:
+        return i * step if len(values) > 1 else width / 2, height - 2 - (value - low) / span * (height - 4)
+
+    segments, segment = [], []
+    for i, value in enumerate(values):
+        if value is None:
+            segments.append(segment)
+            segment = []
+        else:
+            segment.append(point(i, value))
+    segments.append(segment)
+
+    shapes = [
+        f'<polyline points="{" ".join(f"{x:.1f},{y:.1f}" for x, y in segment)}"/>' for segment in segments if segment
+    ]
+    last = max(i for i, value in enumerate(values) if value is not None)
+    x, y = point(last, values[last])
+    shapes.append(f'<circle cx="{x:.1f}" cy="{y:.1f}" r="2"/>')
+    title = "\n".join(f"{label}: {value if value is not None else '-'}" for label, value in zip(labels, values))
+    return (
+        f'<svg width="{width}" height="{height}" viewBox="-3 0 {width + 6} {height}">'
+        f"<title>{html.escape(title)}</title>{''.join(shapes)}</svg>"
+    )
+
+
+def _cell(value: str, number: bool = False, css: str = "") -> str:
+    classes = " ".join(name for name in ("number" if number else "", css) if name)
+    return f'<td class="{classes}">{value}</td>' if classes else f"<td>{value}</td>"
+
+
+def _part_rows(histories: list[PartHistory], labels: list[str]) -> list[str]:
+    rows = []
+    for history in histories:
+        median, peak = history.latest_median, history.latest_peak
+        rows.append(
+            "<tr>"
+            + _cell(html.escape(history.key))
+            + _cell(_format_metric("median", median) if median is not None else "-", number=True)
+            + _cell(sparkline(history.medians, labels))
+            + _cell(_format_metric("peak_memory", peak) if peak is not None else "-", number=True)
+            + _cell(sparkline(history.peaks, labels))
+            + "</tr>"
+        )
+    return rows
+
+
+def _parts_table(histories: list[PartHistory], labels: list[str]) -> str:
+    header = "<tr><th>Part</th><th>Median</th><th>Trend</th><th>Peak memory</th><th>Trend</th></tr>"
+    return f"<table>{header}{''.join(_part_rows(histories, labels))}</table>"
+
+
+def _regressions_table(regressions: list[Regression]) -> str:
+    if not regressions:
+        return "<p>None of the parts regressed.</p>"
+    header = "<tr><th>Part</th><th>Metric</th><th>Before</th><th>After</th><th>Change</th></tr>"
+    rows = [
+        "<tr>"
+        + _cell(html.escape(regression.key))
+        + _cell(html.escape(regression.metric))
+        + _cell(_format_metric(regression.metric, regression.baseline), number=True)
+        + _cell(_format_metric(regression.metric, regression.current), number=True)
+        + _cell(f"{regression.ratio - 1:+.1%}", number=True, css="worse")
+        + "</tr>"
+        for regression in regressions
+    ]
+    return f"<table>{header}{''.join(rows)}</table>"
+
+
+def render(benchmarks: list[dict], slowest: int = 20, threshold: float = 0.1) -> str:
+    """
+    The report of the benchmarks (oldest first) as an HTML page.
+
+    :param benchmarks: benchmarks to report on, as loaded by `load_history`
+    :param slowest: how many of the slowest parts (by their latest median) and of the biggest regressions to list
+    :param threshold: relative growth between the last two benchmarks that counts as a regression
+    """
+    labels = [benchmark["commit"] or benchmark["created"] for benchmark in benchmarks]
+    histories = part_histories(benchmarks)
+    sections = []
+    if benchmarks:
+        first, last = benchmarks[0], benchmarks[-1]
+        sections.append(
+            f"<p>{len(benchmarks)} benchmarks of {len(histories)} parts, from {html.escape(labels[0])} "
+            f"({html.escape(first['created'])}) to {html.escape(labels[-1])} ({html.escape(last['created'])}).</p>"
+        )
+    else:
+        sections.append("<p>There are no stored benchmarks yet, run <code>run.py --benchmark</code> first.</p>")
+
+    if len(benchmarks) > 1:
+        regressions = compare(benchmarks[-1], benchmarks[-2], threshold)[:slowest]
+        sections.append(
+            f"<h2>Biggest regressions since {html.escape(labels[-2])}</h2>{_regressions_table(regressions)}"
+        )
+
+    measured = [history for history in histories.values() if history.latest_median is not None]
+    by_median = sorted(measured, key=lambda history: history.latest_median, reverse=True)[:slowest]
+    sections.append(f"<h2>Slowest {len(by_median)} parts</h2>{_parts_table(by_median, labels)}")
+    sections.append(f"<h2>All parts</h2>{_parts_table(list(histories.values()), labels)}")
+
+    return (
+        '<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>Advent of Code performance</title>'
+        f"<style>{_STYLE}</style></head><body><h1>Advent of Code performance</h1>{''.join(sections)}</body></html>\n"
+    )
+
+
+def write_report(
+    path: str | Path = REPORT_FILE,
+    directory: str | Path = BENCHMARK_DIR,
+    test: bool = False,
+    slowest: int = 20,
+    threshold: float = 0.1,
+) -> Path:
+    """Renders the report of the benchmarks stored in the directory into the file, see `render`."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render(load_history(directory, test), slowest, threshold))
+    return path
@@ -0,0 +1,605 @@
+"""Running the solutions' parts in a process pool and summarizing their timings."""
+
+import contextlib
+import io
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import timeit
+import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator
+
+from aoc.budgets import OOM, TIMEOUT, Budget, BudgetManifest, DayBudgets, OutOfTime, enforce
+from aoc.cache import AnswerCache, InputCache
+from aoc.counters import WorkCounts, counters
+from aoc.day import (
+    PARTS,
+    PREPARE,
+    Day,
+    Prepared,
+    load_arguments,
+    part_arguments,
+    prepare_input,
+    solution_module,
+)
+from aoc.memory import MemoryUsage, measure_memory
+from aoc.timing import Statistics
+
+
+@dataclass
+class PartResult:
+    part: str
+    answer: str | None = None
+    seconds: float = 0.0
+    error: str | None = None
+    statistics: Statistics | None = None
+    memory: MemoryUsage | None = None
+    counts: WorkCounts | None = None
+    cached: bool = False
+    # TIMEOUT or OOM if the part ran out of its budget, the error says which one it was
+    exceeded: str | None = None
+
+
+@dataclass
+class DayResult:
+    day: Day
+    parts: list[PartResult] = field(default_factory=list)
+    error: str | None = None
+    concurrent: bool = False
+    # timing of the day's `prepare` hook, if it has one
+    prepare: PartResult | None = None
+
+    @property
+    def stages(self) -> list[PartResult]:
+        """The prepare stage (of the days that have one) followed by the parts."""
+        return [self.prepare, *self.parts] if self.prepare else self.parts
+
+    @property
+    def seconds(self) -> float:
+        return sum(stage.seconds for stage in self.stages)
+
+    @property
+    def overlapped_seconds(self) -> float:
+        """
+        Time of the prepare stage and the slower part if the parts ran concurrently (prepare runs before both of
+        them), otherwise of all the stages.
+        """
+        if self.concurrent and self.parts:
+            return (self.prepare.seconds if self.prepare else 0) + max(part.seconds for part in self.parts)
+        return self.seconds
+
+    @property
+    def cached(self) -> bool:
+        return bool(self.parts) and all(part.cached for part in self.parts)
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.error and all(not part.error for part in self.parts)
+
+    def answers(self) -> dict[str, dict]:
+        return {part.part: {"answer": part.answer, "seconds": part.seconds} for part in self.parts}
+
+    @classmethod
+    def from_answers(cls, day: Day, answers: dict[str, dict]) -> "DayResult":
+        parts = [PartResult(part, entry["answer"], entry["seconds"], cached=True) for part, entry in answers.items()]
+        return cls(day, parts)
+
+
+def run_day(
+    day: Day,
+    test: bool = False,
+    warmup: int = 0,
+    repeat: int = 1,
+    memory: bool = False,
+    input_cache: bool = True,
+    stats: bool = False,
+    concurrent_parts: bool = False,
+    budgets: DayBudgets | None = None,
+    on_stage: Callable[[PartResult], object] | None = None,
+) -> DayResult:
+    """
+    Runs both parts of a single day, each one on a freshly loaded input (some parts mutate what they are given).
+    Anything the solution prints is swallowed, so it doesn't interleave with the other days' output. The days with a
+    `prepare` hook have it timed as a stage of its own, run once, and both parts are given what it returns.
+
+    :param day: day to run
+    :param test: whether to use the test input
+    :param warmup: number of untimed runs of each part before the measured ones
+    :param repeat: number of measured runs of each part; the reported time is their median
+    :param memory: whether to measure the peak memory of each part, in one more run under tracemalloc
+    :param input_cache: whether to load the parsed inputs from the on-disk cache (parsing and storing them on a miss)
+    :param stats: whether to collect what the solution records into `aoc.counters` during the last measured run of
+        each part (the timings then include the cost of recording)
+    :param concurrent_parts: whether to run the two parts side by side, each in a process of its own
+    :param budgets: budgets of the day's stages, each run of a stage is stopped once it's out of its budget (see
+        `aoc.budgets`); the day's own budget is left to `run_days`, which runs the day in a process it can kill
+    :param on_stage: called with the result of each stage as soon as it's done
+    """
+    _check_repeat(repeat)
+    result = DayResult(day, concurrent=concurrent_parts)
+    input_file = day.input_file(test)
+    if not input_file.exists():
+        result.error = f"missing {input_file.name}"
+        return result
+
+    cache = InputCache() if input_cache else None
+    budgets = budgets or DayBudgets()
+    on_stage = on_stage or (lambda stage: None)
+    try:
+        if concurrent_parts:
+            result.prepare, result.parts = _run_parts_concurrently(
+                day, input_file, test, warmup, repeat, memory, cache, stats, budgets
+            )
+            for stage in result.stages:
+                on_stage(stage)
+            return result
+        with contextlib.redirect_stdout(io.StringIO()), solution_module(day) as module:
+            prepared = None
+            if hasattr(module, PREPARE):
+                result.prepare, prepared = run_prepare(
+                    module, input_file, test, warmup, repeat, cache, budgets.for_stage(PREPARE)
+                )
+                on_stage(result.prepare)
+            for part in PARTS:
+                result.parts.append(
+                    run_part(
+                        module,
+                        part,
+                        input_file,
+                        test,
+                        warmup,
+                        repeat,
+                        memory,
+                        cache,
+                        stats,
+                        prepared,
+                        budgets.for_stage(part),
+                    )
+                )
+                on_stage(result.parts[-1])
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+
+    return result
+
+
+def run_part(
+    module,
+    part: str,
+    input_file,
+    test: bool,
+    warmup: int,
+    repeat: int,
+    memory: bool,
+    cache: InputCache | None,
+    stats: bool = False,
+    prepared: Prepared | None = None,
+    budget: Budget | None = None,
+) -> PartResult:
+    """
+    Runs a part of an imported solution the way `run_day` does, see its parameters. The part of a day with a
+    `prepare` hook is given the `prepared` context, which is prepared here (untimed) if it isn't passed. Each run of
+    the part (the memory measuring one included) is held to the budget.
+    """
+    _check_repeat(repeat)
+    result = PartResult(part)
+    if not hasattr(module, part):
+        result.error = f"no {part} defined"
+        return result
+
+    if stats:
+        counters.enable()
+    try:
+        if prepared is None:
+            prepared = prepare_input(module, input_file, test, cache)
+        samples = []
+        for iteration in range(warmup + repeat):
+            arguments = part_arguments(module, part, input_file, test, cache, prepared)
+            counters.reset()
+            with enforce(budget):
+                start_time = timeit.default_timer()
+                answer = getattr(module, part)(*arguments)
+                elapsed = timeit.default_timer() - start_time
+            if iteration >= warmup:
+                samples.append(elapsed)
+
+        result.answer = str(answer)
+        result.statistics = Statistics(samples)
+        result.seconds = result.statistics.median
+        if stats:
+            result.counts = counters.snapshot()
+
+        if memory:
+            arguments = part_arguments(module, part, input_file, test, cache, prepared)
+            with enforce(budget):
+                _answer, result.memory = measure_memory(getattr(module, part), *arguments)
+    except Exception as e:
+        _record_error(result, e, budget)
+    finally:
+        counters.disable()
+
+    return result
+
+
+def _check_repeat(repeat: int):
+    # with no measured run there is neither an answer nor a time to report
+    if repeat < 1:
+        raise ValueError(f"each stage has to run at least once, got repeat={repeat}")
+
+
+def _record_error(result: PartResult, error: Exception, budget: Budget | None):
+    if isinstance(error, OutOfTime):
+        result.exceeded = TIMEOUT
+        result.error = f"a run took longer than the {budget.seconds:g}s budget"
+    elif isinstance(error, MemoryError) and budget and budget.memory_mb is not None:
+        result.exceeded = OOM
+        result.error = f"a run needed more than the {budget.memory_mb:g} MiB budget"
+    else:
+        result.error = traceback.format_exception_only(error)[-1].strip()
+
+
+def run_prepare(
+    module,
+    input_file,
+    test: bool,
+    warmup: int,
+    repeat: int,
+    cache: InputCache | None,
+    budget: Budget | None = None,
+) -> tuple[PartResult, Prepared | None]:
+    """
+    Times the `prepare` hook of an imported solution the way `run_part` times a part, within the same budget.
+
+    :return: the timing of the stage, and the context made in its last run (None if it failed)
+    """
+    _check_repeat(repeat)
+    result = PartResult(PREPARE)
+    try:
+        samples = []
+        for iteration in range(warmup + repeat):
+            with enforce(budget):
+                prepared = prepare_input(module, input_file, test, cache)
+            if iteration >= warmup:
+                samples.append(prepared.seconds)
+
+        result.statistics = Statistics(samples)
+        result.seconds = result.statistics.median
+        return result, prepared
+    except Exception as e:
+        _record_error(result, e, budget)
+        return result, None
+
+
+def _run_part_in_process(
+    day: Day,
+    part: str,
+    input_file,
+    test: bool,
+    warmup: int,
+    repeat: int,
+    memory: bool,
+    input_cache: bool,
+    stats: bool,
+    prepared: Prepared | None,
+    budget: Budget,
+    connection,
+):
+    try:
+        cache = InputCache() if input_cache else None
+        with contextlib.redirect_stdout(io.StringIO()), solution_module(day) as module:
+            result = run_part(module, part, input_file, test, warmup, repeat, memory, cache, stats, prepared, budget)
+    except Exception as e:
+        result = PartResult(part, error=f"{type(e).__name__}: {e}")
+    connection.send(result)
+
+
+def _run_parts_concurrently(
+    day: Day,
+    input_file,
+    test: bool,
+    warmup: int,
+    repeat: int,
+    memory: bool,
+    cache: InputCache | None,
+    stats: bool,
+    budgets: DayBudgets,
+) -> tuple[PartResult | None, list[PartResult]]:
+    """
+    Runs each part in a process of its own, at the same time. The input is parsed once up front, when it's cached, so
+    both processes load the same parsed input from the cache instead of parsing it each. The `prepare` hook is run
+    up front too, and its context handed to both processes.
+    """
+    prepare, prepared = None, None
+    with contextlib.redirect_stdout(io.StringIO()), solution_module(day) as module:
+        if cache is not None:
+            load_arguments(module, input_file, test, cache)
+        if hasattr(module, PREPARE):
+            prepare, prepared = run_prepare(module, input_file, test, warmup, repeat, cache, budgets.for_stage(PREPARE))
+
+    workers = []
+    for part in PARTS:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=_run_part_in_process,
+            args=(
+                day,
+                part,
+                input_file,
+                test,
+                warmup,
+                repeat,
+                memory,
+                cache is not None,
+                stats,
+                prepared,
+                budgets.for_stage(part),
+                sender,
+            ),
+        )
+        process.start()
+        sender.close()
+        workers.append((part, receiver, process))
+
+    results = []
+    for part, receiver, process in workers:
+        try:
+            results.append(receiver.recv())
+        except EOFError:
+            results.append(PartResult(part, error=f"worker died with exit code {process.exitcode}"))
+        process.join()
+    return prepare, results
+
+
+def run_days(
+    days: Iterable[Day],
+    test: bool = False,
+    workers: int | None = None,
+    warmup: int = 0,
+    repeat: int = 1,
+    memory: bool = False,
+    input_cache: bool = True,
+    stats: bool = False,
+    concurrent_parts: bool = False,
+    answer_cache: AnswerCache | None = None,
+    force: bool = False,
+    budgets: BudgetManifest | None = None,
+) -> Iterator[DayResult]:
+    """
+    Runs the given days across a pool of worker processes. With budgets, each day runs in a process of its own
+    instead, killed once it's out of its day's budget (see `aoc.budgets`); the stages it didn't finish are reported
+    as TIMEOUT, or as OOM if the system killed it for its memory.
+
+    :param days: days to run
+    :param test: whether to use the test inputs
+    :param workers: size of the process pool, defaults to the number of CPUs
+    :param warmup: see `run_day`
+    :param repeat: see `run_day`
+    :param memory: see `run_day`
+    :param input_cache: see `run_day`
+    :param stats: see `run_day`
+    :param concurrent_parts: see `run_day`
+    :param answer_cache: where to look up the answers of the days that didn't change since their last successful run,
+        and to store the new ones; the days are always run without one
+    :param force: run every day even if its answers are cached (the cache is still refreshed)
+    :param budgets: manifest of the days' budgets to enforce
+    :return: results of the days, in the order they were given
+    """
+    _check_repeat(repeat)
+    days = list(days)
+    cached = {}
+    if answer_cache and not force:
+        cached = {day: answers for day in days if (answers := answer_cache.get(day, test)) is not None}
+
+    missing = [day for day in days if day not in cached]
+    arguments = (test, warmup, repeat, memory, input_cache, stats, concurrent_parts)
+    if budgets:
+        runs = warmup + repeat + memory
+        computed = _run_days_sandboxed(missing, workers or os.cpu_count(), budgets, runs, arguments)
+    else:
+        computed = _run_days_in_pool(missing, workers or os.cpu_count(), arguments)
+
+    for day in days:
+        if day in cached:
+            yield DayResult.from_answers(day, cached[day])
+            continue
+
+        result = next(computed)
+        if answer_cache and result.succeeded:
+            answer_cache.store(day, result.answers(), test)
+        yield result
+
+
+def _run_days_in_pool(days: list[Day], workers: int, arguments: tuple) -> Iterator[DayResult]:
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(run_day, days, *([argument] * len(days) for argument in arguments))
+
+
+def _stages(day: Day) -> list[str]:
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), solution_module(day) as module:
+            return [PREPARE, *PARTS] if hasattr(module, PREPARE) else list(PARTS)
+    except Exception:
+        # run_day reports why it can't be imported
+        return list(PARTS)
+
+
+def _run_day_in_sandbox(day: Day, arguments: tuple, budgets: DayBudgets, connection):
+    """
+    Runs a day for `_run_days_sandboxed`. It sends the names of the day's stages first, then the result of each
+    stage as soon as it's done, and finally the whole day's result.
+    """
+    if hasattr(os, "setpgrp"):
+        # a group of its own, so the processes running its parts concurrently are killed along with it
+        os.setpgrp()
+    with enforce(Budget(memory_mb=budgets.day.memory_mb)):
+        connection.send(_stages(day))
+        connection.send(run_day(day, *arguments, budgets=budgets, on_stage=connection.send))
+
+
+@dataclass
+class _Sandbox:
+    """A day running in a process of its own, and what it sent back so far."""
+
+    day: Day
+    process: multiprocessing.Process
+    receiver: multiprocessing.connection.Connection
+    budgets: DayBudgets
+    # seconds the day may take, and when they run out in the `timeit.default_timer` clock; None without a budget
+    seconds: float | None
+    deadline: float | None
+    stages: list[str] = field(default_factory=lambda: list(PARTS))
+    finished: list[PartResult] = field(default_factory=list)
+    result: DayResult | None = None
+
+    @classmethod
+    def start(cls, day: Day, arguments: tuple, budgets: DayBudgets, runs: int) -> "_Sandbox":
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(target=_run_day_in_sandbox, args=(day, arguments, budgets, sender))
+        process.start()
+        sender.close()
+        seconds = budgets.deadline(runs)
+        deadline = None if seconds is None else timeit.default_timer() + seconds
+        return cls(day, process, receiver, budgets, seconds, deadline)
+
+    def receive(self):
+        """Takes in the messages that arrived, and kills the process if it's past its deadline."""
+        try:
+            while self.result is None and self.receiver.poll():
+                message = self.receiver.recv()
+                if isinstance(message, DayResult):
+                    self.result = message
+                elif isinstance(message, PartResult):
+                    self.finished.append(message)
+                else:
+                    self.stages = message
+        except EOFError:
+            self.process.join()
+            # SIGKILL is what the system's out-of-memory killer sends
+            if self.process.exitcode == -signal.SIGKILL and self.budgets.day.memory_mb is not None:
+                self.result = self._interrupted(OOM, f"killed for needing more than its {self.budgets.day.memory_mb:g} MiB")
+            else:
+                self.result = self._interrupted(None, f"worker died with exit code {self.process.exitcode}")
+
+        if self.result is None and self.deadline is not None and timeit.default_timer() >= self.deadline:
+            self.kill()
+            self.result = self._interrupted(TIMEOUT, f"not finished within the day's {self.seconds:g}s budget")
+
+    def kill(self):
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            # no process groups on this platform, or the process didn't get to make its own yet
+            self.process.kill()
+        self.process.join()
+
+    def _interrupted(self, exceeded: str | None, error: str) -> DayResult:
+        """The day's result with the stages it didn't finish failed with the error."""
+        result = DayResult(self.day)
+        finished = {stage.part: stage for stage in self.finished}
+        for name in self.stages:
+            stage = finished.get(name) or PartResult(name, error=error, exceeded=exceeded)
+            if name == PREPARE:
+                result.prepare = stage
+            else:
+                result.parts.append(stage)
+        return result
+
+
+def _run_days_sandboxed(
+    days: list[Day], workers: int, budgets: BudgetManifest, runs: int, arguments: tuple
+) -> Iterator[DayResult]:
+    """Runs each day in a process of its own, at most `workers` of them at once, see `run_days`."""
+    pending = deque(days)
+    running: list[_Sandbox] = []
+    done: dict[Day, DayResult] = {}
+    for day in days:
+        while day not in done:
+            while pending and len(running) < workers:
+                next_day = pending.popleft()
+                running.append(_Sandbox.start(next_day, arguments, budgets.for_day(next_day), runs))
+
+            deadlines = [sandbox.deadline for sandbox in running if sandbox.deadline is not None]
+            timeout = max(0.0, min(deadlines) - timeit.default_timer()) if deadlines else None
+            multiprocessing.connection.wait([sandbox.receiver for sandbox in running], timeout)
+            for sandbox in list(running):
+                sandbox.receive()
+                if sandbox.result is not None:
+                    sandbox.process.join()
+                    running.remove(sandbox)
+                    done[sandbox.day] = sandbox.result
+        yield done.pop(day)
+
+
+def format_table(results: list[DayResult], wall_clock: float, slowest: int = 5) -> str:
+    """Formats the results as a table, followed by the totals and the days that dominate the run time."""
+    measured_parts = [part for day_result in results for part in day_result.parts if part.memory]
+    memory_header = ("PEAK [KiB]",) if measured_parts else ()
+    rows = [("DAY", "PART", "TIME [s]", *memory_header, "ANSWER")]
+    for day_result in results:
+        if day_result.error:
+            rows.append((day_result.day.name, "-", "-", *("-" for _ in memory_header), f"ERROR: {day_result.error}"))
+            continue
+        for part in day_result.stages:
+            answer = f"{part.exceeded or 'ERROR'}: {part.error}" if part.error else _single_line(part.answer or "-")
+            if part.cached:
+                answer += " (cached)"
+            peak = (f"{part.memory.peak / 1024:.1f}" if part.memory else "-" for _ in memory_header)
+            rows.append((day_result.day.name, part.part, f"{part.seconds:.6f}", *peak, answer))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]) - 1)]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)) + "  " + row[-1] for row in rows]
+
+    total = sum(day_result.seconds for day_result in results)
+    lines.append("")
+    lines.append(f"Solved {len(results)} days in {wall_clock:.3f}s wall clock ({total:.3f}s spent in parts).")
+    if any(day_result.concurrent for day_result in results):
+        overlapped = sum(day_result.overlapped_seconds for day_result in results)
+        lines.append(f"The parts ran concurrently, overlapped they took {overlapped:.3f}s.")
+    exceeded = [part for day_result in results for part in day_result.stages if part.exceeded]
+    if exceeded:
+        lines.append(f"{len(exceeded)} parts ran out of their budgets.")
+    cached = sum(day_result.cached for day_result in results)
+    if cached:
+        lines.append(f"{cached} unchanged days were answered from the cache, their times are from their last run.")
+
+    dominating = sorted(results, key=lambda r: r.seconds, reverse=True)[:slowest]
+    if total > 0 and dominating:
+        lines.append(f"Slowest {len(dominating)} days:")
+        for day_result in dominating:
+            share = 100 * day_result.seconds / total
+            lines.append(f"  {day_result.day.name:<8} {day_result.seconds:>10.6f}s  {share:5.1f}%")
+
+    if measured_parts:
+        lines.append(f"Biggest {min(slowest, len(measured_parts))} memory peaks:")
+        by_peak = sorted(
+            ((day_result.day, part) for day_result in results for part in day_result.parts if part.memory),
+            key=lambda day_part: day_part[1].memory.peak,
+            reverse=True,
+        )
+        for day, part in by_peak[:slowest]:
+            lines.append(f"  {day.name}/{part.part}: {part.memory.peak / 1024:.1f} KiB")
+            lines.extend(f"    {site}" for site in part.memory.top_sites)
+
+    return "\n".join(lines)
+
+
+def format_counts(results: list[DayResult]) -> str:
+    """Lists what each part recorded into `aoc.counters`, for the runs with `stats` collected."""
+    lines = ["Work counters:"]
+    for day_result in results:
+        for part in day_result.parts:
+            if part.counts:
+                lines.append(f"  {day_result.day.name}/{part.part}")
+                lines.extend(f"    {line}" for line in part.counts.lines())
+    if len(lines) == 1:
+        lines.append("  none of the parts recorded anything")
+    return "\n".join(lines)
+
+
+def _single_line(answer: str, limit: int = 60) -> str:
+    answer = answer.replace("\n", "\\n")
+    return answer if len(answer) <= limit else answer[: limit - 3] + "..."
@@ -0,0 +1,209 @@
+"""
+Shortest-path searches over implicit graphs, shared by the days that look for the cheapest way through a maze.
+
+A graph is given by a function returning the neighbours of a node: `(node, cost)` pairs for the weighted searches and
+plain nodes for the breadth-first one. Nodes can be anything hashable, but the flat indices of an `aoc.grid.Grid` are
+the cheapest. All the searches take several start nodes at once (a multi-source search costs the same as a single one)
+and stop as soon as they settle a node satisfying `goal`, or explore everything they can reach if there is none.
+
+- `bfs` for unit costs, a plain FIFO queue;
+- `dial` for small integer costs, a bucket queue indexed by distance (Dial's algorithm), with no heap at all;
+- `dijkstra` for any non-negative costs, a binary heap;
+- `a_star` for the same with an admissible heuristic, a binary heap ordered by `distance + heuristic`.
+"""
+
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import count
+from typing import Callable, Generic, Hashable, Iterable, Iterator, TypeVar
+
+from aoc.counters import counters
+
+Node = TypeVar("Node", bound=Hashable)
+Neighbours = Callable[[Node], Iterable[Node]]
+WeightedNeighbours = Callable[[Node], Iterable[tuple[Node, int]]]
+Goal = Callable[[Node], bool]
+
+
+@dataclass
+class SearchResult(Generic[Node]):
+    """
+    What a search found: the distances of the nodes it reached and the predecessor of each node on its shortest path.
+    The paths are only rebuilt on request, by walking the predecessors back.
+    """
+
+    distances: dict[Node, int] = field(default_factory=dict)
+    came_from: dict[Node, Node] = field(default_factory=dict)
+    goal: Node | None = None
+
+    @property
+    def found(self) -> bool:
+        return self.goal is not None
+
+    @property
+    def distance(self) -> int | None:
+        """Distance of the goal, or None if it wasn't reached."""
+        return self.distances[self.goal] if self.found else None
+
+    def walk_back(self, node: Node | None = None) -> Iterator[Node]:
+        """Nodes of the shortest path to the node (the goal by default), from the node back to its start."""
+        node = self.goal if node is None else node
+        if node not in self.distances:
+            return
+        yield node
+        while node in self.came_from:
+            node = self.came_from[node]
+            yield node
+
+    def path(self, node: Node | None = None) -> list[Node]:
+        """Nodes of the shortest path to the node (the goal by default), from its start, or [] if it wasn't reached."""
+        path = list(self.walk_back(node))
+        path.reverse()
+        return path
+
+
+def _record(algorithm: str, result: SearchResult, expanded: int) -> SearchResult:
+    """Records the work a search did into `aoc.counters`: the nodes it expanded and how many it reached."""
+    if counters.enabled:
+        counters.count(f"{algorithm}.searches")
+        counters.count(f"{algorithm}.expanded", expanded)
+        counters.observe(f"{algorithm}.reached", len(result.distances))
+    return result
+
+
+def bfs(starts: Iterable[Node], neighbours: Neighbours, goal: Goal | None = None) -> SearchResult[Node]:
+    """
+    Breadth-first search, for graphs whose edges all cost 1.
+
+    :param starts: nodes at distance 0
+    :param neighbours: nodes one step away from the given one
+    :param goal: predicate of the node to stop at; without one the whole reachable graph is explored
+    :return: distances and predecessors of the reached nodes
+    """
+    result = SearchResult()
+    distances, came_from = result.distances, result.came_from
+    queue = deque()
+    for start in starts:
+        if start not in distances:
+            distances[start] = 0
+            queue.append(start)
+
+    expanded = 0
+    while queue:
+        node = queue.popleft()
+        if goal is not None and goal(node):
+            result.goal = node
+            break
+        expanded += 1
+        distance = distances[node] + 1
+        for neighbour in neighbours(node):
+            if neighbour not in distances:
+                distances[neighbour] = distance
+                came_from[neighbour] = node
+                queue.append(neighbour)
+    return _record("bfs", result, expanded)
+
+
+def dial(
+    starts: Iterable[Node], neighbours: WeightedNeighbours, goal: Goal | None = None, max_cost: int = 9
+) -> SearchResult[Node]:
+    """
+    Dijkstra's algorithm with a bucket queue (Dial's algorithm), for integer costs between 0 and `max_cost`. All the
+    nodes waiting in the queue are less than `max_cost + 1` apart, so the buckets are reused cyclically, and taking
+    the nearest node is a pop from the current bucket instead of a heap operation.
+
+    :param starts: nodes at distance 0
+    :param neighbours: `(node, cost)` pairs of the nodes one edge away from the given one
+    :param goal: predicate of the node to stop at; without one the whole reachable graph is explored
+    :param max_cost: upper bound of the cost of an edge
+    :return: distances and predecessors of the settled nodes
+    """
+    result = SearchResult()
+    distances, came_from = result.distances, result.came_from
+    buckets: list[list[Node]] = [[] for _ in range(max_cost + 1)]
+    for start in starts:
+        distances[start] = 0
+        buckets[0].append(start)
+
+    distance, waiting, expanded = 0, len(buckets[0]), 0
+    while waiting and not result.found:
+        bucket = buckets[distance % len(buckets)]
+        while bucket:
+            node = bucket.pop()
+            waiting -= 1
+            # a node is queued again whenever a shorter way to it turns up, the stale entries are skipped
+            if distances[node] != distance:
+                continue
+            if goal is not None and goal(node):
+                result.goal = node
+                break
+            expanded += 1
+            for neighbour, cost in neighbours(node):
+                candidate = distance + cost
+                if candidate < distances.get(neighbour, candidate + 1):
+                    distances[neighbour] = candidate
+                    came_from[neighbour] = node
+                    buckets[candidate % len(buckets)].append(neighbour)
+                    waiting += 1
+        distance += 1
+    return _record("dial", result, expanded)
+
+
+def dijkstra(starts: Iterable[Node], neighbours: WeightedNeighbours, goal: Goal | None = None) -> SearchResult[Node]:
+    """Dijkstra's algorithm with a binary heap, for any non-negative costs. See `dial` for the parameters."""
+    return _heap_search("dijkstra", starts, neighbours, goal, lambda node: 0)
+
+
+def a_star(
+    starts: Iterable[Node],
+    neighbours: WeightedNeighbours,
+    goal: Goal | None,
+    heuristic: Callable[[Node], int],
+) -> SearchResult[Node]:
+    """
+    A* search with a binary heap. The heuristic must never overestimate the distance to the nearest goal, or the
+    path found may not be the shortest one.
+
+    :param starts: nodes at distance 0
+    :param neighbours: `(node, cost)` pairs of the nodes one edge away from the given one
+    :param goal: predicate of the node to stop at
+    :param heuristic: lower bound of the distance from the node to a goal
+    :return: distances and predecessors of the reached nodes
+    """
+    return _heap_search("a_star", starts, neighbours, goal, heuristic)
+
+
+def _heap_search(
+    algorithm: str,
+    starts: Iterable[Node],
+    neighbours: WeightedNeighbours,
+    goal: Goal | None,
+    heuristic: Callable[[Node], int],
+) -> SearchResult[Node]:
+    result = SearchResult()
+    distances, came_from = result.distances, result.came_from
+    # the counter breaks the ties between equally promising nodes, so the nodes themselves are never compared
+    tie_breaker = count()
+    heap = []
+    for start in starts:
+        distances[start] = 0
+        heap.append((heuristic(start), next(tie_breaker), 0, start))
+    heapq.heapify(heap)
+
+    expanded = 0
+    while heap:
+        _, _, distance, node = heapq.heappop(heap)
+        if distance != distances[node]:
+            continue
+        if goal is not None and goal(node):
+            result.goal = node
+            break
+        expanded += 1
+        for neighbour, cost in neighbours(node):
+            candidate = distance + cost
+            if candidate < distances.get(neighbour, candidate + 1):
+                distances[neighbour] = candidate
+                came_from[neighbour] = node
+                heapq.heappush(heap, (candidate + heuristic(neighbour), next(tie_breaker), candidate, neighbour))
+    return _record(algorithm, result, expanded)
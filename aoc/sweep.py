@@ -0,0 +1,204 @@
+"""Running the parts on ever bigger generated inputs and fitting curves of their empirical complexity."""
+
+import contextlib
+import io
+import math
+import multiprocessing
+import platform
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from aoc.benchmark import BENCHMARK_DIR, current_commit
+from aoc.day import PARTS, Day, solution_module
+from aoc.generators import GENERATORS, generated_input
+from aoc.runner import PartResult, run_part
+
+MODELS: dict[str, Callable[[float], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log(n),
+    # e.g. walking a single row or column of a grid input
+    "O(sqrt n)": lambda n: math.sqrt(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * math.log(n),
+    "O(n^2)": lambda n: n**2,
+    "O(n^3)": lambda n: n**3,
+}
+
+
+@dataclass
+class SweepPoint:
+    scale: int
+    size: int
+    seconds: float | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        return {"scale": self.scale, "size": self.size, "seconds": self.seconds, "error": self.error}
+
+
+@dataclass
+class Fit:
+    model: str
+    exponent: float
+
+    def __str__(self):
+        return f"{self.model} (n^{self.exponent:.2f})"
+
+
+@dataclass
+class PartSweep:
+    day: Day
+    part: str
+    points: list[SweepPoint] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return f"{self.day.name}/{self.part}"
+
+    @property
+    def fit(self) -> Fit | None:
+        measured = [point for point in self.points if point.seconds]
+        return fit_complexity([point.size for point in measured], [point.seconds for point in measured])
+
+
+def fit_complexity(sizes: list[int], seconds: list[float]) -> Fit | None:
+    """
+    Picks the complexity class whose curve, scaled by a constant, fits the measurements best. The fit is done on a
+    log-log scale, where the constant is an offset and the best model is the one leaving the least variance in
+    `log(t) - log(f(n))`. The exponent is the slope of the least-squares line through the same points.
+
+    :param sizes: sizes of the inputs (in bytes)
+    :param seconds: times measured on them
+    :return: the best fit, or None if there are fewer than two different sizes
+    """
+    if len(set(sizes)) < 2:
+        return None
+
+    log_sizes = [math.log(size) for size in sizes]
+    log_seconds = [math.log(t) for t in seconds]
+
+    def residual_variance(model: Callable[[float], float]) -> float:
+        residuals = [log_t - math.log(model(size)) for size, log_t in zip(sizes, log_seconds)]
+        mean = sum(residuals) / len(residuals)
+        return sum((r - mean) ** 2 for r in residuals)
+
+    best = min(MODELS, key=lambda name: residual_variance(MODELS[name]))
+
+    mean_size, mean_seconds = sum(log_sizes) / len(log_sizes), sum(log_seconds) / len(log_seconds)
+    covariance = sum((s - mean_size) * (t - mean_seconds) for s, t in zip(log_sizes, log_seconds))
+    variance = sum((s - mean_size) ** 2 for s in log_sizes)
+    return Fit(best, covariance / variance)
+
+
+def _measure(day: Day, part: str, input_file: Path, repeat: int, connection):
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), solution_module(day) as module:
+            result = run_part(module, part, input_file, False, 0, repeat, False, None)
+    except Exception as e:
+        result = PartResult(part, error=f"{type(e).__name__}: {e}")
+    connection.send(result)
+
+
+def _run_isolated(day: Day, part: str, input_file: Path, repeat: int, timeout: float) -> PartResult:
+    """Runs the part in a process of its own, which is killed once it runs out of time."""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(target=_measure, args=(day, part, input_file, repeat, sender), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout * repeat):
+            return PartResult(part, error=f"timed out after {timeout * repeat:g}s")
+        return receiver.recv()
+    except EOFError:
+        return PartResult(part, error=f"worker died with exit code {process.exitcode}")
+    finally:
+        process.kill()
+        process.join()
+
+
+def sweep_day(
+    day: Day, scales: Iterable[int], seed: int = 0, timeout: float = 60.0, repeat: int = 1
+) -> list[PartSweep]:
+    """
+    Runs both parts of the day on generated inputs of growing scales. Each measurement happens in a fresh process,
+    so nothing is warmed up by the previous scales, and a part stops growing as soon as it fails or times out.
+
+    :param day: day to sweep, it needs a generator
+    :param scales: sizes of the inputs relative to the real one, e.g. (1, 10, 100)
+    :param seed: which of the generated inputs to use
+    :param timeout: seconds each run of a part may take
+    :param repeat: number of measured runs at each scale; the reported time is their median
+    :return: measurements of both parts
+    """
+    sweeps = [PartSweep(day, part) for part in PARTS]
+    for scale in sorted(scales):
+        running = [sweep for sweep in sweeps if not sweep.points or sweep.points[-1].error is None]
+        if not running:
+            break
+
+        input_file = generated_input(day, scale, seed)
+        for sweep in running:
+            result = _run_isolated(day, sweep.part, input_file, repeat, timeout)
+            point = SweepPoint(scale, input_file.stat().st_size, error=result.error)
+            if result.error is None:
+                point.seconds = result.seconds
+            sweep.points.append(point)
+    return sweeps
+
+
+def sweep_days(
+    days: Iterable[Day], scales: Iterable[int], seed: int = 0, timeout: float = 60.0, repeat: int = 1
+) -> Iterator[PartSweep]:
+    """Sweeps the days one after another (the ones without a generator are skipped), see `sweep_day`."""
+    scales = list(scales)
+    for day in days:
+        if day in GENERATORS:
+            yield from sweep_day(day, scales, seed, timeout, repeat)
+
+
+def sweeps_to_json(sweeps: list[PartSweep], scales: list[int], seed: int, repeat: int) -> dict:
+    parts = {}
+    for sweep in sweeps:
+        fit = sweep.fit
+        parts[sweep.key] = {
+            "points": [point.to_dict() for point in sweep.points],
+            "model": fit.model if fit else None,
+            "exponent": fit.exponent if fit else None,
+        }
+
+    return {
+        "commit": current_commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "scales": scales,
+        "seed": seed,
+        "repeat": repeat,
+        "parts": parts,
+    }
+
+
+def default_output_path(sweep: dict) -> Path:
+    name = sweep["commit"] or sweep["created"].replace(":", "-")
+    return BENCHMARK_DIR / f"sweep-{name}.json"
+
+
+def format_table(sweeps: list[PartSweep], scales: list[int]) -> str:
+    scales = sorted(scales)
+    rows = [("PART", *(f"x{scale} [s]" for scale in scales), "FIT")]
+    errors = []
+    for sweep in sweeps:
+        cells = {}
+        for point in sweep.points:
+            cells[point.scale] = f"{point.seconds:.6f}" if point.error is None else "ERROR"
+            if point.error:
+                errors.append(f"{sweep.key} x{point.scale}: {point.error}")
+        fit = sweep.fit
+        rows.append((sweep.key, *(cells.get(scale, "-") for scale in scales), str(fit) if fit else "-"))
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+    if errors:
+        lines += ["", "Parts that stopped growing:", *(f"  {error}" for error in errors)]
+    return "\n".join(lines)
@@ -0,0 +1,60 @@
+"""Timing helpers shared by the solutions and the runner."""
+
+import math
+import statistics
+import timeit
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable
+
+
+def timed(f: Callable) -> Callable:
+    """Decorator to time the execution of a function."""
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        start_time = timeit.default_timer()
+        result = f(*args, **kwargs)
+        end_time = timeit.default_timer()
+        print(f"Function {f.__name__} took {end_time - start_time:.6f} seconds")
+        return result
+
+    return wrapper
+
+
+@dataclass
+class Statistics:
+    """Summary of the repeated measurements (in seconds) of a single part."""
+
+    samples: list[float]
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.samples)
+
+    @property
+    def p95(self) -> float:
+        ordered = sorted(self.samples)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def to_dict(self) -> dict[str, float | list[float]]:
+        return {
+            "min": self.min,
+            "median": self.median,
+            "mean": self.mean,
+            "p95": self.p95,
+            "stddev": self.stddev,
+            "samples": self.samples,
+        }
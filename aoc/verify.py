@@ -0,0 +1,164 @@
+"""
+Checking the answers of the solutions against a manifest of known-good ones (`answers.json` at the repository root),
+so a rewrite for speed can be validated across the whole repository in one run.
+
+The manifest holds the answers of each day's parts, for its test and for its full input:
+
+    {"2022/14": {"test": {"part_one": "24", "part_two": "93"}, "full": {"part_one": "...", "part_two": "..."}}}
+
+The answers are compared as the runner reports them, i.e. as strings.
+"""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+from aoc.budgets import BudgetManifest
+from aoc.day import PARTS, ROOT, Day
+from aoc.runner import DayResult, run_days
+
+ANSWERS_FILE = ROOT / "answers.json"
+
+OK = "OK"
+MISMATCH = "MISMATCH"
+FAILED = "FAILED"
+UNRECORDED = "UNRECORDED"
+
+
+def _input_name(test: bool) -> str:
+    return "test" if test else "full"
+
+
+def _shown(answer: str | None) -> str:
+    # the answers drawn as ASCII art span several lines
+    return str(answer).replace("\n", "\\n")
+
+
+class AnswerManifest:
+    def __init__(self, entries: dict[str, dict[str, dict[str, str]]] | None = None):
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path: str | Path = ANSWERS_FILE) -> "AnswerManifest":
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        return cls(json.loads(path.read_text()))
+
+    def save(self, path: str | Path = ANSWERS_FILE) -> Path:
+        path = Path(path)
+        ordered = {day: self.entries[day] for day in sorted(self.entries, key=Day.from_name)}
+        path.write_text(json.dumps(ordered, indent=2) + "\n")
+        return path
+
+    def expected(self, day: Day, part: str, test: bool) -> str | None:
+        return self.entries.get(day.name, {}).get(_input_name(test), {}).get(part)
+
+    def record(self, day: Day, part: str, test: bool, answer: str):
+        self.entries.setdefault(day.name, {}).setdefault(_input_name(test), {})[part] = answer
+
+
+@dataclass
+class Check:
+    day: Day
+    part: str
+    test: bool
+    expected: str | None
+    actual: str | None
+    # why the part didn't produce an answer
+    error: str | None = None
+
+    @property
+    def status(self) -> str:
+        if self.error is not None:
+            return FAILED
+        if self.expected is None:
+            return UNRECORDED
+        return OK if self.actual == self.expected else MISMATCH
+
+    def __str__(self):
+        where = f"{self.day.name}/{self.part} ({_input_name(self.test)} input)"
+        status = self.status
+        if status == MISMATCH:
+            return f"{status} {where}: expected {_shown(self.expected)}, got {_shown(self.actual)}"
+        if status == FAILED:
+            return f"{status} {where}: {self.error}"
+        if status == UNRECORDED:
+            return f"{status} {where}: got {_shown(self.actual)}"
+        return f"{status} {where}"
+
+
+def _checks(result: DayResult, test: bool, manifest: AnswerManifest) -> list[Check]:
+    if result.error:
+        return [
+            Check(result.day, part, test, manifest.expected(result.day, part, test), None, result.error)
+            for part in PARTS
+        ]
+    return [
+        Check(
+            result.day,
+            part.part,
+            test,
+            manifest.expected(result.day, part.part, test),
+            part.answer,
+            f"{part.exceeded or 'ERROR'}: {part.error}" if part.error else None,
+        )
+        for part in result.parts
+    ]
+
+
+def verify_days(
+    days: Iterable[Day],
+    manifest: AnswerManifest,
+    inputs: Iterable[bool] = (True, False),
+    workers: int | None = None,
+    budgets: BudgetManifest | None = None,
+) -> list[Check]:
+    """
+    Runs the days in parallel on each of the inputs and checks their answers against the manifest. The days missing
+    an input are skipped on it, and the answers are always computed (the answer cache is only as good as the code
+    that filled it).
+
+    :param days: days to check
+    :param manifest: the known-good answers
+    :param inputs: which inputs to check, True for the test ones and False for the full ones
+    :param workers: see `run_days`
+    :param budgets: see `run_days`, so a day that stopped terminating fails instead of blocking the check
+    :return: a check of every part that ran
+    """
+    days = list(days)
+    checks = []
+    for test in inputs:
+        with_input = [day for day in days if day.input_file(test).exists()]
+        for result in run_days(with_input, test=test, workers=workers, budgets=budgets):
+            checks.extend(_checks(result, test, manifest))
+    return checks
+
+
+def record_answers(checks: list[Check], manifest: AnswerManifest) -> list[Check]:
+    """
+    Stores the answers of the checked parts in the manifest as the known-good ones; the parts that failed are left
+    out, and so are the ones answering None (the unfinished solutions).
+
+    :return: the checks whose answer was new or changed
+    """
+    recorded = []
+    for check in checks:
+        if check.status in (MISMATCH, UNRECORDED) and check.actual != "None":
+            manifest.record(check.day, check.part, check.test, check.actual)
+            recorded.append(check)
+    return recorded
+
+
+def format_checks(checks: list[Check], verbose: bool = False) -> str:
+    """The checks that didn't pass (or all of them if verbose), followed by a summary."""
+    lines = [str(check) for check in checks if verbose or check.status != OK]
+    counts = {status: sum(check.status == status for check in checks) for status in (OK, MISMATCH, FAILED, UNRECORDED)}
+    if lines:
+        lines.append("")
+    lines.append(
+        f"Checked {len(checks)} answers: {counts[OK]} correct, {counts[MISMATCH]} wrong, {counts[FAILED]} failed, "
+        f"{counts[UNRECORDED]} without a known-good answer."
+    )
+    return "\n".join(lines)
@@ -0,0 +1,80 @@
+"""This is a thin client for the solution daemon (`aoc.daemon`), which keeps the solutions warm between runs."""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+from aoc.daemon import SOCKET_PATH, send, serve
+from aoc.day import PARTS
+
+parser = argparse.ArgumentParser(
+    description="Run parts of the solutions in a warm daemon, which only re-imports the days that changed.",
+    epilog="Only a day's own files are watched: after editing the shared aoc/*.py modules, restart the daemon "
+    "(--stop, then --serve) to pick them up.",
+)
+parser.add_argument(
+    "parts",
+    nargs="*",
+    help='days or single parts to run, e.g. "2023/19", "2023/19/1" or "2023/19/part_two"',
+)
+parser.add_argument("-t", "--test", action="store_true", help="use test inputs")
+parser.add_argument("--warmup", type=int, default=0, help="untimed runs of each part (default: 0)")
+parser.add_argument("--repeat", type=int, default=1, help="timed runs of each part, the median is shown (default: 1)")
+parser.add_argument("--socket", type=Path, default=SOCKET_PATH, help=f"socket to use (default: {SOCKET_PATH})")
+parser.add_argument("--serve", action="store_true", help="start the daemon in the foreground")
+parser.add_argument("--stop", action="store_true", help="stop a running daemon")
+
+
+def parse_selector(selector: str) -> tuple[str, list[str]]:
+    year, day, *part = selector.strip("/").split("/")
+    if not part:
+        return f"{year}/{day}", list(PARTS)
+    if part[0].isdigit():
+        if not 1 <= int(part[0]) <= len(PARTS):
+            parser.error(f"{selector}: there are only parts 1 to {len(PARTS)}")
+        return f"{year}/{day}", [PARTS[int(part[0]) - 1]]
+    if part[0] not in PARTS:
+        parser.error(f"{selector}: unknown part {part[0]}, use one of {', '.join(PARTS)}")
+    return f"{year}/{day}", [part[0]]
+
+
+def run_parts(args: argparse.Namespace) -> int:
+    exit_code = 0
+    for selector in args.parts:
+        day, parts = parse_selector(selector)
+        start_time = timeit.default_timer()
+        response = send(
+            {"day": day, "parts": parts, "test": args.test, "warmup": args.warmup, "repeat": args.repeat}, args.socket
+        )
+        round_trip = timeit.default_timer() - start_time
+
+        if "error" in response:
+            print(f"{day}: ERROR: {response['error']}")
+            exit_code = 1
+            continue
+
+        print(f"{day} ({'reloaded' if response['reloaded'] else 'warm'}, {round_trip:.6f}s round trip)")
+        for part in response["parts"]:
+            if part["error"]:
+                print(f"  {part['part']}: ERROR: {part['error']}")
+                exit_code = 1
+            else:
+                print(f"  {part['part']}: {part['answer']} ({part['seconds']:.6f}s)")
+    return exit_code
+
+
+if __name__ == "__main__":
+    cli_args = parser.parse_args()
+    if cli_args.serve:
+        serve(cli_args.socket)
+        sys.exit()
+
+    try:
+        if cli_args.stop:
+            send({"command": "stop"}, cli_args.socket)
+            sys.exit()
+        sys.exit(run_parts(cli_args))
+    except ConnectionError as e:
+        print(f"Can't reach the daemon: {e}. Start it with `python daemon.py --serve`.")
+        sys.exit(1)
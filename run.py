@@ -0,0 +1,317 @@
+"""This is a script for running all (or some) of the Python solutions in this repository at once."""
+
+import argparse
+import sys
+import timeit
+
+from aoc import batch, benchmark, discover_days, report, sweep, verify
+from aoc.budgets import BUDGETS_FILE, BudgetManifest
+from aoc.cache import AnswerCache
+from aoc.profiling import profile_day, sample_day
+from aoc.runner import format_counts, format_table, run_days
+
+
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be at least 0, got {number}")
+    return number
+
+
+parser = argparse.ArgumentParser(
+    description="Discover and run the Python solutions of this repository in parallel, then print a timing table."
+)
+parser.add_argument(
+    "days",
+    nargs="*",
+    help='years or days to run, e.g. "2022" or "2022/9" (runs everything by default)',
+)
+parser.add_argument("-t", "--test", action="store_true", help="use test inputs")
+parser.add_argument(
+    "-j",
+    "--jobs",
+    type=int,
+    default=None,
+    help="number of worker processes (default: CPU count, or 1 when benchmarking to keep the measurements quiet)",
+)
+parser.add_argument("--slowest", type=int, default=5, help="how many of the slowest days to list")
+parser.add_argument(
+    "-p",
+    "--profile",
+    action="store_true",
+    help="profile each part with cProfile, writing .pstats and collapsed stacks to profiles/",
+)
+parser.add_argument(
+    "-s",
+    "--sample",
+    action="store_true",
+    help="profile each part with the sampling profiler instead, which barely slows it down and reports the busiest "
+    "lines every few seconds; writes collapsed stacks to profiles/",
+)
+
+parser.add_argument(
+    "-m",
+    "--memory",
+    action="store_true",
+    help="also measure the peak memory and the top allocation sites of each part with tracemalloc",
+)
+parser.add_argument(
+    "--stats",
+    action="store_true",
+    help="list the work counters and histograms the solutions record (see aoc/counters.py), benchmarks store them too",
+)
+parser.add_argument(
+    "--concurrent-parts",
+    action="store_true",
+    help="run the two parts of each day side by side, each in a process of its own",
+)
+parser.add_argument(
+    "--no-input-cache",
+    dest="input_cache",
+    action="store_false",
+    help="parse every input from scratch instead of loading it from the parsed-input cache in .cache/",
+)
+parser.add_argument(
+    "-f",
+    "--force",
+    action="store_true",
+    help="recompute the answers of every day, even of those that didn't change since they were last solved",
+)
+parser.add_argument(
+    "--budgets",
+    type=str,
+    default=str(BUDGETS_FILE),
+    help="manifest of the time and memory budgets of the days and parts (default: budgets.json), see aoc/budgets.py",
+)
+parser.add_argument(
+    "--no-budgets",
+    action="store_true",
+    help="don't enforce any budgets, so nothing is reported as TIMEOUT or OOM",
+)
+parser.add_argument(
+    "--batch",
+    nargs="+",
+    metavar="INPUT",
+    help="solve a single day for each of the input files (or directories of them) in one process, or in -j of them, "
+    "writing the results and the throughput as JSON lines",
+)
+parser.add_argument(
+    "--verify",
+    action="store_true",
+    help="check the answers on the test and full inputs (or only the test ones with -t) against answers.json",
+)
+parser.add_argument(
+    "--record-answers",
+    action="store_true",
+    help="with --verify, store the new and changed answers in answers.json as the known-good ones",
+)
+parser.add_argument(
+    "--stale", action="store_true", help="list the cached answers that are out of date, then exit without running"
+)
+
+benchmark_group = parser.add_argument_group("benchmarking")
+benchmark_group.add_argument(
+    "-b", "--benchmark", action="store_true", help="measure every part repeatedly and store the statistics as JSON"
+)
+benchmark_group.add_argument("--warmup", type=non_negative_int, default=1, help="untimed runs of each part (default: 1)")
+benchmark_group.add_argument("--repeat", type=positive_int, default=10, help="timed runs of each part (default: 10)")
+benchmark_group.add_argument(
+    "-o",
+    "--output",
+    type=str,
+    default=None,
+    help="where to write the JSON (default: benchmarks/<commit>.json), or the report",
+)
+benchmark_group.add_argument(
+    "--sweep",
+    action="store_true",
+    help="run the parts on generated inputs of growing sizes (see --scales) and fit their empirical complexity",
+)
+benchmark_group.add_argument(
+    "--scales",
+    type=lambda value: [int(scale) for scale in value.split(",")],
+    default=[1, 10, 100],
+    help="comma-separated sizes of the generated inputs relative to the real ones (default: 1,10,100)",
+)
+benchmark_group.add_argument("--seed", type=int, default=0, help="seed of the generated inputs (default: 0)")
+benchmark_group.add_argument(
+    "--sweep-timeout",
+    type=float,
+    default=60.0,
+    help="seconds a run of a part may take before it stops growing (default: 60)",
+)
+benchmark_group.add_argument(
+    "--report",
+    action="store_true",
+    help="write an HTML report of the trends in the stored benchmarks (default: benchmarks/report.html), then exit",
+)
+benchmark_group.add_argument("--baseline", type=str, default=None, help="benchmark JSON to compare the results with")
+benchmark_group.add_argument(
+    "--threshold",
+    type=float,
+    default=0.1,
+    help="relative growth of a part's median time (or peak memory) that counts as a regression (default: 0.1)",
+)
+
+
+def load_budgets(args: argparse.Namespace) -> BudgetManifest | None:
+    return None if args.no_budgets else BudgetManifest.load(args.budgets)
+
+
+def over_budget(results: list) -> int:
+    """Exit code of a run: parts out of their budgets fail it, so the budgets are targets that hold."""
+    return int(any(part.exceeded for day_result in results for part in day_result.stages))
+
+
+def run_benchmark(args: argparse.Namespace) -> int:
+    selected_days = discover_days(args.days)
+    results = list(
+        run_days(
+            selected_days,
+            test=args.test,
+            workers=args.jobs or 1,
+            warmup=args.warmup,
+            repeat=args.repeat,
+            memory=args.memory,
+            input_cache=args.input_cache,
+            stats=args.stats,
+            budgets=load_budgets(args),
+        )
+    )
+    print(benchmark.format_table(results))
+    if args.stats:
+        print(f"\n{format_counts(results)}")
+
+    current = benchmark.results_to_json(results, args.test, args.warmup, args.repeat)
+    output = benchmark.save(current, args.output or benchmark.default_output_path(current))
+    print(f"\nResults written to {output}.")
+
+    if not args.baseline:
+        return over_budget(results)
+
+    regressions = benchmark.compare(current, benchmark.load(args.baseline), args.threshold)
+    if not regressions:
+        print(f"No part regressed by more than {args.threshold:.0%} against {args.baseline}.")
+        return over_budget(results)
+
+    print(f"{len(regressions)} part(s) regressed by more than {args.threshold:.0%} against {args.baseline}:")
+    for regression in regressions:
+        print(f"  {regression}")
+    return 1
+
+
+def run_sweep(args: argparse.Namespace) -> int:
+    sweeps = []
+    for part_sweep in sweep.sweep_days(discover_days(args.days), args.scales, args.seed, args.sweep_timeout, args.repeat):
+        # the whole sweep takes a while, so the fits are reported as they come
+        print(f"{part_sweep.key}: {part_sweep.fit or 'not enough measurements to fit'}", file=sys.stderr)
+        sweeps.append(part_sweep)
+    print(sweep.format_table(sweeps, args.scales))
+
+    current = sweep.sweeps_to_json(sweeps, args.scales, args.seed, args.repeat)
+    output = benchmark.save(current, args.output or sweep.default_output_path(current))
+    print(f"\nResults written to {output}.")
+    return 0
+
+
+def run_report(args: argparse.Namespace) -> int:
+    output = report.write_report(args.output or report.REPORT_FILE, test=args.test, threshold=args.threshold)
+    print(f"Report of the {'test' if args.test else 'full'} input benchmarks written to {output}.")
+    return 0
+
+
+def run_profile(args: argparse.Namespace) -> int:
+    for day in discover_days(args.days):
+        print(f"===== {day} =====")
+        if not day.input_file(args.test).exists():
+            print(f"Skipping, {day.input_file(args.test).name} is missing.")
+            continue
+        profile = sample_day if args.sample else profile_day
+        for part_profile in profile(day, test=args.test, input_cache=args.input_cache):
+            print(part_profile)
+    return 0
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    days = discover_days(args.days)
+    if len(days) != 1:
+        parser.error(f"--batch solves a single day, {len(days)} were selected")
+    summary = batch.write_batch(days[0], args.batch, sys.stdout, test=args.test, workers=args.jobs or 1)
+    return int(summary["failed"] > 0)
+
+
+def run_verify(args: argparse.Namespace) -> int:
+    manifest = verify.AnswerManifest.load()
+    checks = verify.verify_days(
+        discover_days(args.days),
+        manifest,
+        inputs=(True,) if args.test else (True, False),
+        workers=args.jobs,
+        budgets=load_budgets(args),
+    )
+    print(verify.format_checks(checks))
+    if args.record_answers:
+        recorded = verify.record_answers(checks, manifest)
+        print(f"Recorded {len(recorded)} new or changed answers in {manifest.save()}.")
+        return 0
+    return int(any(check.status in (verify.MISMATCH, verify.FAILED) for check in checks))
+
+
+def run_stale(_args: argparse.Namespace) -> int:
+    stale = AnswerCache().stale()
+    if not stale:
+        print("All cached answers are up to date.")
+    for entry in stale:
+        print(entry)
+    return 0
+
+
+def run(args: argparse.Namespace) -> int:
+    selected_days = discover_days(args.days)
+
+    start_time = timeit.default_timer()
+    results = list(
+        run_days(
+            selected_days,
+            test=args.test,
+            workers=args.jobs,
+            memory=args.memory,
+            input_cache=args.input_cache,
+            stats=args.stats,
+            concurrent_parts=args.concurrent_parts,
+            # the cached entries have no memory measurements nor counters, and their times are of serial runs
+            answer_cache=AnswerCache(),
+            force=args.force or args.memory or args.stats or args.concurrent_parts,
+            budgets=load_budgets(args),
+        )
+    )
+    wall_clock = timeit.default_timer() - start_time
+
+    print(format_table(results, wall_clock, slowest=args.slowest))
+    if args.stats:
+        print(f"\n{format_counts(results)}")
+    return over_budget(results)
+
+
+if __name__ == "__main__":
+    cli_args = parser.parse_args()
+    if cli_args.stale:
+        sys.exit(run_stale(cli_args))
+    if cli_args.verify:
+        sys.exit(run_verify(cli_args))
+    if cli_args.batch:
+        sys.exit(run_batch(cli_args))
+    if cli_args.profile or cli_args.sample:
+        sys.exit(run_profile(cli_args))
+    if cli_args.report:
+        sys.exit(run_report(cli_args))
+    if cli_args.sweep:
+        sys.exit(run_sweep(cli_args))
+    sys.exit(run_benchmark(cli_args) if cli_args.benchmark else run(cli_args))